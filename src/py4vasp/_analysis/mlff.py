@@ -1,12 +1,14 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import math
+from collections import defaultdict
 from types import SimpleNamespace
 from typing import Dict
 
 import numpy as np
 
 import py4vasp
-from py4vasp import exception
+from py4vasp import exception, raw
 
 
 class MLFFErrorAnalysis:
@@ -43,6 +45,15 @@ class MLFFErrorAnalysis:
     >>> stress_error = mlff_error_analysis.get_stress_rmse(
     ...     normalize_by_configurations=True
     ... )
+
+    For validation sets that do not fit into memory, process the configurations
+    in chunks. Only the errors are kept, not the forces and stresses.
+
+    >>> mlff_error_analysis = MLFFErrorAnalysis.from_paths(
+    ...     dft_data="path/to/dft/data",
+    ...     mlff_data="path/to/mlff/data",
+    ...     chunk_size=1000,
+    ... )
     """
 
     TOTAL_ENERGY = "TOTEN"
@@ -50,6 +61,7 @@ class MLFFErrorAnalysis:
     def __init__(self, *args, **kwargs):
         self.mlff = SimpleNamespace()
         self.dft = SimpleNamespace()
+        self._errors = None
 
     @classmethod
     def _from_data(cls, batch):
@@ -59,7 +71,9 @@ class MLFFErrorAnalysis:
         return mlff_error_analysis
 
     @classmethod
-    def from_paths(cls, dft_data, mlff_data):
+    def from_paths(
+        cls, dft_data, mlff_data, workers=None, executor="thread", chunk_size=None
+    ):
         """Create an instance of MLFFErrorAnalysis from paths to the data.
 
         Starting from paths for DFT and MLFF data, this method creates an
@@ -72,15 +86,32 @@ class MLFFErrorAnalysis:
             Path to the DFT data. Accepts wildcards.
         mlff_data : str or pathlib.Path
             Path to the MLFF data. Accepts wildcards.
+        workers : int, optional
+            If set, the calculations are read in parallel using at most this many
+            workers.
+        executor : str
+            Either "thread" or "process" to select whether the workers are threads or
+            processes.
+        chunk_size : int, optional
+            If set, the configurations are processed in chunks of this size and
+            only the errors are stored. Then the forces, positions, lattice
+            vectors, and stresses are not available as attributes.
         """
         mlff_error_analysis = cls(_internal=True)
-        batch = py4vasp.Batch.from_paths(dft_data=dft_data, mlff_data=mlff_data)
+        batch = py4vasp.Batch.from_paths(
+            dft_data=dft_data, mlff_data=mlff_data, workers=workers, executor=executor
+        )
         mlff_error_analysis._batch = batch
-        set_appropriate_attrs(mlff_error_analysis)
+        if chunk_size is None:
+            set_appropriate_attrs(mlff_error_analysis)
+        else:
+            set_streaming_attrs(mlff_error_analysis, chunk_size)
         return mlff_error_analysis
 
     @classmethod
-    def from_files(cls, dft_data, mlff_data):
+    def from_files(
+        cls, dft_data, mlff_data, workers=None, executor="thread", chunk_size=None
+    ):
         """Create an instance of MLFFErrorAnalysis from files.
 
         Starting from files for DFT and MLFF data, this method creates an
@@ -93,11 +124,26 @@ class MLFFErrorAnalysis:
             Path to the DFT data. Accepts wildcards.
         mlff_data : str or pathlib.Path
             Path to the MLFF data. Accepts wildcards.
+        workers : int, optional
+            If set, the calculations are read in parallel using at most this many
+            workers.
+        executor : str
+            Either "thread" or "process" to select whether the workers are threads or
+            processes.
+        chunk_size : int, optional
+            If set, the configurations are processed in chunks of this size and
+            only the errors are stored. Then the forces, positions, lattice
+            vectors, and stresses are not available as attributes.
         """
         mlff_error_analysis = cls(_internal=True)
-        batch = py4vasp.Batch.from_files(dft_data=dft_data, mlff_data=mlff_data)
+        batch = py4vasp.Batch.from_files(
+            dft_data=dft_data, mlff_data=mlff_data, workers=workers, executor=executor
+        )
         mlff_error_analysis._batch = batch
-        set_appropriate_attrs(mlff_error_analysis)
+        if chunk_size is None:
+            set_appropriate_attrs(mlff_error_analysis)
+        else:
+            set_streaming_attrs(mlff_error_analysis, chunk_size)
         return mlff_error_analysis
 
     def get_energy_error_per_atom(self, normalize_by_configurations=False):
@@ -117,7 +163,10 @@ class MLFFErrorAnalysis:
             If set to ``True``, the error is averaged over the number of
             configurations. Defaults to ``False``.
         """
-        error = (self.mlff.energies - self.dft.energies) / self.dft.nions
+        if self._errors is not None:
+            error = self._errors.energy
+        else:
+            error = (self.mlff.energies - self.dft.energies) / self.dft.nions
         if normalize_by_configurations:
             error = np.sum(np.abs(error), axis=-1) / self.dft.nconfig
         return error
@@ -144,8 +193,11 @@ class MLFFErrorAnalysis:
             If set to ``True``, the error is averaged over the number of
             configurations. Defaults to ``False``.
         """
-        deg_freedom = 3 * self.dft.nions
-        error = self._get_rmse(self.dft.forces, self.mlff.forces, deg_freedom)
+        if self._errors is not None:
+            error = self._errors.force
+        else:
+            deg_freedom = 3 * self.dft.nions
+            error = self._get_rmse(self.dft.forces, self.mlff.forces, deg_freedom)
         if normalize_by_configurations:
             error = np.sum(error, axis=-1) / self.dft.nconfig
         return error
@@ -161,25 +213,148 @@ class MLFFErrorAnalysis:
         ``normalize_by_configurations`` is set to ``True``, the error is
         averaged over the number of configurations.
         """
-        deg_freedom = 6
-        dft_stresses = np.triu(self.dft.stresses)
-        mlff_stresses = np.triu(self.mlff.stresses)
-        error = self._get_rmse(dft_stresses, mlff_stresses, deg_freedom)
+        if self._errors is not None:
+            error = self._errors.stress
+        else:
+            deg_freedom = 6
+            dft_stresses = np.triu(self.dft.stresses)
+            mlff_stresses = np.triu(self.mlff.stresses)
+            error = self._get_rmse(dft_stresses, mlff_stresses, deg_freedom)
         if normalize_by_configurations:
             error = np.sum(error, axis=-1) / self.dft.nconfig
         return error
 
+    def get_force_rmse_per_element(self):
+        """Get the root mean square error in forces resolved by element.
+
+        This method calculates the root mean square error in forces between the
+        MLFF and DFT calculations separately for every element. The error is
+        accumulated over all ions of that element in all configurations.
+
+        Returns
+        -------
+        dict[str, float]
+            The root mean square error in forces for every element.
+        """
+        if self._errors is not None:
+            squared_errors = self._errors.squared_force_per_element
+        else:
+            squared_errors = self._squared_force_errors_per_element()
+        return {
+            element: math.sqrt(squared_error / (3 * count))
+            for element, (squared_error, count) in squared_errors.items()
+        }
+
+    def _squared_force_errors_per_element(self):
+        squared_error = np.sum((self.dft.forces - self.mlff.forces) ** 2, axis=-1)
+        result = {}
+        for element in np.unique(self.dft.elements):
+            mask = self.dft.elements == element
+            count = int(np.count_nonzero(mask))
+            result[str(element)] = (math.fsum(squared_error[mask]), count)
+        return result
+
 
 def set_appropriate_attrs(cls):
     set_paths_and_files(cls)
-    set_number_of_ions(cls)
+    data = read_batch(cls._batch)
+    set_number_of_ions(cls, data.forces)
     set_number_of_configurations(cls)
-    set_energies(cls)
-    set_force_related_attributes(cls)
-    set_stresses(cls)
+    set_energies(cls, data.energies)
+    set_force_related_attributes(cls, data.forces)
+    set_stresses(cls, data.stresses)
     validate_data(cls)
 
 
+def set_streaming_attrs(cls, chunk_size):
+    """Set the errors of the data processing the configurations in chunks.
+
+    This method reads the configurations in chunks and computes the errors
+    of every chunk. Only the errors, energies, and number of ions are kept,
+    so the memory required is bounded by the size of the chunks. The errors
+    per element are accumulated with compensated summation.
+
+    Parameters
+    ----------
+    cls : MLFFErrorAnalysis
+        An instance of MLFFErrorAnalysis.
+    chunk_size : int
+        Number of configurations read at once.
+    """
+    set_paths_and_files(cls)
+    set_number_of_configurations(cls)
+    kept = defaultdict(list)
+    errors = defaultdict(list)
+    squared_errors = defaultdict(list)
+    counts = defaultdict(int)
+    for batch in cls._batch.chunks(chunk_size):
+        chunk = MLFFErrorAnalysis._from_data(batch)
+        for datatype in ("dft", "mlff"):
+            for attribute in ("energies", "nions"):
+                value = getattr(getattr(chunk, datatype), attribute)
+                kept[datatype, attribute].append(value)
+        errors["energy"].append(chunk.get_energy_error_per_atom())
+        errors["force"].append(chunk.get_force_rmse())
+        errors["stress"].append(chunk.get_stress_rmse())
+        for element, (
+            squared_error,
+            count,
+        ) in chunk._squared_force_errors_per_element().items():
+            squared_errors[element].append(squared_error)
+            counts[element] += count
+    for (datatype, attribute), values in kept.items():
+        setattr(getattr(cls, datatype), attribute, np.concatenate(values))
+    cls._errors = SimpleNamespace(
+        energy=np.concatenate(errors["energy"]),
+        force=np.concatenate(errors["force"]),
+        stress=np.concatenate(errors["stress"]),
+        squared_force_per_element={
+            element: (math.fsum(values), counts[element])
+            for element, values in squared_errors.items()
+        },
+    )
+
+
+def read_batch(batch):
+    """Read all data required for the error analysis in a single pass.
+
+    Every quantity is read exactly once from the batch. The calculations are read in
+    chunks, each within a session of the file pool, so that every file is opened only
+    once even though energies, forces, and stresses are read separately. The chunks
+    are small enough that the files of one chunk do not exceed the limit of open
+    files of the pool.
+
+    Parameters
+    ----------
+    batch : Batch
+        The DFT and MLFF calculations.
+
+    Returns
+    -------
+    SimpleNamespace
+        The energies, forces, and stresses of all calculations.
+    """
+    data = SimpleNamespace(
+        energies=defaultdict(list), forces=defaultdict(list), stresses=defaultdict(list)
+    )
+    for chunk in batch.chunks(_files_per_session(batch)):
+        with raw.file_pool.session():
+            _extend(data.energies, chunk.energies.read(MLFFErrorAnalysis.TOTAL_ENERGY))
+            _extend(data.forces, chunk.forces.read())
+            _extend(data.stresses, chunk.stresses.read())
+    return data
+
+
+def _files_per_session(batch):
+    number_keys = max(len(batch.number_of_calculations()), 1)
+    return max(raw.file_pool.max_open_files // number_keys, 1)
+
+
+def _extend(data, chunk_data):
+    for key, values in chunk_data.items():
+        data[key].extend(values)
+
+
 def validate_data(cls):
     """Validate the data passed to the class.
 
@@ -216,7 +391,7 @@ def set_number_of_configurations(cls):
     cls.mlff.nconfig = number_of_calculations["mlff_data"]
 
 
-def set_number_of_ions(cls):
+def set_number_of_ions(cls, force_data):
     """Set the number of ions in the data.
 
     This method sets the number of ions in the data. It uses the number of
@@ -226,16 +401,21 @@ def set_number_of_ions(cls):
     ----------
     cls : MLFFErrorAnalysis
         An instance of MLFFErrorAnalysis.
+    force_data : dict
+        The forces read from the DFT and MLFF calculations.
     """
-    force_data = cls._batch.forces.read()
     structures_dft = _dict_to_list(force_data["dft_data"], "structure")
     structures_mlff = _dict_to_list(force_data["mlff_data"], "structure")
     elements_dft = _dict_to_array(structures_dft, "elements")
     elements_mlff = _dict_to_array(structures_mlff, "elements")
-    nions_dft = np.array([len(_elements) for _elements in elements_dft])
-    nions_mlff = np.array([len(_elements) for _elements in elements_mlff])
+    nions_dft = np.array([len(_elements) for _elements in elements_dft], dtype=np.int_)
+    nions_mlff = np.array(
+        [len(_elements) for _elements in elements_mlff], dtype=np.int_
+    )
     cls.dft.nions = nions_dft
     cls.mlff.nions = nions_mlff
+    cls.dft.elements = elements_dft
+    cls.mlff.elements = elements_mlff
 
 
 def set_paths_and_files(cls):
@@ -259,44 +439,46 @@ def set_paths_and_files(cls):
         cls.mlff.files = files["mlff_data"]
 
 
-def set_energies(cls):
+def set_energies(cls, energies_data):
     """Set the energies for the data.
 
-    This method sets the energies for the data. It uses the
-    :meth:`Calculations.energies` method to set the energies.
+    This method sets the energies for the data. It uses the data read with
+    the :meth:`Calculations.energies` method to set the energies.
 
     Parameters
     ----------
     cls : MLFFErrorAnalysis
         An instance of MLFFErrorAnalysis.
+    energies_data : dict
+        The energies read from the DFT and MLFF calculations.
     """
     tag = MLFFErrorAnalysis.TOTAL_ENERGY
-    energies_data = cls._batch.energies.read(tag)
     cls.mlff.energies = _dict_to_array(energies_data["mlff_data"], tag)
     cls.dft.energies = _dict_to_array(energies_data["dft_data"], tag)
 
 
 def _dict_to_array(data: Dict, key: str) -> np.ndarray:
-    return np.array([_data[key] for _data in data])
+    return np.ascontiguousarray([_data[key] for _data in data])
 
 
 def _dict_to_list(data: Dict, key: str) -> list:
     return [_data[key] for _data in data]
 
 
-def set_force_related_attributes(cls):
+def set_force_related_attributes(cls, force_data):
     """Set the force related attributes for the data.
 
     This method sets the force related attributes for the data. It uses the
-    :meth:`Calculations.forces` method to set the forces, lattice vectors and
-    positions.
+    data read with the :meth:`Calculations.forces` method to set the forces,
+    lattice vectors and positions.
 
     Parameters
     ----------
     cls : MLFFErrorAnalysis
         An instance of MLFFErrorAnalysis.
+    force_data : dict
+        The forces read from the DFT and MLFF calculations.
     """
-    force_data = cls._batch.forces.read()
     cls.dft.forces = _dict_to_array(force_data["dft_data"], "forces")
     cls.mlff.forces = _dict_to_array(force_data["mlff_data"], "forces")
     dft_structures = _dict_to_list(force_data["dft_data"], "structure")
@@ -307,17 +489,18 @@ def set_force_related_attributes(cls):
     cls.mlff.positions = _dict_to_array(mlff_structures, "positions")
 
 
-def set_stresses(cls):
+def set_stresses(cls, stress_data):
     """Set the stresses for the data.
 
-    This method sets the stresses for the data. It uses the
-    :meth:`Calculations.stresses` method to set the stresses.
+    This method sets the stresses for the data. It uses the data read with
+    the :meth:`Calculations.stresses` method to set the stresses.
 
     Parameters
     ----------
     cls : MLFFErrorAnalysis
         An instance of MLFFErrorAnalysis.
+    stress_data : dict
+        The stresses read from the DFT and MLFF calculations.
     """
-    stress_data = cls._batch.stresses.read()
     cls.dft.stresses = _dict_to_array(stress_data["dft_data"], "stress")
     cls.mlff.stresses = _dict_to_array(stress_data["mlff_data"], "stress")
@@ -2,7 +2,7 @@
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import inspect
 import pathlib
-from typing import Dict, List
+from typing import Dict, Iterator, List
 
 from py4vasp import combine, exception
 from py4vasp._util import convert
@@ -23,6 +23,11 @@ class Batch:
     >>> calcs.forces.read()   # returns a dictionary with the forces of calc1 and calc2
     >>> calcs.stresses.read() # returns a dictionary with the stresses of calc1 and calc2
 
+    For many calculations, you can read them in parallel
+
+    >>> calcs = Batch.from_paths(workers=8, calc1="path_to_calc*")
+    >>> calcs.forces.read()   # reads the forces with up to 8 threads
+
     Notes
     -----
     To create new instances, you should use the classmethod :meth:`from_paths` or
@@ -52,7 +57,7 @@ Please provide a path to a VASP calculation as a string or pathlib.Path."""
             yield key, paths
 
     @classmethod
-    def from_paths(cls, **kwargs):
+    def from_paths(cls, workers=None, executor="thread", **kwargs):
         """Set up a Batch object for paths.
 
         Setup a calculation for paths by passing in a dictionary with the name of the
@@ -63,8 +68,18 @@ Please provide a path to a VASP calculation as a string or pathlib.Path."""
         **kwargs : Dict[str, str or pathlib.Path]
             A dictionary with the name of the calculation as key and the path to the
             calculation as value. Wildcards are allowed.
+        workers : int, optional
+            If set, the calculations are read in parallel using at most this many
+            workers. Consequently, you cannot name a calculation `workers` or
+            `executor`.
+        executor : str
+            Either "thread" or "process" to select whether the workers are threads or
+            processes. Processes avoid contention on the Python interpreter, threads
+            have less overhead to start.
         """
         calculations = cls(_internal=True)
+        calculations._workers = workers
+        calculations._executor = executor
         calculations._paths = {}
         for key, paths in cls._path_finder(**kwargs):
             calculations._paths[key] = paths
@@ -74,7 +89,7 @@ Please provide a path to a VASP calculation as a string or pathlib.Path."""
         return calculations
 
     @classmethod
-    def from_files(cls, **kwargs):
+    def from_files(cls, workers=None, executor="thread", **kwargs):
         """Set up a Batch object from files.
 
         Setup a calculation for files by passing in a dictionary with the name of the
@@ -87,8 +102,18 @@ Please provide a path to a VASP calculation as a string or pathlib.Path."""
         **kwargs : Dict[str, str or pathlib.Path]
             A dictionary with the name of the calculation as key and the files to the
             calculation as value. Wildcards are allowed.
+        workers : int, optional
+            If set, the calculations are read in parallel using at most this many
+            workers. Consequently, you cannot name a calculation `workers` or
+            `executor`.
+        executor : str
+            Either "thread" or "process" to select whether the workers are threads or
+            processes. Processes avoid contention on the Python interpreter, threads
+            have less overhead to start.
         """
         calculations = cls(_internal=True)
+        calculations._workers = workers
+        calculations._executor = executor
         calculations._paths = {}
         calculations._files = {}
         for key, paths in cls._path_finder(**kwargs):
@@ -112,15 +137,54 @@ Please provide a path to a VASP calculation as a string or pathlib.Path."""
         """Return the number of calculations for each calculation."""
         return {key: len(value) for key, value in self._paths.items()}
 
+    def chunks(self, size: int) -> Iterator["Batch"]:
+        """Split the calculations into batches with a limited number of calculations.
+
+        The i-th batch contains the calculations i * size to (i + 1) * size - 1 of
+        every key. Use this to process large numbers of calculations without reading
+        all of them into memory at once.
+
+        Parameters
+        ----------
+        size : int
+            Maximal number of calculations per key in every batch.
+
+        Yields
+        ------
+        Batch
+            A batch with the same keys and parallelization settings as this one.
+        """
+        if size < 1:
+            raise exception.IncorrectUsage(
+                f"The size of the chunks must be positive, but you passed {size}."
+            )
+        number_calculations = max(self.number_of_calculations().values(), default=0)
+        for start in range(0, number_calculations, size):
+            yield self._chunk(slice(start, start + size))
+
+    def _chunk(self, slice_):
+        chunk = type(self)(_internal=True)
+        chunk._workers = self._workers
+        chunk._executor = self._executor
+        chunk._paths = {key: value[slice_] for key, value in self._paths.items()}
+        if not hasattr(self, "_files"):
+            return _add_all_combination_classes(chunk, _add_attribute_from_path)
+        chunk._files = {key: value[slice_] for key, value in self._files.items()}
+        return _add_all_combination_classes(chunk, _add_attribute_from_file)
+
 
 def _add_attribute_from_path(calc, class_):
-    instance = class_.from_paths(calc.paths())
+    instance = class_.from_paths(
+        calc.paths(), workers=calc._workers, executor=calc._executor
+    )
     setattr(calc, convert.quantity_name(class_.__name__), instance)
     return calc
 
 
 def _add_attribute_from_file(calc, class_):
-    instance = class_.from_files(calc.files())
+    instance = class_.from_files(
+        calc.files(), workers=calc._workers, executor=calc._executor
+    )
     setattr(calc, convert.quantity_name(class_.__name__), instance)
     return calc
 
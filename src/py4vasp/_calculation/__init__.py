@@ -1,10 +1,12 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import contextlib
 import copy
+import functools
 import importlib
 import pathlib
 
-from py4vasp import exception
+from py4vasp import exception, raw
 from py4vasp._util import convert
 
 INPUT_FILES = ("INCAR", "KPOINTS", "POSCAR")
@@ -191,6 +193,29 @@ instead of the constructor Calculation()."""
         "Return the path in which the calculation is run."
         return self._path
 
+    @contextlib.contextmanager
+    def session(self):
+        """Keep the VASP output files open while the context is active.
+
+        Usually, py4vasp opens and closes the files for every function you call. If
+        you access many quantities of the same calculation, you can avoid this
+        overhead by running your analysis within a session. All files opened inside
+        the session remain open until the session ends. Files that VASP modifies in
+        the meantime are reopened automatically.
+
+        Examples
+        --------
+
+        Read many quantities from the same calculation without reopening the file
+
+        >>> calculation = Calculation.from_path("path/to/calculation")
+        >>> with calculation.session():
+        ...     energies = calculation.energy[:].read()
+        ...     dos = calculation.dos.read()
+        """
+        with raw.file_pool.session():
+            yield self
+
     # Input files are not in current release
     # @property
     # def INCAR(self):
@@ -229,20 +254,36 @@ def _add_all_refinement_classes(calc):
 
 
 def _make_property(quantity):
-    # Be careful when refactoring this code, if the class_ is in a scope where it gets
-    # changed like in the _add_all_refinement_classes routine, it may overwrite the
-    # previous setting and all properties point to the same quantity.
-    class_name = convert.to_camelcase(quantity)
-    module = importlib.import_module(f"py4vasp._calculation.{quantity}")
-    class_ = getattr(module, class_name)
-
-    def get_quantity(self):
-        if self._file is None:
-            return class_.from_path(self._path)
+    return _QuantityProperty(quantity)
+
+
+class _QuantityProperty(property):
+    # The module of the quantity is imported on the first access of the property and
+    # not when the Calculation class is created, because importing all quantities is
+    # slow and most scripts use only a few of them.
+    def __init__(self, quantity):
+        super().__init__(self._get_quantity)
+        self._quantity = quantity
+
+    @functools.cached_property
+    def _class(self):
+        class_name = convert.to_camelcase(self._quantity)
+        module = importlib.import_module(f"py4vasp._calculation.{self._quantity}")
+        return getattr(module, class_name)
+
+    @property
+    def __doc__(self):
+        return self._class.__doc__
+
+    @__doc__.setter
+    def __doc__(self, doc):
+        pass  # the documentation is always taken from the class of the quantity
+
+    def _get_quantity(self, calculation):
+        if calculation._file is None:
+            return self._class.from_path(calculation._path)
         else:
-            return class_.from_file(self._file)
-
-    return property(get_quantity, doc=class_.__doc__)
+            return self._class.from_file(calculation._file)
 
 
 def _make_group(group_name, quantities):
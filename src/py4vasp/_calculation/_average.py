@@ -0,0 +1,212 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Planar and macroscopic averages of quantities on the FFT grid.
+
+The grid data is stored in the HDF5 file with the third lattice vector as the slowest
+index. The planar average is accumulated over slabs along this direction, so that only
+a bounded number of planes is kept in memory at any time. The macroscopic average
+convolves the planar average with one or two box filters; the convolution is evaluated
+with FFTs using the periodic boundary conditions of the unit cell.
+"""
+import numpy as np
+
+from py4vasp import exception
+from py4vasp._calculation import base
+from py4vasp._third_party import graph
+from py4vasp._util import documentation, slicing
+
+DEFAULT_CHUNK_BYTES = 64 * 1024**2
+WINDOW = """\
+window : float or Sequence[float]
+    Width(s) of the box filter(s) in Å."""
+CHUNK_SIZE = """\
+chunk_size : int
+    Number of grid planes read from the file at once. If not set, the number is chosen
+    such that each read stays below 64 MB."""
+DIRECTION = """\
+direction : str
+    The lattice vector ("a", "b", or "c") along which the average is resolved. The
+    data is averaged over the plane spanned by the other two lattice vectors."""
+
+
+class Mixin:
+    """Add planar and macroscopic averages to the refinement of a grid quantity.
+
+    Classes using this mixin implement `_average_sources(selection)`, which yields
+    the label and a function that reads a slab of the selected quantity, and
+    `_raw_grid_shape()`, which returns the shape of the grid as it is stored in the
+    file. The slab function takes a slice of the slowest dimension and returns the
+    data in the order (c, b, a). Classes with further options to select the data
+    override the public methods and pass their sources to `_planar_average_graph`
+    or `_macroscopic_average_graph`.
+    """
+
+    @base.data_access
+    @documentation.format(direction=DIRECTION, chunk_size=CHUNK_SIZE)
+    def to_planar_average(self, selection=None, *, direction="c", chunk_size=None):
+        """Average the selected quantity over the planes along a lattice vector.
+
+        Parameters
+        ----------
+        selection : str
+            Select which quantity is averaged. The default is the same as for the other
+            methods of this class.
+        {direction}
+        {chunk_size}
+
+        Returns
+        -------
+        Graph
+            The planar average as a function of the distance along the lattice
+            vector in Å.
+        """
+        sources = self._average_sources(selection)
+        return self._planar_average_graph(sources, direction, chunk_size)
+
+    @base.data_access
+    @documentation.format(window=WINDOW, direction=DIRECTION, chunk_size=CHUNK_SIZE)
+    def to_macroscopic_average(
+        self, selection=None, *, window, direction="c", chunk_size=None
+    ):
+        """Compute the macroscopic average of the selected quantity along a lattice vector.
+
+        The macroscopic average is the planar average convolved with a box filter
+        whose width is the period of the oscillations of the quantity, e.g., the
+        interlayer distance. For interfaces of two materials with different periods,
+        pass both widths and the planar average is convolved with two successive box
+        filters.
+
+        Parameters
+        ----------
+        selection : str
+            Select which quantity is averaged. The default is the same as for the other
+            methods of this class.
+        {window}
+        {direction}
+        {chunk_size}
+
+        Returns
+        -------
+        Graph
+            The macroscopic average as a function of the distance along the lattice
+            vector in Å.
+        """
+        sources = self._average_sources(selection)
+        return self._macroscopic_average_graph(sources, window, direction, chunk_size)
+
+    def _planar_average_graph(self, sources, direction, chunk_size):
+        axis, distance = self._average_axis(direction)
+        shape = self._raw_grid_shape()
+        chunk_size = _parse_chunk_size(chunk_size, shape)
+        series = [
+            graph.Series(distance, planar_average(read, shape, axis, chunk_size), label)
+            for label, read in sources
+        ]
+        return self._average_graph(series, direction, "planar average")
+
+    def _macroscopic_average_graph(self, sources, window, direction, chunk_size):
+        axis, distance = self._average_axis(direction)
+        shape = self._raw_grid_shape()
+        chunk_size = _parse_chunk_size(chunk_size, shape)
+        spacing = distance[1] - distance[0] if len(distance) > 1 else 1.0
+        series = []
+        for label, read in sources:
+            average = planar_average(read, shape, axis, chunk_size)
+            average = macroscopic_average(average, np.divide(window, spacing))
+            series.append(graph.Series(distance, average, label))
+        return self._average_graph(series, direction, "macroscopic average")
+
+    def _average_axis(self, direction):
+        if direction not in slicing.INDICES:
+            message = f"The direction '{direction}' is not a lattice vector. Please use 'a', 'b', or 'c'."
+            raise exception.IncorrectUsage(message)
+        index = slicing.INDICES[direction]
+        axis = 2 - index
+        number_points = self._raw_grid_shape()[axis]
+        length = np.linalg.norm(self._structure.lattice_vectors()[index])
+        return axis, np.arange(number_points) * length / number_points
+
+    def _average_graph(self, series, direction, ylabel):
+        return graph.Graph(
+            series=series,
+            xlabel=f"distance along lattice vector {direction} (Å)",
+            ylabel=ylabel,
+        )
+
+
+def planar_average(read_slab, shape, axis, chunk_size):
+    """Average grid data over the planes perpendicular to one axis.
+
+    Parameters
+    ----------
+    read_slab : Callable[[slice], np.ndarray]
+        Returns the 3d data of the planes in the slice along the first axis.
+    shape : tuple[int]
+        Shape of the full 3d grid.
+    axis : int
+        The axis along which the average is resolved.
+    chunk_size : int
+        Number of planes along the first axis read at once.
+
+    Returns
+    -------
+    np.ndarray
+        The average over the other two axes for every grid point along the axis.
+    """
+    other_axes = tuple(other for other in range(3) if other != axis)
+    total = np.zeros(shape[axis])
+    for start in range(0, shape[0], chunk_size):
+        slab = np.asarray(read_slab(slice(start, start + chunk_size)))
+        if axis == 0:
+            total[start : start + len(slab)] = np.sum(slab, axis=other_axes)
+        else:
+            total += np.sum(slab, axis=other_axes)
+    return total * shape[axis] / np.prod(shape)
+
+
+def macroscopic_average(values, widths):
+    """Convolve periodic data successively with box filters of the given widths.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Data on an equidistant periodic grid.
+    widths : float or Sequence[float]
+        Widths of the box filters in units of the grid spacing. Fractional widths
+        give a partial weight to the outermost points of the filter.
+
+    Returns
+    -------
+    np.ndarray
+        The macroscopic average of the data.
+    """
+    length = len(values)
+    transformed = np.fft.rfft(values)
+    for width in np.atleast_1d(widths):
+        _raise_error_if_width_not_positive(width)
+        transformed *= np.fft.rfft(_box_filter(length, width))
+    return np.fft.irfft(transformed, n=length)
+
+
+def _box_filter(length, width):
+    # periodic distance of every grid point to the origin
+    distance = np.minimum(np.arange(length), length - np.arange(length))
+    weights = np.clip(width / 2 - distance + 0.5, 0, 1)
+    return weights / np.sum(weights)
+
+
+def _parse_chunk_size(chunk_size, shape):
+    if chunk_size is None:
+        plane_bytes = shape[1] * shape[2] * np.dtype(np.float64).itemsize
+        return max(1, DEFAULT_CHUNK_BYTES // plane_bytes)
+    if chunk_size < 1:
+        message = f"The chunk size must be a positive integer, but got {chunk_size}."
+        raise exception.IncorrectUsage(message)
+    return chunk_size
+
+
+def _raise_error_if_width_not_positive(width):
+    if width > 0:
+        return
+    message = f"The width of the window must be positive, but got {width}."
+    raise exception.IncorrectUsage(message)
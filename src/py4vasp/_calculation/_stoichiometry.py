@@ -180,6 +180,23 @@ class Stoichiometry(base.Refinery):
         repeated_types = (itertools.repeat(*x) for x in self._type_numbers(ion_types))
         return list(itertools.chain.from_iterable(repeated_types))
 
+    @base.data_access
+    def _element_arrays(self):
+        # same as elements() and names() but as arrays avoiding one string per atom
+        ion_types, number_ion_types = zip(*self._type_numbers(None))
+        elements = np.repeat(ion_types, number_ion_types)
+        _, inverse, counts = np.unique(
+            elements, return_inverse=True, return_counts=True
+        )
+        first_of_element = np.cumsum(counts) - counts
+        order = np.argsort(inverse, kind="stable")
+        numbers = np.empty(len(elements), dtype=np.int_)
+        numbers[order] = np.arange(len(elements)) - np.repeat(first_of_element, counts)
+        names = np.char.add(
+            np.char.add(elements, _subscript), (numbers + 1).astype(str)
+        )
+        return elements, names
+
     @base.data_access
     @documentation.format(ion_types=ion_types_documentation)
     def ion_types(self, ion_types=None):
@@ -0,0 +1,167 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Convert many steps of a trajectory to the file formats of VASP and other codes.
+
+Each format prepares a %-format template for a single step of the given system once.
+The template contains the ion-specific parts as literal text, so filling in a step is a
+single string operation in C independent of the number of ions. The formats operate on
+chunks of steps, i.e., the step indices, the lattice vectors with shape (steps, 3, 3),
+and the positions with shape (steps, ions, 3).
+"""
+import numpy as np
+
+_ROW = "%21.16f %21.16f %21.16f"
+_XDATCAR_ROW = "%12.8f%12.8f%12.8f"
+_CARTESIAN = "%16.8f %16.8f %16.8f"
+
+
+class Poscar:
+    """Format every step as a separate POSCAR string.
+
+    The strings are the same as the POSCAR of the individual steps of the structure.
+    """
+
+    def __init__(self, stoichiometry, ion_types, scale, number_atoms):
+        lines = (
+            f"{_literal(stoichiometry.to_string(ion_types))} (step %d)",
+            f"{scale:21.16f}".lstrip(),
+            _table(_ROW, 3),
+            _literal(stoichiometry.to_POSCAR("", ion_types)),
+            "Direct",
+            _table(_ROW, number_atoms),
+        )
+        self._template = "\n".join(lines)
+
+    def __call__(self, steps, lattice_vectors, positions):
+        values = _join_values(np.add(steps, 1), lattice_vectors, positions)
+        return [self._template % step for step in values]
+
+
+class Xdatcar:
+    """Format the steps as XDATCAR file.
+
+    If the unit cell changes along the trajectory, the header with the lattice vectors
+    is repeated for every step as VASP does for relaxations of the cell.
+    """
+
+    def __init__(self, stoichiometry, ion_types, scale, lattice_vectors):
+        number_atoms = stoichiometry.number_atoms()
+        lines = (
+            _literal(stoichiometry.to_string(ion_types)),
+            f"{scale:21.16f}".lstrip(),
+            _table(_ROW, 3),
+            _literal(stoichiometry.to_POSCAR("", ion_types)),
+            "",
+        )
+        self._header = "\n".join(lines)
+        self._step = f"Direct configuration=%6d\n{_table(_XDATCAR_ROW, number_atoms)}\n"
+        self.variable_cell = np.any(lattice_vectors != lattice_vectors[:1])
+
+    def header(self, lattice_vectors):
+        "Return the header of the file for a fixed unit cell."
+        return self._header % tuple(np.ravel(lattice_vectors))
+
+    def __call__(self, steps, lattice_vectors, positions):
+        if self.variable_cell:
+            template = self._header + self._step
+            values = _join_values(lattice_vectors, np.add(steps, 1), positions)
+        else:
+            template = self._step
+            values = _join_values(np.add(steps, 1), positions)
+        return "".join(template % step for step in values)
+
+
+class ExtendedXyz:
+    "Format the steps in the extended XYZ format with Cartesian positions in Å."
+
+    def __init__(self, elements):
+        properties = 'Properties=species:S:1:pos:R:3 pbc="T T T"'
+        lattice = " ".join(9 * ("%.8f",))
+        header = f'{len(elements)}\nLattice="{lattice}" {properties} step=%d\n'
+        rows = (f"{_literal(element):2s} {_CARTESIAN}\n" for element in elements)
+        self._template = header + "".join(rows)
+
+    def __call__(self, steps, lattice_vectors, positions):
+        cartesian_positions = positions @ lattice_vectors
+        values = _join_values(lattice_vectors, np.add(steps, 1), cartesian_positions)
+        return "".join(self._template % step for step in values)
+
+
+class LammpsDump:
+    """Format the steps as LAMMPS dump file of a triclinic box.
+
+    The lattice vectors are rotated to the standard form of LAMMPS, where the first
+    vector is parallel to the x axis and the second one lies in the xy plane. Besides
+    the index of the ion type, every ion is labeled by its element.
+    """
+
+    def __init__(self, ion_type_numbers, elements):
+        number_atoms = len(ion_type_numbers)
+        header = f"""\
+ITEM: TIMESTEP
+%d
+ITEM: NUMBER OF ATOMS
+{number_atoms}
+ITEM: BOX BOUNDS xy xz yz pp pp pp
+{_table("%.16e %.16e %.16e", 3)}
+ITEM: ATOMS id type element x y z
+"""
+        rows = (
+            f"{index + 1} {type_ + 1} {_literal(element)} {_CARTESIAN}\n"
+            for index, (type_, element) in enumerate(zip(ion_type_numbers, elements))
+        )
+        self._template = header + "".join(rows)
+
+    def __call__(self, steps, lattice_vectors, positions):
+        standard_cell = standard_form(lattice_vectors)
+        values = _join_values(
+            np.add(steps, 1), _box_bounds(standard_cell), positions @ standard_cell
+        )
+        return "".join(self._template % step for step in values)
+
+
+def standard_form(lattice_vectors):
+    """Rotate the lattice vectors such that they form a lower triangular matrix.
+
+    Parameters
+    ----------
+    lattice_vectors : np.ndarray
+        Lattice vectors with shape (..., 3, 3); every row is one lattice vector.
+
+    Returns
+    -------
+    np.ndarray
+        Lower triangular lattice vectors with positive diagonal, which describe the
+        same cell up to a rotation or reflection.
+    """
+    _, upper = np.linalg.qr(np.swapaxes(lattice_vectors, -1, -2))
+    signs = np.sign(np.diagonal(upper, axis1=-2, axis2=-1))
+    return np.swapaxes(upper * signs[..., np.newaxis], -1, -2)
+
+
+def _box_bounds(standard_cell):
+    # LAMMPS stores the bounding box of the triclinic cell and the tilt factors
+    xx, yy, zz = np.moveaxis(np.diagonal(standard_cell, axis1=-2, axis2=-1), -1, 0)
+    xy, xz, yz = standard_cell[:, 1, 0], standard_cell[:, 2, 0], standard_cell[:, 2, 1]
+    zero = np.zeros_like(xy)
+    x_tilts = np.stack((zero, xy, xz, xy + xz))
+    bounds = (
+        (x_tilts.min(axis=0), xx + x_tilts.max(axis=0), xy),
+        (np.minimum(zero, yz), yy + np.maximum(zero, yz), xz),
+        (zero, zz, yz),
+    )
+    return np.moveaxis(np.array(bounds), -1, 0)
+
+
+def _table(row, number_rows):
+    return "\n".join(number_rows * (row,))
+
+
+def _literal(text):
+    return str(text).replace("%", "%%")
+
+
+def _join_values(*arrays):
+    number_steps = len(arrays[0])
+    columns = [np.reshape(array, (number_steps, -1)) for array in arrays]
+    return [tuple(step) for step in np.concatenate(columns, axis=1).tolist()]
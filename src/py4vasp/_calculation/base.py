@@ -16,11 +16,14 @@ def data_access(func):
     via the _raw_data property. The decorator also selects the appropriate source from
     the HDF5 file based on the selection argument. If multiple selections are requested
     these will be handled iteratively and returned as a dictionary. Any remaining
-    selection not matching a source is passed to the inner function."""
+    selection not matching a source is passed to the inner function. If the function
+    is a generator, the data remains accessible until the iteration is finished."""
 
     @functools.wraps(func)
     def func_with_access(self, *args, **kwargs):
         wrapper = _FunctionWrapper(func, self)
+        if inspect.isgeneratorfunction(func):
+            return wrapper.iterate(*args, **kwargs)
         return wrapper.run(*args, **kwargs)
 
     return func_with_access
@@ -126,6 +129,13 @@ class Refinery:
     def _selection(self):
         return self._data_context.selection
 
+    def _access_related(self, quantity):
+        """Access the raw data of another quantity from the same source as this one.
+
+        Use this as a context manager, e.g., to read the forces of the same
+        calculation as the structure."""
+        return self._data_context.access_related(quantity)
+
     @data_access
     def print(self):
         "Print a string representation of this instance."
@@ -184,6 +194,20 @@ class _FunctionWrapper:
         results = self._run_selections(bound_arguments, selections)
         return self._merge_results(results)
 
+    def iterate(self, *args, **kwargs):
+        selection, bound_arguments = self._find_selection_in_arguments(*args, **kwargs)
+        selections = self._parse_selection(selection)
+        if len(selections) > 1:
+            message = f"""Iterating over multiple sources is not implemented. Please
+                select only one of "{'", "'.join(map(str, selections))}"."""
+            raise exception.NotImplemented(message)
+        ((selected, remaining),) = selections.items()
+        self._data_context.set_selection(selected)
+        work = self._set_remaining_selection(bound_arguments, remaining)
+        with self._data_context:
+            check.raise_error_if_not_callable(self._func, *work.args, **work.kwargs)
+            yield from self._func(*work.args, **work.kwargs)
+
     def _find_selection_in_arguments(self, *args, **kwargs):
         signature = inspect.signature(self._func)
         if "selection" in signature.parameters:
@@ -306,6 +330,11 @@ class _DataWrapper(contextlib.AbstractContextManager):
         )
         raise exception.IncorrectUsage(message)
 
+    def access_related(self, quantity):
+        message = f"""Creating {self.quantity}.from_data does not provide access to
+            the {quantity}. Please create it with `from_path` or `from_file` instead."""
+        raise exception.IncorrectUsage(message)
+
 
 class _DataAccess(contextlib.AbstractContextManager):
     def __init__(self, quantity, **kwargs):
@@ -333,3 +362,6 @@ class _DataAccess(contextlib.AbstractContextManager):
     def set_selection(self, selection):
         if self._counter == 0:
             self.selection = selection
+
+    def access_related(self, quantity):
+        return raw.access(quantity, **self._kwargs)
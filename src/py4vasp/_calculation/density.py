@@ -3,7 +3,7 @@
 import numpy as np
 
 from py4vasp import _config, exception
-from py4vasp._calculation import _stoichiometry, base, structure
+from py4vasp._calculation import _average, _stoichiometry, base, structure
 from py4vasp._third_party import graph, view
 from py4vasp._util import documentation, import_, index, select, slicing
 
@@ -36,7 +36,7 @@ def _join_with_emphasis(data):
     return ", ".join(emph_data)
 
 
-class Density(base.Refinery, structure.Mixin, view.Mixin):
+class Density(base.Refinery, structure.Mixin, view.Mixin, _average.Mixin):
     """This class accesses various densities (charge, magnetization, ...) of VASP.
 
     The charge density is one key quantity optimized by VASP. With this class you
@@ -342,7 +342,7 @@ class Density(base.Refinery, structure.Mixin, view.Mixin):
         cut, fraction = slicing.get_cut(a, b, c)
         plane = slicing.plane(self._structure.lattice_vectors(), cut, normal)
         map_ = self._create_map()
-        selector = index.Selector({0: map_}, self._raw_data.charge)
+        selector = index.Selector({0: map_}, self._read_plane(plane, fraction))
         tree = select.Tree.from_selection(selection)
         selections = self._filter_noncollinear_magnetization_from_selections(tree)
         contours = [
@@ -401,17 +401,48 @@ class Density(base.Refinery, structure.Mixin, view.Mixin):
         """
         cut, fraction = slicing.get_cut(a, b, c)
         plane = slicing.plane(self._structure.lattice_vectors(), cut, normal)
+        density = self._read_plane(plane, fraction)
         if self.is_collinear():
-            data = slicing.grid_scalar(self._raw_data.charge[1].T, plane, fraction)
+            data = slicing.grid_scalar(density[1].T, plane, fraction)
             data = np.array((np.zeros_like(data), data))
         else:
-            data = slicing.grid_vector(self.to_numpy()[1:], plane, fraction)
+            magnetization = np.moveaxis(density[1:], 0, -1).T
+            data = slicing.grid_vector(magnetization, plane, fraction)
         label = self._selection or "magnetization"
         quiver_plot = graph.Contour(data, plane, label)
         if supercell is not None:
             quiver_plot.supercell = np.ones(2, dtype=np.int_) * supercell
         return graph.Graph([quiver_plot])
 
+    def _average_sources(self, selection):
+        _raise_error_if_no_data(self._raw_data.charge)
+        map_ = self._create_map()
+        selector = index.Selector({0: map_}, self._raw_data.charge)
+        tree = select.Tree.from_selection(selection or _INTERNAL)
+        for selection in self._filter_noncollinear_magnetization_from_selections(tree):
+            label = self._label(selector.label(selection))
+            yield label, self._slab_reader(map_, selection)
+
+    def _slab_reader(self, map_, selection):
+        def read_slab(slab):
+            charge = self._raw_data.charge.lazy[:, slab]
+            return index.Selector({0: map_}, charge)[selection]
+
+        return read_slab
+
+    def _raw_grid_shape(self):
+        return self._raw_data.charge.shape[1:]
+
+    def _read_plane(self, plane, fraction):
+        # The density is stored as (component, c, b, a). Only the grid points in the
+        # plane are read from the file; the cut dimension is kept with a single point
+        # so that the result can be processed like the full density.
+        _raise_error_if_no_data(self._raw_data.charge)
+        axis = 3 - slicing.INDICES[plane.cut]
+        index = slicing.grid_index(self._raw_data.charge.shape[axis], fraction)
+        key = (slice(None),) * axis + (slice(index, index + 1),)
+        return self._raw_data.charge.lazy[key]
+
     @base.data_access
     def is_nonpolarized(self):
         "Returns whether the density is not spin polarized."
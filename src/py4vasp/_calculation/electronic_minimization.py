@@ -3,9 +3,12 @@
 
 import numpy as np
 
-from py4vasp import exception, raw
+from py4vasp import exception
 from py4vasp._calculation import base, slice_
 from py4vasp._third_party import graph
+from py4vasp._util import import_
+
+pd = import_.optional("pandas")
 
 
 class ElectronicMinimization(slice_.Mixin, base.Refinery, graph.Mixin):
@@ -15,37 +18,21 @@ class ElectronicMinimization(slice_.Mixin, base.Refinery, graph.Mixin):
     Please check the vasp-wiki (https://www.vasp.at/wiki/index.php/OSZICAR) for more
     details about the exact outputs generated for each combination of INCAR tags."""
 
-    def _more_than_one_ionic_step(self, data):
-        return any(isinstance(_data, list) for _data in data) == True
-
     @base.data_access
     def __str__(self):
         format_rep = "{0:g}\t{1:0.12E}\t{2:0.6E}\t{3:0.6E}\t{4:g}\t{5:0.3E}\t{6:0.3E}\n"
         label_rep = "{}\t\t{}\t\t{}\t\t{}\t\t{}\t{}\t\t{}\n"
+        labels = self._from_bytes_to_utf(self._raw_data.label)
+        data, offsets, _ = self._read_flat()
+        header = label_rep.format(*labels)
         string = ""
-        labels = [label.decode("utf-8") for label in getattr(self._raw_data, "label")]
-        data = self.to_dict()
-        electronic_iterations = data["N"]
-        if not self._more_than_one_ionic_step(electronic_iterations):
-            electronic_iterations = [electronic_iterations]
-        ionic_steps = len(electronic_iterations)
-        for ionic_step in range(ionic_steps):
-            string += label_rep.format(*labels)
-            electronic_steps = len(electronic_iterations[ionic_step])
-            for electronic_step in range(electronic_steps):
-                _data = []
-                for label in self._raw_data.label:
-                    _values_electronic = data[label.decode("utf-8")]
-                    if not self._more_than_one_ionic_step(_values_electronic):
-                        _values_electronic = [_values_electronic]
-                    _value = _values_electronic[ionic_step][electronic_step]
-                    _data.append(_value)
-                _data = [float(_value) for _value in _data]
-                string += format_rep.format(*_data)
+        for start, end in zip(offsets[:-1], offsets[1:]):
+            string += header
+            string += "".join(format_rep.format(*row) for row in data[start:end])
         return string
 
     @base.data_access
-    def to_dict(self, selection=None):
+    def to_dict(self, selection=None, flat=False):
         """Extract convergence data from the HDF5 file and make it available in a dict
 
         Parameters
@@ -55,49 +42,98 @@ class ElectronicMinimization(slice_.Mixin, base.Refinery, graph.Mixin):
             bandstructure_energy_change, number_hamiltonian_evaluations, norm_residual,
             difference_charge_density to get specific columns of the OSZICAR file. In
             case no selection is provided, supply all columns.
+        flat: bool
+            If set, the values of all selected ionic steps are concatenated into a
+            single array per column. The additional "offsets" array indicates that
+            the electronic steps of the i-th ionic step are in the range
+            `offsets[i]:offsets[i+1]`. Otherwise, the values are returned as a list
+            for a single ionic step or a list of lists for multiple ionic steps.
 
         Returns
         -------
         dict
             Contains a dict from the HDF5 related to OSZICAR convergence data
         """
-        return_data = {}
+        keys_to_include = self._select_labels(selection)
+        if self._raw_data.convergence_data.is_none() and not flat:
+            return {key: {} for key in keys_to_include}
+        columns, offsets, _ = self._read_columns(keys_to_include)
+        if flat:
+            return {**columns, "offsets": offsets}
+        return {key: self._split(column, offsets) for key, column in columns.items()}
+
+    @base.data_access
+    def to_frame(self, selection=None):
+        """Read the convergence data into a pandas DataFrame.
+
+        Parameters
+        ----------
+        selection: str
+            Choose the column of the OSZICAR file, see :meth:`to_dict` for details.
+            In case no selection is provided, supply all columns.
+
+        Returns
+        -------
+        pd.DataFrame
+            Contains one row for every electronic step of the selected ionic steps.
+            The column "ionic_step" indicates to which ionic step the row belongs.
+        """
+        columns, offsets, selected = self._read_columns(self._select_labels(selection))
+        ionic_steps = np.repeat(selected + 1, np.diff(offsets))
+        return pd.DataFrame({"ionic_step": ionic_steps, **columns})
+
+    def _select_labels(self, selection):
+        labels_as_str = self._from_bytes_to_utf(self._raw_data.label)
         if selection is None:
-            keys_to_include = self._from_bytes_to_utf(self._raw_data.label)
-        else:
-            labels_as_str = self._from_bytes_to_utf(self._raw_data.label)
-            if selection not in labels_as_str:
-                message = """\
+            return labels_as_str
+        if selection not in labels_as_str:
+            message = """\
 Please choose a selection including at least one of the following keywords:
 N, E, dE, deps, ncg, rms, rms(c)"""
-                raise exception.RefinementError(message)
-            keys_to_include = [selection]
-        for key in keys_to_include:
-            return_data[key] = self._read(key)
-        return return_data
+            raise exception.RefinementError(message)
+        return [selection]
 
     def _from_bytes_to_utf(self, quantity: list):
         return [_quantity.decode("utf-8") for _quantity in quantity]
 
-    @base.data_access
-    def _read(self, key):
-        # data represents all of the electronic steps for all ionic steps
-        data = getattr(self._raw_data, "convergence_data")
-        iteration_number = data[:, 0]
-        split_index = np.where(iteration_number == 1)[0]
-        data = np.vsplit(data, split_index)[1:][self._steps]
-        if isinstance(self._steps, slice):
-            data = [raw.VaspData(_data) for _data in data]
-        else:
-            data = [raw.VaspData(data)]
-        labels = [label.decode("utf-8") for label in self._raw_data.label]
-        data_index = labels.index(key)
-        return_data = [list(_data[:, data_index]) for _data in data]
-        is_none = [_data.is_none() for _data in data]
-        if len(return_data) == 1:
-            return_data = return_data[0]
-        return return_data if not np.all(is_none) else {}
+    def _read_columns(self, keys):
+        data, offsets, selected = self._read_flat()
+        labels = self._from_bytes_to_utf(self._raw_data.label)
+        columns = {key: data[:, labels.index(key)] for key in keys}
+        return columns, offsets, selected
+
+    def _read_flat(self):
+        # the iteration number restarts at 1 for every ionic step, so the start of
+        # the ionic steps defines the offsets into the flat array of all electronic
+        # steps; only the rows of the selected ionic steps are read from the file.
+        # Returns the rows, the offsets, and the indices of the selected ionic steps.
+        convergence_data = self._raw_data.convergence_data
+        if convergence_data.is_none():
+            empty = np.zeros((0, len(self._raw_data.label)))
+            return empty, np.zeros(1, np.int_), np.zeros(0, np.int_)
+        bounds = np.append(
+            np.flatnonzero(convergence_data[:, 0] == 1), len(convergence_data)
+        )
+        selected = np.arange(len(bounds) - 1)[self._slice]
+        lengths = bounds[selected + 1] - bounds[selected]
+        offsets = np.zeros(len(selected) + 1, dtype=np.int_)
+        np.cumsum(lengths, out=offsets[1:])
+        if len(selected) == 0:
+            return np.zeros((0, convergence_data.shape[1])), offsets, selected
+        first = bounds[selected].min()
+        last = bounds[selected + 1].max()
+        block = np.asarray(convergence_data[first:last])
+        rows = np.repeat(bounds[selected] - first - offsets[:-1], lengths)
+        rows += np.arange(offsets[-1])
+        return block[rows], offsets, selected
+
+    def _split(self, column, offsets):
+        result = [
+            column[start:end].tolist() for start, end in zip(offsets[:-1], offsets[1:])
+        ]
+        return result if self._is_slice else result[0]
 
+    @base.data_access
     def to_graph(self, selection="E"):
         """Graph the change in parameter with iteration number.
 
@@ -110,13 +146,22 @@ N, E, dE, deps, ncg, rms, rms(c)"""
         -------
         Graph
             The Graph with the quantity plotted on y-axis and the iteration number of
-            the x-axis.
+            the x-axis. If multiple ionic steps are selected, there is one line for
+            every ionic step.
         """
-        data = self.to_dict()
-        series = graph.Series(data["N"], data[selection], selection)
+        keys = self._select_labels("N") + self._select_labels(selection)
+        columns, offsets, selected = self._read_columns(keys)
+        series = [
+            graph.Series(
+                columns["N"][start:end],
+                columns[selection][start:end],
+                f"{selection} (step {step + 1})" if self._is_slice else selection,
+            )
+            for step, start, end in zip(selected, offsets[:-1], offsets[1:])
+        ]
         ylabel = " ".join(select.capitalize() for select in selection.split("_"))
         return graph.Graph(
-            series=[series],
+            series=series,
             xlabel="Iteration number",
             ylabel=ylabel,
         )
@@ -2,6 +2,7 @@
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import numpy as np
 
+from py4vasp import raw
 from py4vasp._calculation import base, slice_
 from py4vasp._third_party import graph
 from py4vasp._util import convert, documentation, index, select
@@ -102,9 +103,9 @@ class Energy(slice_.Mixin, base.Refinery, graph.Mixin):
         return dict(self._read_data(tree, self._steps))
 
     def _default_dict(self):
-        raw_values = np.array(self._raw_data.values).T
+        raw_values = np.moveaxis(self._raw_data.values[self._steps], -1, 0)
         return {
-            convert.text_to_string(label).strip(): value[self._steps]
+            convert.text_to_string(label).strip(): value
             for label, value in zip(self._raw_data.labels, raw_values)
         }
 
@@ -167,9 +168,20 @@ class Energy(slice_.Mixin, base.Refinery, graph.Mixin):
 
     def _read_data(self, tree, steps_or_slice):
         maps = {1: self._init_selection_dict()}
-        selector = index.Selector(maps, self._raw_data.values)
+        # select the steps first so that only these are read from the file
+        values = raw.VaspData(self._raw_data.values).lazy[self._slice]
+        selector = index.Selector(maps, values)
+        step = slice(None) if isinstance(steps_or_slice, slice) else 0
         for selection in tree.selections():
-            yield selector.label(selection), selector[selection][steps_or_slice]
+            yield selector.label(selection), selector[selection][step]
+
+    @base.data_access
+    def _stack_leaves(self, selection=None):
+        # the dictionary is already flat, so only the keys are converted to paths
+        return {(label,): value for label, value in self.to_dict(selection).items()}
+
+    def _number_steps_in_trajectory(self):
+        return len(self._raw_data.values)
 
     def _init_selection_dict(self):
         return {
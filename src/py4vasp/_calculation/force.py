@@ -93,6 +93,17 @@ POSITION                                       TOTAL-FORCE (eV/Angst)
         viewer.ion_arrows = [ion_arrow]
         return viewer
 
+    @base.data_access
+    def _stack_leaves(self):
+        # flat version of to_dict used to stack many calculations into arrays
+        structure = self._structure[self._steps]._stack_leaves()
+        leaves = {("structure", *path): value for path, value in structure.items()}
+        leaves[("forces",)] = self._force[self._steps]
+        return leaves
+
+    def _number_steps_in_trajectory(self):
+        return len(self._raw_data.forces)
+
     @property
     def _force(self):
         return _ForceReader(self._raw_data.forces)
@@ -1,5 +1,6 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+from py4vasp import raw
 from py4vasp._calculation import base, slice_
 from py4vasp._third_party import graph
 from py4vasp._util import convert, documentation, index, select
@@ -102,10 +103,13 @@ class PairCorrelation(slice_.Mixin, base.Refinery, graph.Mixin):
 
     def _read_data(self, selection):
         map_ = {1: self._init_pair_correlation_dict()}
-        selector = index.Selector(map_, self._raw_data.function)
+        # select the steps first so that only these are read from the file
+        function = raw.VaspData(self._raw_data.function).lazy[self._slice]
+        selector = index.Selector(map_, function)
         tree = select.Tree.from_selection(selection)
+        step = slice(None) if self._is_slice else 0
         return {
-            selector.label(selection): selector[selection][self._steps]
+            selector.label(selection): selector[selection][step]
             for selection in tree.selections()
         }
 
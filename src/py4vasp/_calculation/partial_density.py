@@ -7,14 +7,14 @@ from typing import Union
 import numpy as np
 
 from py4vasp import _config, exception
-from py4vasp._calculation import base, structure
+from py4vasp._calculation import _average, base, structure
 from py4vasp._third_party import view
 from py4vasp._third_party.graph import Graph
 from py4vasp._third_party.graph.contour import Contour
-from py4vasp._util import import_, select
+from py4vasp._util import documentation, import_, select
 from py4vasp._util.slicing import plane
 
-interpolate = import_.optional("scipy.interpolate")
+linalg = import_.optional("scipy.linalg")
 ndimage = import_.optional("scipy.ndimage")
 
 _STM_MODES = {
@@ -22,6 +22,7 @@ _STM_MODES = {
     "constant_current": ["constant_current", "cc", "current"],
 }
 _SPINS = ("up", "down", "total")
+_ROUNDING_TOLERANCE = 1e-6
 
 
 @dataclasses.dataclass
@@ -51,7 +52,7 @@ class STM_settings:
     interpolation_factor: int = 10
 
 
-class PartialDensity(base.Refinery, structure.Mixin, view.Mixin):
+class PartialDensity(base.Refinery, structure.Mixin, view.Mixin, _average.Mixin):
     """Partial charges describe the fraction of the charge density in a certain energy,
     band, or k-point range.
 
@@ -169,11 +170,88 @@ class PartialDensity(base.Refinery, structure.Mixin, view.Mixin):
         self._raise_error_if_selection_not_understood(selection, mode, spin)
         smoothed_charge = self._get_stm_data(spin, stm_settings)
         if mode == "constant_height" or mode is None:
-            return self._constant_height_stm(
-                smoothed_charge, tip_height, spin, stm_settings
+            (contour,) = self._constant_height_stm(
+                smoothed_charge, [tip_height], spin, stm_settings
             )
+            return contour
         current = current * 1e-09  # convert nA to A
-        return self._constant_current_stm(smoothed_charge, current, spin, stm_settings)
+        (contour,) = self._constant_current_stm(
+            smoothed_charge, [current], spin, stm_settings
+        )
+        return contour
+
+    @base.data_access
+    def to_stm_series(
+        self,
+        selection: str = "total",
+        *,
+        tip_heights=(),
+        currents=(),
+        supercell: Union[int, np.array] = 2,
+        stm_settings: STM_settings = STM_settings(),
+    ) -> Graph:
+        """Generate a series of STM images for several tip heights and currents.
+
+        The partial charge density is read and smoothed only once and in constant
+        current mode the interpolation along z is evaluated only once for all
+        currents. This is much faster than calling :meth:`to_stm` for every value.
+
+        Parameters
+        ----------
+        selection : str
+            The spin channel to be used. Possible spin selections are "total"
+            (default), "up", and "down".
+        tip_heights : Sequence[float]
+            The heights of the STM tip above the surface in Angstrom for which
+            constant height images are generated.
+        currents : Sequence[float]
+            The tunneling currents in nA for which constant current images are
+            generated.
+        supercell : int | np.array
+            The supercell to be used for plotting the STM. The default is 2.
+        stm_settings : STM_settings
+            Settings for the STM simulation concerning smoothening parameters
+            and interpolation. The default is STM_settings().
+
+        Returns
+        -------
+        Graph
+            A graph containing one Contour object per tip height followed by one
+            per current.
+        """
+        _raise_error_if_vacuum_too_small(self._estimate_vacuum())
+        tip_heights = np.atleast_1d(np.asarray(tip_heights, dtype=np.float64))
+        currents = np.atleast_1d(np.asarray(currents, dtype=np.float64))
+        if len(tip_heights) == 0 and len(currents) == 0:
+            message = "Please provide at least one tip height or current."
+            raise exception.IncorrectUsage(message)
+        for tip_height in tip_heights:
+            self._raise_error_if_tip_too_far_away(tip_height)
+        spin = self._parse_spin_of_series(selection)
+        smoothed_charge = self._get_stm_data(spin, stm_settings)
+        contours = [
+            *self._constant_height_stm(
+                smoothed_charge, tip_heights, spin, stm_settings
+            ),
+            *self._constant_current_stm(
+                smoothed_charge, currents * 1e-09, spin, stm_settings
+            ),
+        ]
+        supercell = self._parse_supercell(supercell)
+        for contour in contours:
+            contour.supercell = supercell
+            contour.settings = stm_settings
+        return Graph(series=contours)
+
+    def _parse_spin_of_series(self, selection):
+        tree = select.Tree.from_selection(selection)
+        for index, selection in enumerate(tree.selections()):
+            if index > 0:
+                message = "Selecting more than one spin is not implemented."
+                raise exception.NotImplemented(message)
+            spin = self._parse_spin(selection)
+            self._raise_error_if_selection_not_understood(selection, None, spin)
+        return spin
 
     def _parse_mode(self, selection):
         for mode, aliases in _STM_MODES.items():
@@ -193,33 +271,47 @@ class PartialDensity(base.Refinery, structure.Mixin, view.Mixin):
             message = f"STM mode '{selection}' was parsed as mode='{mode}' and spin='{spin}' which could not be used. Please use 'constant_height' or 'constant_current' as mode and 'up', 'down', or 'total' as spin."
             raise exception.IncorrectUsage(message)
 
-    def _constant_current_stm(self, smoothed_charge, current, spin, stm_settings):
+    def _constant_current_stm(self, smoothed_charge, currents, spin, stm_settings):
+        if len(currents) == 0:
+            return []
         z_start = _min_of_z_charge(
-            self._get_stm_data(spin, stm_settings),
+            smoothed_charge,
             sigma=stm_settings.sigma_z,
             truncate=stm_settings.truncate,
         )
-        grid = self.grid()
+        number_z = self.grid()[2]
         z_step = 1 / stm_settings.interpolation_factor
-        # roll smoothed charge so that we are not bothered by the boundary of the
-        # unit cell if the slab is not centered. z_start is now the first index
-        smoothed_charge = np.roll(smoothed_charge, -z_start, axis=2)
-        z_grid = np.arange(grid[2], 0, -z_step)
-        splines = interpolate.CubicSpline(range(grid[2]), smoothed_charge, axis=-1)
-        scan = z_grid[np.argmax(splines(z_grid) >= current, axis=-1)]
-        scan = z_step * (scan - scan.min())
-        spin_label = "both spin channels" if spin == "total" else f"spin {spin}"
-        stoichiometry = self._stoichiometry()
-        label = f"STM of {stoichiometry} for {spin_label} at constant current={current*1e9:.2f} nA"
-        return Contour(data=scan, lattice=self._get_stm_plane(), label=label)
+        # the scanner rolls the charge so that we are not bothered by the boundary of
+        # the unit cell if the slab is not centered. z_start is the first index
+        scanner = _CurrentScanner(smoothed_charge, z_start)
+        contours = []
+        for current, height in zip(currents, scanner.heights_at(currents)):
+            # round down to the resolution given by the interpolation factor
+            steps_from_top = np.ceil((number_z - height) / z_step - _ROUNDING_TOLERANCE)
+            scan = number_z - z_step * steps_from_top
+            scan = z_step * (scan - scan.min())
+            label = self._stm_label(spin, f"constant current={current*1e9:.2f} nA")
+            contours.append(
+                Contour(data=scan, lattice=self._get_stm_plane(), label=label)
+            )
+        return contours
+
+    def _constant_height_stm(self, smoothed_charge, tip_heights, spin, stm_settings):
+        highest_z_coord = self._get_highest_z_coord()
+        contours = []
+        for tip_height in tip_heights:
+            zz = self._z_index_for_height(tip_height + highest_z_coord)
+            height_scan = smoothed_charge[:, :, zz] * stm_settings.enhancement_factor
+            height_label = f"constant height={float(tip_height):.2f} Angstrom"
+            label = self._stm_label(spin, height_label)
+            contours.append(
+                Contour(data=height_scan, lattice=self._get_stm_plane(), label=label)
+            )
+        return contours
 
-    def _constant_height_stm(self, smoothed_charge, tip_height, spin, stm_settings):
-        zz = self._z_index_for_height(tip_height + self._get_highest_z_coord())
-        height_scan = smoothed_charge[:, :, zz] * stm_settings.enhancement_factor
+    def _stm_label(self, spin, mode_label):
         spin_label = "both spin channels" if spin == "total" else f"spin {spin}"
-        stoichiometry = self._stoichiometry()
-        label = f"STM of {stoichiometry} for {spin_label} at constant height={float(tip_height):.2f} Angstrom"
-        return Contour(data=height_scan, lattice=self._get_stm_plane(), label=label)
+        return f"STM of {self._stoichiometry()} for {spin_label} at {mode_label}"
 
     def _z_index_for_height(self, tip_height):
         """Return the z-index of the tip height in the charge density grid."""
@@ -358,14 +450,132 @@ class PartialDensity(base.Refinery, structure.Mixin, view.Mixin):
 
         band = self._check_band_index(band)
         kpoint = self._check_kpoint_index(kpoint)
+        return self._read_density(selection, band, kpoint)
+
+    @base.data_access
+    def iter_bands(self, selection="total", kpoint=0):
+        """Iterate over the band-resolved partial charge densities one band at a time.
+
+        Only the density of the current band is read from the file, so that the
+        memory does not grow with the number of bands. Use this for calculations
+        with LSEPB = T and many bands.
+
+        Parameters
+        ----------
+        selection : str
+            The spin channel to be used. The default is "total".
+            The other options are "up" and "down".
+        kpoint : int
+            The k-point index. The default is 0, which means that all k-points are summed.
+
+        Yields
+        ------
+        tuple[int, np.ndarray]
+            The band index as stored in the bands array and the partial charge
+            density of this band as a 3D array.
+        """
+        kpoint = self._check_kpoint_index(kpoint)
+        for index, band in enumerate(self.bands()):
+            yield int(band), self._read_density(selection, index, kpoint)
+
+    @base.data_access
+    @documentation.format(direction=_average.DIRECTION, chunk_size=_average.CHUNK_SIZE)
+    def to_planar_average(
+        self, selection="total", *, band=0, kpoint=0, direction="c", chunk_size=None
+    ):
+        """Average the partial charge density over the planes along a lattice vector.
 
-        parchg = self._raw_data.partial_charge[:].T
+        Parameters
+        ----------
+        selection : str
+            The spin channel to be used. The default is "total".
+            The other options are "up" and "down".
+        band : int
+            The band index. The default is 0, which means that all bands are summed.
+        kpoint : int
+            The k-point index. The default is 0, which means that all k-points are summed.
+        {direction}
+        {chunk_size}
+
+        Returns
+        -------
+        Graph
+            The planar average as a function of the distance along the lattice
+            vector in Å.
+        """
+        sources = self._average_sources(selection, band, kpoint)
+        return self._planar_average_graph(sources, direction, chunk_size)
+
+    @base.data_access
+    @documentation.format(
+        window=_average.WINDOW,
+        direction=_average.DIRECTION,
+        chunk_size=_average.CHUNK_SIZE,
+    )
+    def to_macroscopic_average(
+        self,
+        selection="total",
+        *,
+        window,
+        band=0,
+        kpoint=0,
+        direction="c",
+        chunk_size=None,
+    ):
+        """Compute the macroscopic average of the partial charge density.
+
+        The planar average is convolved with a box filter whose width is the period
+        of the oscillations of the density, e.g., the interlayer distance.
+
+        Parameters
+        ----------
+        selection : str
+            The spin channel to be used. The default is "total".
+            The other options are "up" and "down".
+        {window}
+        band : int
+            The band index. The default is 0, which means that all bands are summed.
+        kpoint : int
+            The k-point index. The default is 0, which means that all k-points are summed.
+        {direction}
+        {chunk_size}
+
+        Returns
+        -------
+        Graph
+            The macroscopic average as a function of the distance along the lattice
+            vector in Å.
+        """
+        sources = self._average_sources(selection, band, kpoint)
+        return self._macroscopic_average_graph(sources, window, direction, chunk_size)
+
+    def _average_sources(self, selection, band=0, kpoint=0):
+        spin = selection or "total"
+        band_index = self._check_band_index(band)
+        kpoint_index = self._check_kpoint_index(kpoint)
+        label = "partial density" + (f"({spin})" if spin != "total" else "")
+        if band != 0:
+            label += f" band {band}"
+        if kpoint != 0:
+            label += f" k-point {kpoint}"
+        read = lambda slab: self._read_density(spin, band_index, kpoint_index, slab).T
+        yield label, read
+
+    def _raw_grid_shape(self):
+        return self._raw_data.partial_charge.shape[3:]
+
+    def _read_density(self, selection, band, kpoint, slab=slice(None)):
+        # index the raw data before transposing so that only the selected band,
+        # k-point, and spin components are read from the file
+        partial_charge = self._raw_data.partial_charge.lazy[:, :, :, slab]
         if not self._spin_polarized() or selection == "total":
-            return parchg[:, :, :, 0, band, kpoint]
+            return partial_charge[kpoint, band, 0].T
         if selection == "up":
-            return parchg[:, :, :, :, band, kpoint] @ np.array([0.5, 0.5])
+            charge, magnetization = partial_charge[kpoint, band]
+            return 0.5 * (charge + magnetization).T
         if selection == "down":
-            return parchg[:, :, :, :, band, kpoint] @ np.array([0.5, -0.5])
+            charge, magnetization = partial_charge[kpoint, band]
+            return 0.5 * (charge - magnetization).T
 
         message = f"Spin '{selection}' not understood. Use 'up', 'down' or 'total'."
         raise exception.IncorrectUsage(message)
@@ -460,6 +670,115 @@ def _get_sanitized_cartesian_positions(structure):
     return np.dot(frac_pos, structure.lattice_vectors())
 
 
+class _CurrentScanner:
+    """Find the heights at which the tip reaches the given currents.
+
+    The density along z is interpolated by a not-a-knot cubic spline. The tip
+    approaches the surface from the top of the cell. For every xy position, the
+    crossing of the current is first bracketed on the grid points and then refined
+    by bisection of the cubic polynomial within the bracketing interval. The xy
+    columns are processed in blocks of at most `block_size` grid points, so the
+    additional memory is the size of one block plus one height per xy point and
+    current.
+    """
+
+    block_size = 2**18
+
+    def __init__(self, charge, z_start=0):
+        self._columns = np.reshape(charge, (-1, charge.shape[-1]))
+        self._shape = charge.shape[:-1]
+        self._z_start = z_start
+
+    def heights_at(self, currents):
+        "Return the heights in units of the grid spacing from z_start for all currents."
+        heights = np.empty((len(currents), len(self._columns)))
+        number_columns = max(self.block_size // self._columns.shape[-1], 1)
+        for start in range(0, len(self._columns), number_columns):
+            block = slice(start, start + number_columns)
+            charge = np.roll(self._columns[block], -self._z_start, axis=-1)
+            scanner = _ColumnScanner(charge)
+            for height, current in zip(heights, currents):
+                height[block] = scanner.height_at(current)
+        return heights.reshape((len(currents), *self._shape))
+
+
+class _ColumnScanner:
+    # bracket and bisect the crossing for a block of columns along z
+
+    _number_bisections = 30
+
+    def __init__(self, charge):
+        self._charge = charge
+        self._slopes = _not_a_knot_slopes(charge)
+        self._number_z = charge.shape[-1]
+        # the last polynomial extrapolates the density to the top of the cell
+        last_interval = np.full(charge.shape[:-1], self._number_z - 2)
+        top = np.polyval(self._polynomial(last_interval), 2.0)
+        values = np.concatenate((charge, top[..., np.newaxis]), axis=-1)
+        self._running_max = np.maximum.accumulate(values[..., ::-1], axis=-1)
+
+    def height_at(self, current):
+        steps_from_top = np.sum(self._running_max < current, axis=-1)
+        # grid point below the crossing; the density at the next point is smaller
+        lower = self._number_z - steps_from_top
+        not_reached = (steps_from_top == 0) | (lower < 0)
+        lower = np.where(not_reached, 0, lower)
+        interval = np.minimum(lower, self._number_z - 2)
+        polynomial = self._polynomial(interval)
+        low = (lower - interval).astype(np.float64)
+        high = low + 1
+        for _ in range(self._number_bisections):
+            middle = 0.5 * (low + high)
+            above = np.polyval(polynomial, middle) >= current
+            low = np.where(above, middle, low)
+            high = np.where(above, high, middle)
+        return np.where(not_reached, self._number_z, interval + low)
+
+    def _polynomial(self, interval):
+        value = _take_along_z(self._charge, interval)
+        next_value = _take_along_z(self._charge, interval + 1)
+        slope = _take_along_z(self._slopes, interval)
+        next_slope = _take_along_z(self._slopes, interval + 1)
+        secant = next_value - value
+        return np.array(
+            (
+                slope + next_slope - 2 * secant,
+                3 * secant - 2 * slope - next_slope,
+                slope,
+                value,
+            )
+        )
+
+
+def _take_along_z(array, index):
+    return np.take_along_axis(array, index[..., np.newaxis], axis=-1)[..., 0]
+
+
+def _not_a_knot_slopes(values):
+    """Return the derivatives of the not-a-knot cubic spline through values on an
+    equidistant grid along the last axis. This is the same spline as
+    scipy.interpolate.CubicSpline constructs without storing all its coefficients."""
+    number_points = values.shape[-1]
+    secants = np.diff(values, axis=-1)
+    rhs = np.empty((number_points, values[..., 0].size))
+    rhs[1:-1] = (
+        3 * (secants[..., :-1] + secants[..., 1:]).reshape(-1, number_points - 2).T
+    )
+    rhs[0] = (5 * secants[..., 0] + secants[..., 1]).ravel() / 2
+    rhs[-1] = (secants[..., -2] + 5 * secants[..., -1]).ravel() / 2
+    del secants
+    banded = np.zeros((3, number_points))
+    banded[0, 2:] = 1
+    banded[1] = 4
+    banded[2, :-2] = 1
+    banded[1, 0] = banded[1, -1] = 1
+    banded[0, 1] = banded[2, -2] = 2
+    slopes = linalg.solve_banded(
+        (1, 1), banded, rhs, overwrite_ab=True, overwrite_b=True, check_finite=False
+    )
+    return slopes.T.reshape(values.shape)
+
+
 def _min_of_z_charge(charge, sigma=4, truncate=3.0):
     """Returns the z-coordinate of the minimum of the charge density in the z-direction"""
     # average over the x and y axis
@@ -5,14 +5,14 @@ import itertools
 import numpy as np
 
 from py4vasp import _config, exception
-from py4vasp._calculation import _stoichiometry, base, structure
+from py4vasp._calculation import _average, _stoichiometry, base, structure
 from py4vasp._third_party import view
 from py4vasp._util import select
 
 VALID_KINDS = ("total", "ionic", "xc", "hartree")
 
 
-class Potential(base.Refinery, structure.Mixin, view.Mixin):
+class Potential(base.Refinery, structure.Mixin, view.Mixin, _average.Mixin):
     """The local potential describes the interactions between electrons and ions.
 
     In DFT calculations, the local potential consists of various contributions, each
@@ -129,6 +129,18 @@ class Potential(base.Refinery, structure.Mixin, view.Mixin):
             isosurfaces=[view.Isosurface(isolevel, color, opacity)],
         )
 
+    def _average_sources(self, selection):
+        for kind, component in _parse_selection(selection or "total"):
+            self._raise_error_if_kind_incorrect(kind)
+            potential = self._get_potential(kind)
+            _raise_error_if_no_data(potential, kind)
+            label = f"{kind} potential" + (f"({component})" if component else "")
+            yield label, _slab_reader(potential, component)
+
+    def _raw_grid_shape(self):
+        _raise_error_if_no_data(self._raw_data.total_potential)
+        return self._raw_data.total_potential.shape[1:]
+
     def _get_potential(self, kind):
         return getattr(self._raw_data, f"{kind}_potential")
 
@@ -153,6 +165,18 @@ def _parse_selection(selection):
         yield kind, component
 
 
+def _slab_reader(potential, component):
+    def read_slab(slab):
+        potential_slab = potential.lazy[:, slab]
+        if component == "up":
+            return potential_slab[0] + potential_slab[1]
+        if component == "down":
+            return potential_slab[0] - potential_slab[1]
+        return potential_slab[0]
+
+    return read_slab
+
+
 def _is_collinear(potential):
     return potential.shape[0] == 2
 
@@ -3,6 +3,7 @@
 import copy
 
 from py4vasp import exception
+from py4vasp._calculation import base
 
 
 def examples(instance_name, function_name=None, step="step"):
@@ -40,10 +41,70 @@ class Mixin:
 
     def __getitem__(self, steps):
         self._raise_error_if_not_original()
+        return self._copy_with_steps(steps)
+
+    @base.data_access
+    def iter_steps(self, *args, chunk_size=None, selection=None, **kwargs):
+        """Iterate over the selected steps reading one step or chunk at a time.
+
+        In contrast to :meth:`read`, the data of all selected steps is never loaded
+        at once. The file stays open during the iteration and only the data of the
+        current step or chunk is read from it. If you did not select any steps with
+        the [] operator, the iteration runs over all steps of the trajectory.
+
+        Parameters
+        ----------
+        chunk_size : int, optional
+            If set, every iteration yields the data of up to this many steps with an
+            additional leading dimension for the steps. Otherwise the data of a
+            single step is yielded in every iteration.
+        selection : str
+            Selects the source of the data. Any remaining part of the selection is
+            passed on to the :meth:`read` method.
+        *args, **kwargs
+            Passed on to the :meth:`read` method.
+
+        Yields
+        ------
+        dict
+            The same data that :meth:`read` returns for the current step or chunk.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            message = f"The chunk size must be positive, but you passed {chunk_size}."
+            raise exception.IncorrectUsage(message)
+        if selection:
+            kwargs["selection"] = selection
+        steps = self._steps_to_iterate()
+        size = chunk_size or 1
+        for start in range(0, len(steps), size):
+            chunk = steps[start : start + size]
+            step = _range_to_slice(chunk) if chunk_size else chunk[0]
+            yield self._copy_with_steps(step).read(*args, **kwargs)
+
+    def _copy_with_steps(self, steps):
         new = copy.copy(self)
         new._original = False
         return new._set_steps_and_slice(steps)
 
+    def _steps_to_iterate(self):
+        all_steps = range(self._number_steps_in_trajectory())
+        if self._original:
+            return all_steps
+        if self._is_slice:
+            return all_steps[self._slice]
+        try:
+            step = all_steps[self._steps]
+        except (IndexError, TypeError) as error:
+            message = f"The step {self._steps} is not within the trajectory."
+            raise exception.IncorrectUsage(message) from error
+        return all_steps[step : step + 1]
+
+    def _number_steps_in_trajectory(self):
+        message = (
+            f"Iterating over the steps of {type(self).__name__} is not implemented."
+        )
+        raise exception.NotImplemented(message)
+
     def _set_steps_and_slice(self, steps):
         self._steps = steps
         self._is_slice = isinstance(steps, slice)
@@ -71,3 +132,8 @@ def _create_slice_for_current_step_if_possible(steps):
     except TypeError as error:
         message = f"Error creating slice [{steps}:{steps} + 1], please check the access operator argument."
         raise exception.IncorrectUsage(message) from error
+
+
+def _range_to_slice(range_):
+    stop = range_.stop if range_.stop >= 0 else None
+    return slice(range_.start, stop, range_.step)
@@ -57,6 +57,17 @@ in kB   {stress_to_string(stress)}
             "structure": self._structure[self._steps].read(),
         }
 
+    @base.data_access
+    def _stack_leaves(self):
+        # flat version of to_dict used to stack many calculations into arrays
+        structure = self._structure[self._steps]._stack_leaves()
+        leaves = {("structure", *path): value for path, value in structure.items()}
+        leaves[("stress",)] = self._stress[self._steps]
+        return leaves
+
+    def _number_steps_in_trajectory(self):
+        return len(self._raw_data.stress)
+
     @property
     def _stress(self):
         return _StressReader(self._raw_data.stress)
@@ -1,19 +1,32 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import contextlib
 import io
+import itertools
 from dataclasses import dataclass
 
 import numpy as np
 
 from py4vasp import exception, raw
-from py4vasp._calculation import _stoichiometry, base, slice_
+from py4vasp._calculation import _stoichiometry, _trajectory, base, energy, slice_
 from py4vasp._third_party import view
-from py4vasp._util import documentation, import_, reader
+from py4vasp._util import convert, documentation, import_, reader
 
 ase = import_.optional("ase")
 ase_io = import_.optional("ase.io")
+ase_singlepoint = import_.optional("ase.calculators.singlepoint")
+ase_symbols = import_.optional("ase.symbols")
 mdtraj = import_.optional("mdtraj")
 
+ATOMS_PER_CHUNK = 2**20
+EV_PER_A3_TO_KB = 1.602176634e3
+_FILENAME = """\
+filename : str or Path or file object
+    If set, the text is written to this file instead of being returned. Relative
+    paths are interpreted with respect to the path of the calculation. The steps are
+    read and written in chunks, so even long trajectories never need to fit into
+    memory at once."""
+
 
 @dataclass
 class _Format:
@@ -213,29 +226,146 @@ class Structure(slice_.Mixin, base.Refinery, view.Mixin):
         """
         if self._is_slice:
             message = (
-                "Converting multiple structures to ASE trajectories is not implemented."
+                "Converting multiple structures to a single ase Atoms object is not "
+                "possible. Please use `to_ase_trajectory` instead."
             )
             raise exception.NotImplemented(message)
         data = self.to_dict(ion_types)
-        structure = ase.Atoms(
-            symbols=data["elements"],
-            cell=data["lattice_vectors"],
-            scaled_positions=data["positions"],
+        supercell = self._parse_supercell(supercell)
+        positions, ion_indices = view.replicate(
+            data["positions"], supercell, ion_major=True
+        )
+        numbers = np.asarray(ase_symbols.symbols2numbers(data["elements"]))
+        return ase.Atoms(
+            numbers=numbers[ion_indices],
+            cell=supercell[:, np.newaxis] * data["lattice_vectors"],
+            positions=positions @ data["lattice_vectors"],
             pbc=True,
         )
-        num_atoms_prim = len(structure)
-        if supercell is not None:
-            try:
-                structure *= supercell
-            except (TypeError, IndexError) as err:
-                error_message = (
-                    "Generating the supercell failed. Please make sure the requested "
-                    "supercell is either an integer or a list of 3 integers."
-                )
-                raise exception.IncorrectUsage(error_message) from err
-        num_atoms_super = len(structure)
-        order = sorted(range(num_atoms_super), key=lambda n: n % num_atoms_prim)
-        return structure[order]
+
+    @documentation.format(
+        examples=slice_.examples("structure", "to_ase_trajectory"),
+        ion_types=_stoichiometry.ion_types_documentation,
+    )
+    def to_ase_trajectory(
+        self,
+        ion_types=None,
+        *,
+        filename=None,
+        include_forces=False,
+        include_stress=False,
+        include_energies=False,
+        selection=None,
+    ):
+        """Convert the selected steps to ase Atoms objects.
+
+        The steps are read from the file in chunks. Optionally, the forces, the stress,
+        and the energies of the same calculation are attached to every step as a
+        single-point calculator, so that ``atoms.get_forces()`` etc. return the VASP
+        results in the units of ase. This requires that the structure was created with
+        `from_path` or `from_file`.
+
+        Parameters
+        ----------
+        {ion_types}
+        filename : str or Path or file object
+            If set, the steps are written to this ase trajectory (.traj) file instead of
+            being returned. Relative paths are interpreted with respect to the path of
+            the calculation.
+        include_forces : bool
+            Attach the forces acting on the ions.
+        include_stress : bool
+            Attach the stress on the unit cell.
+        include_energies : bool
+            Attach the free energy (TOTEN) and the energy extrapolated to zero smearing
+            if it is available.
+        selection : str
+            Selects the source of the structure.
+
+        Returns
+        -------
+        Iterator[ase.Atoms] or None
+            Yields the structure of every selected step unless they were written to a
+            file. The data is read only while you iterate over the steps.
+
+        {examples}
+        """
+        # only the generator accesses the data, so that the file is opened while
+        # iterating over the steps
+        frames = self._ase_frames(
+            ion_types,
+            include_forces,
+            include_stress,
+            include_energies,
+            selection=selection,
+        )
+        if filename is None:
+            return frames
+        path = filename
+        if not hasattr(filename, "write"):
+            path = convert.to_writeout_path(self._path, filename)
+        with ase_io.Trajectory(path, "w") as trajectory:
+            for atoms in frames:
+                trajectory.write(atoms)
+
+    @base.data_access
+    def _ase_frames(self, ion_types, include_forces, include_stress, include_energies):
+        steps = self._selected_steps()
+        lattice_vectors = self.lattice_vectors().reshape(-1, 3, 3)
+        elements = self._stoichiometry().elements(ion_types)
+        numbers = ase_symbols.symbols2numbers(elements)
+        quantities = {
+            "force": include_forces,
+            "stress": include_stress,
+            "energy": include_energies,
+        }
+        with contextlib.ExitStack() as stack:
+            related = {
+                quantity: stack.enter_context(self._access_related(quantity))
+                for quantity, include in quantities.items()
+                if include
+            }
+            for chunk in self._iterate_chunks(steps, lattice_vectors):
+                steps_in_chunk, cells, positions = chunk
+                results = self._read_results(related, steps_in_chunk)
+                for index, (cell, position) in enumerate(zip(cells, positions)):
+                    atoms = ase.Atoms(
+                        numbers=numbers, cell=cell, scaled_positions=position, pbc=True
+                    )
+                    if results:
+                        step_results = {
+                            key: value[index] for key, value in results.items()
+                        }
+                        atoms.calc = ase_singlepoint.SinglePointCalculator(
+                            atoms, **step_results
+                        )
+                    yield atoms
+
+    def _read_results(self, related, steps):
+        results = {}
+        if "force" in related:
+            results["forces"] = self._read_steps(related["force"].forces, steps)
+        if "stress" in related:
+            stress = self._read_steps(related["stress"].stress, steps)
+            stress = 0.5 * (stress + np.swapaxes(stress, -1, -2))
+            # VASP reports the stress as pressure in kB, ase uses eV/Å³ and Voigt order
+            stress = -stress[:, [0, 1, 2, 1, 0, 0], [0, 1, 2, 2, 2, 1]]
+            results["stress"] = stress / EV_PER_A3_TO_KB
+        if "energy" in related:
+            results.update(self._read_energies(related["energy"], steps))
+        return results
+
+    def _read_energies(self, raw_energy, steps):
+        energy_ = energy.Energy.from_data(raw_energy)
+        components = energy_.selections()["component"]
+        if self._is_trajectory:
+            energy_ = energy_[slice_._range_to_slice(steps)]
+        free_energy = np.atleast_1d(energy_.to_numpy("TOTEN"))
+        if "ESIG0" in components:
+            total_energy = np.atleast_1d(energy_.to_numpy("ESIG0"))
+        else:
+            total_energy = free_energy
+        return {"energy": total_energy, "free_energy": free_energy}
 
     @base.data_access
     @documentation.format(
@@ -278,15 +408,149 @@ class Structure(slice_.Mixin, base.Refinery, view.Mixin):
         Returns
         -------
         str or list[str]
-            Returns the POSCAR of the current or all selected steps.
+            Returns the POSCAR of the current step or a list with the POSCAR of every
+            selected step.
 
         {examples}
         """
         if not self._is_slice:
             return self._create_repr(ion_types=ion_types)
-        else:
-            message = "Converting multiple structures to a POSCAR is currently not implemented."
-            raise exception.NotImplemented(message)
+        steps = self._selected_steps()
+        lattice_vectors = self._read_steps(self._raw_data.cell.lattice_vectors, steps)
+        poscar = _trajectory.Poscar(
+            self._stoichiometry(), ion_types, self._scale(), self.number_atoms()
+        )
+        chunks = self._iterate_chunks(steps, lattice_vectors)
+        return list(itertools.chain.from_iterable(poscar(*chunk) for chunk in chunks))
+
+    @base.data_access
+    @documentation.format(
+        examples=slice_.examples("structure", "to_XDATCAR"),
+        ion_types=_stoichiometry.ion_types_documentation,
+        filename=_FILENAME,
+    )
+    def to_XDATCAR(self, ion_types=None, *, filename=None):
+        """Convert the selected steps to the XDATCAR format of VASP.
+
+        If the unit cell does not change along the trajectory, the lattice vectors
+        are written once at the top of the file. Otherwise, the header is repeated for
+        every step.
+
+        Parameters
+        ----------
+        {ion_types}
+        {filename}
+
+        Returns
+        -------
+        str or None
+            The XDATCAR of the selected steps unless it was written to a file.
+
+        {examples}
+        """
+        steps = self._selected_steps()
+        lattice_vectors = self._read_steps(self._raw_data.cell.lattice_vectors, steps)
+        xdatcar = _trajectory.Xdatcar(
+            self._stoichiometry(), ion_types, self._scale(), lattice_vectors
+        )
+        chunks = (
+            xdatcar(*chunk) for chunk in self._iterate_chunks(steps, lattice_vectors)
+        )
+        if not xdatcar.variable_cell:
+            chunks = itertools.chain((xdatcar.header(lattice_vectors[:1]),), chunks)
+        return self._write_text(chunks, filename)
+
+    @base.data_access
+    @documentation.format(
+        examples=slice_.examples("structure", "to_extxyz"),
+        ion_types=_stoichiometry.ion_types_documentation,
+        filename=_FILENAME,
+    )
+    def to_extxyz(self, ion_types=None, *, filename=None):
+        """Convert the selected steps to the extended XYZ format.
+
+        Every step contains the lattice vectors and the Cartesian positions of the ions
+        in Å. Many analysis and visualization tools, e.g., ase or OVITO, read this
+        format.
+
+        Parameters
+        ----------
+        {ion_types}
+        {filename}
+
+        Returns
+        -------
+        str or None
+            The extended XYZ text of the selected steps unless it was written to a file.
+
+        {examples}
+        """
+        steps = self._selected_steps()
+        lattice_vectors = self.lattice_vectors().reshape(-1, 3, 3)
+        extxyz = _trajectory.ExtendedXyz(self._stoichiometry().elements(ion_types))
+        chunks = self._iterate_chunks(steps, lattice_vectors)
+        return self._write_text((extxyz(*chunk) for chunk in chunks), filename)
+
+    @base.data_access
+    @documentation.format(
+        examples=slice_.examples("structure", "to_lammps_dump"),
+        ion_types=_stoichiometry.ion_types_documentation,
+        filename=_FILENAME,
+    )
+    def to_lammps_dump(self, ion_types=None, *, filename=None):
+        """Convert the selected steps to a LAMMPS dump file.
+
+        The unit cell of every step is rotated to the standard form of LAMMPS, i.e.,
+        the lattice vectors form a lower triangular matrix. The ions are labeled by
+        the index of their ion type starting from 1 and by their element.
+
+        Parameters
+        ----------
+        {ion_types}
+        {filename}
+
+        Returns
+        -------
+        str or None
+            The LAMMPS dump of the selected steps unless it was written to a file.
+
+        {examples}
+        """
+        steps = self._selected_steps()
+        lattice_vectors = self.lattice_vectors().reshape(-1, 3, 3)
+        number_ion_types = self._raw_data.stoichiometry.number_ion_types
+        ion_type_numbers = np.repeat(np.arange(len(number_ion_types)), number_ion_types)
+        elements = self._stoichiometry().elements(ion_types)
+        dump = _trajectory.LammpsDump(ion_type_numbers, elements)
+        chunks = self._iterate_chunks(steps, lattice_vectors)
+        return self._write_text((dump(*chunk) for chunk in chunks), filename)
+
+    def _selected_steps(self):
+        if self._original:
+            return range(self._number_steps_in_trajectory())[-1:]
+        return self._steps_to_iterate()
+
+    def _read_steps(self, data, steps):
+        if not self._is_trajectory:
+            return np.asarray(data[()])[np.newaxis]
+        return np.asarray(data[slice_._range_to_slice(steps)])
+
+    def _iterate_chunks(self, steps, lattice_vectors):
+        chunk_size = max(1, ATOMS_PER_CHUNK // self.number_atoms())
+        for start in range(0, len(steps), chunk_size):
+            chunk = steps[start : start + chunk_size]
+            positions = self._read_steps(self._raw_data.positions, chunk)
+            yield chunk, lattice_vectors[start : start + chunk_size], positions
+
+    def _write_text(self, chunks, filename):
+        if filename is None:
+            return "".join(chunks)
+        if hasattr(filename, "write"):
+            filename.writelines(chunks)
+            return None
+        path = convert.to_writeout_path(self._path, filename)
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(chunks)
 
     @base.data_access
     @documentation.format(examples=slice_.examples("structure", "to_lammps"))
@@ -455,6 +719,17 @@ Atoms # atomic
     def _stoichiometry(self):
         return _stoichiometry.Stoichiometry.from_data(self._raw_data.stoichiometry)
 
+    @base.data_access
+    def _stack_leaves(self):
+        # flat version of to_dict used to stack many calculations into arrays
+        elements, names = self._stoichiometry()._element_arrays()
+        return {
+            ("lattice_vectors",): self.lattice_vectors(),
+            ("positions",): self.positions(),
+            ("elements",): elements,
+            ("names",): names,
+        }
+
     def _scale(self):
         if isinstance(self._raw_data.cell.scale, np.float64):
             return self._raw_data.cell.scale
@@ -485,6 +760,9 @@ Atoms # atomic
             raise exception.IncorrectUsage(message)
         return super().__getitem__(steps)
 
+    def _number_steps_in_trajectory(self):
+        return len(self._raw_data.positions) if self._is_trajectory else 1
+
     @property
     def _is_trajectory(self):
         return self._raw_data.positions.ndim == 3
@@ -91,6 +91,9 @@ class Velocity(slice_.Mixin, base.Refinery, structure.Mixin, view.Mixin):
         viewer.ion_arrows = [ion_arrow]
         return viewer
 
+    def _number_steps_in_trajectory(self):
+        return len(self._raw_data.velocities)
+
     @property
     def _velocity(self):
         return _VelocityReader(self._raw_data.velocities)
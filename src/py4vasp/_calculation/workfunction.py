@@ -1,6 +1,8 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
-from py4vasp._calculation import bandgap, base
+import numpy as np
+
+from py4vasp._calculation import _average, bandgap, base
 from py4vasp._third_party import graph
 
 
@@ -70,3 +72,40 @@ class Workfunction(base.Refinery, graph.Mixin):
             xlabel=f"distance along {data['direction']} (Å)",
             ylabel="average potential (eV)",
         )
+
+    @base.data_access
+    def to_macroscopic_average(self, window):
+        """Plot the macroscopic average of the potential along the lattice vector
+        selected by IDIPOL.
+
+        The average potential is convolved with a box filter whose width is the period
+        of the oscillations of the potential, e.g., the interlayer distance. This
+        removes the oscillations within the bulk region, so that band offsets can be
+        read off directly.
+
+        Parameters
+        ----------
+        window : float or Sequence[float]
+            Width(s) of the box filter(s) in Å. If you pass two widths, the potential
+            is convolved successively with both filters, which is useful for
+            interfaces of materials with different periods.
+
+        Returns
+        -------
+        Graph
+            A plot where the distance in the unit cell along the selected lattice vector
+            is on the x axis and the macroscopic average of the potential is on the y
+            axis.
+        """
+        data = self.to_dict()
+        distance = data["distance"]
+        spacing = distance[1] - distance[0]
+        average = _average.macroscopic_average(
+            data["average_potential"], np.divide(window, spacing)
+        )
+        series = graph.Series(distance, average, "macroscopic average")
+        return graph.Graph(
+            series=series,
+            xlabel=f"distance along {data['direction']} (Å)",
+            ylabel="average potential (eV)",
+        )
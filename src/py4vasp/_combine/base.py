@@ -1,10 +1,15 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import concurrent.futures
+import importlib
 import inspect
+import itertools
 import pathlib
-from typing import Dict, List
+import warnings
+from typing import Dict, List, Optional
+
+import numpy as np
 
-import py4vasp
 from py4vasp import exception
 from py4vasp._util import convert
 
@@ -16,7 +21,7 @@ def _match_combine_with_refinement(combine_name: str):
         "Stresses": "stress",
     }
     quantity = combine_to_refinement_name[combine_name]
-    module = getattr(py4vasp._calculation, quantity)
+    module = importlib.import_module(f"py4vasp._calculation.{quantity}")
     class_name = convert.to_camelcase(quantity)
     return getattr(module, class_name)
     # for _, class_ in inspect.getmembers(data_depr, inspect.isclass):
@@ -28,6 +33,49 @@ def _match_combine_with_refinement(combine_name: str):
     #     )
 
 
+_EXECUTORS = {
+    "thread": concurrent.futures.ThreadPoolExecutor,
+    "process": concurrent.futures.ProcessPoolExecutor,
+}
+
+
+def _get_executor(executor):
+    try:
+        return _EXECUTORS[executor]
+    except KeyError as error:
+        choices = '", "'.join(_EXECUTORS)
+        message = (
+            f'The executor "{executor}" is not known. Please use one of "{choices}".'
+        )
+        raise exception.IncorrectUsage(message) from error
+
+
+def _read_refinement(refinement, args, kwargs):
+    # module level function so that it can be sent to other processes
+    return _catch_errors(refinement, refinement.read, args, kwargs)
+
+
+def _read_leaves(refinement, args, kwargs):
+    # read the arrays from the file without creating the nested dictionary
+    return _catch_errors(refinement, refinement._stack_leaves, args, kwargs)
+
+
+def _catch_errors(refinement, read, args, kwargs):
+    # a single broken calculation should not abort reading all the other ones
+    try:
+        return read(*args, **kwargs)
+    except exception.Py4VaspError as error:
+        return error
+    except Exception as error:
+        message = (
+            f"Reading the calculation in {refinement.path} failed with "
+            f"{type(error).__name__}: {error}"
+        )
+        wrapped_error = exception.Py4VaspError(message)
+        wrapped_error.__cause__ = error
+        return wrapped_error
+
+
 class BaseCombine:
     """A class to handle multiple refinements all at once.
 
@@ -44,11 +92,21 @@ class BaseCombine:
     and the API might change in the future.
     """
 
+    _workers = None
+    _executor = "thread"
+    _per_atom = ()
+    "Paths to the entries of the refinement's dictionary with one entry per ion."
+
     def __init__(self):
         pass
 
     @classmethod
-    def from_paths(cls, paths: Dict[str, List[pathlib.Path]]):
+    def from_paths(
+        cls,
+        paths: Dict[str, List[pathlib.Path]],
+        workers: Optional[int] = None,
+        executor: str = "thread",
+    ):
         """Set up a BaseCombine object for paths.
 
         Setup the object for paths by passing in a dictionary with the name of the
@@ -59,8 +117,15 @@ class BaseCombine:
         paths : Dict[str, List[pathlib.Path]]
             A dictionary with the name of the calculation as key and the path to the
             calculation as value.
+        workers : int, optional
+            If set, the calculations are read in parallel using at most this many
+            workers.
+        executor : str
+            Either "thread" or "process" to select whether the workers are threads or
+            processes.
         """
         base = cls()
+        base._set_parallelization(workers, executor)
         refinement = _match_combine_with_refinement(cls.__name__)
         setattr(base, f"_{cls.__name__.lower()}", {})
         for key, path in paths.items():
@@ -69,7 +134,12 @@ class BaseCombine:
         return base
 
     @classmethod
-    def from_files(cls, files: Dict[str, List[pathlib.Path]]):
+    def from_files(
+        cls,
+        files: Dict[str, List[pathlib.Path]],
+        workers: Optional[int] = None,
+        executor: str = "thread",
+    ):
         """Set up a BaseCombine object for files.
 
         Setup the object for files by passing in a dictionary with the name of the
@@ -80,8 +150,15 @@ class BaseCombine:
         files : Dict[str, List[pathlib.Path]]
             A dictionary with the name of the calculation as key and the path to the
             calculation as value.
+        workers : int, optional
+            If set, the calculations are read in parallel using at most this many
+            workers.
+        executor : str
+            Either "thread" or "process" to select whether the workers are threads or
+            processes.
         """
         base = cls()
+        base._set_parallelization(workers, executor)
         refinement = _match_combine_with_refinement(cls.__name__)
         setattr(base, f"_{cls.__name__.lower()}", {})
         for key, file in files.items():
@@ -89,16 +166,168 @@ class BaseCombine:
             base.__getattribute__(f"_{cls.__name__.lower()}")[key] = all_refinements
         return base
 
-    def _to_dict(self, *args, **kwargs):
+    def _set_parallelization(self, workers, executor):
+        _get_executor(executor)
+        self._workers = workers
+        self._executor = executor
+
+    def _to_dict(self, *args, parallel=None, **kwargs):
+        tasks = list(self._tasks())
+        results = list(
+            self._read_tasks(tasks, args, kwargs, parallel, _read_refinement)
+        )
+        _data = {key: [] for key in self._refinements()}
+        for (key, _), result in zip(tasks, results):
+            _data[key].append(result)
+        _warn_about_failures(tasks, results)
+        return _data
+
+    def _to_stack(self, *args, parallel=None, **kwargs):
+        tasks = list(self._tasks())
+        results = self._read_tasks(tasks, args, kwargs, parallel, _read_leaves)
         _data = {}
-        _class_name = f"_{self.__class__.__name__.lower()}"
-        keyval_refinements = self.__getattribute__(_class_name).items()
-        for key, refinement in keyval_refinements:
-            _data[key] = [
-                _refinement.read(*args, **kwargs) for _refinement in refinement
-            ]
+        for key, refinements in self._refinements().items():
+            key_results = itertools.islice(results, len(refinements))
+            _data[key] = _stack(key_results, len(refinements), self._per_atom)
         return _data
 
-    def read(self, *args, **kwargs):
-        """Read the data from the :meth:`read` method of the refinement class."""
-        return self._to_dict(*args, **kwargs)
+    def _refinements(self):
+        return self.__getattribute__(f"_{self.__class__.__name__.lower()}")
+
+    def _tasks(self):
+        for key, refinement in self._refinements().items():
+            for _refinement in refinement:
+                yield key, _refinement
+
+    def _read_tasks(self, tasks, args, kwargs, parallel, read):
+        if parallel is None:
+            parallel = self._workers is not None
+        if not parallel:
+            for _, refinement in tasks:
+                result = read(refinement, args, kwargs)
+                if isinstance(result, exception.Py4VaspError):
+                    raise result
+                yield result
+            return
+        executor = _get_executor(self._executor)
+        with executor(max_workers=self._workers) as pool:
+            yield from pool.map(
+                read,
+                (refinement for _, refinement in tasks),
+                (args for _ in tasks),
+                (kwargs for _ in tasks),
+            )
+
+    def read(self, *args, parallel=None, stack=False, **kwargs):
+        """Read the data from the :meth:`read` method of the refinement class.
+
+        Parameters
+        ----------
+        parallel : bool, optional
+            Read the calculations concurrently. Defaults to True if the number of
+            workers was set when creating the object. If reading a calculation fails
+            in parallel mode, the remaining calculations are still read and the
+            exception is returned in place of the data of the failed calculation.
+        stack : bool
+            If set, the results of all calculations are combined into contiguous
+            arrays instead of a list with one dictionary per calculation. Quantities
+            with a fixed shape get an additional leading dimension for the
+            calculations. Quantities with one entry per ion are concatenated along
+            the first axis; the additional "offsets" array indicates that the ions of
+            the i-th calculation are in the range `offsets[i]:offsets[i+1]`.
+        *args, **kwargs
+            Passed on to the :meth:`read` method of the refinement class.
+        """
+        if stack:
+            return self._to_stack(*args, parallel=parallel, **kwargs)
+        return self._to_dict(*args, parallel=parallel, **kwargs)
+
+
+def _stack(results, number_calculations, per_atom):
+    fixed = {}
+    ragged = {path: [] for path in per_atom}
+    expected_paths = None
+    for index, leaves in enumerate(results):
+        if isinstance(leaves, exception.Py4VaspError):
+            raise leaves
+        if expected_paths is None:
+            expected_paths = set(leaves)
+            _raise_error_if_per_atom_missing(expected_paths, per_atom)
+            fixed = _allocate(leaves, number_calculations, per_atom)
+        _raise_error_if_paths_differ(expected_paths, leaves, index)
+        for path, value in leaves.items():
+            if path in ragged:
+                ragged[path].append(value)
+            else:
+                fixed[path][index] = value
+    if expected_paths is None:
+        return {}
+    stacked = {**fixed, **_concatenate(ragged)}
+    if per_atom:
+        number_ions = [len(value) for value in ragged[per_atom[0]]]
+        stacked[("offsets",)] = np.cumsum([0, *number_ions], dtype=np.int_)
+    return _unflatten(stacked)
+
+
+def _raise_error_if_per_atom_missing(paths, per_atom):
+    missing = [path for path in per_atom if path not in paths]
+    if not missing:
+        return
+    message = (
+        "The data of the calculations cannot be stacked, because the entries "
+        f"{_format_paths(missing)} with one value per ion are missing."
+    )
+    raise exception.IncorrectUsage(message)
+
+
+def _raise_error_if_paths_differ(expected_paths, leaves, index):
+    paths = set(leaves)
+    if paths == expected_paths:
+        return
+    message = (
+        f"The data of calculation {index} cannot be stacked with the first one, "
+        "because the entries differ. Missing entries: "
+        f"{_format_paths(expected_paths - paths)}; additional entries: "
+        f"{_format_paths(paths - expected_paths)}."
+    )
+    raise exception.IncorrectUsage(message)
+
+
+def _format_paths(paths):
+    return ", ".join(sorted("/".join(path) for path in paths)) or "none"
+
+
+def _unflatten(leaves):
+    result = {}
+    for path, value in leaves.items():
+        node = result
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return result
+
+
+def _allocate(leaves, number_calculations, per_atom):
+    return {
+        path: np.empty(
+            (number_calculations,) + np.shape(value), np.asarray(value).dtype
+        )
+        for path, value in leaves.items()
+        if path not in per_atom
+    }
+
+
+def _concatenate(ragged):
+    return {path: np.concatenate(values) for path, values in ragged.items()}
+
+
+def _warn_about_failures(tasks, results):
+    failures = [
+        f"{repr(refinement)}: {result}"
+        for (_, refinement), result in zip(tasks, results)
+        if isinstance(result, exception.Py4VaspError)
+    ]
+    if not failures:
+        return
+    message = f"Reading {len(failures)} of {len(tasks)} calculations failed:\n"
+    warnings.warn(message + "\n".join(failures), UserWarning)
@@ -5,5 +5,12 @@ from py4vasp._combine.base import BaseCombine
 
 
 class Forces(BaseCombine):
+    _per_atom = (
+        ("forces",),
+        ("structure", "positions"),
+        ("structure", "elements"),
+        ("structure", "names"),
+    )
+
     def __init__(self):
         pass
@@ -5,5 +5,11 @@ from py4vasp._combine.base import BaseCombine
 
 
 class Stresses(BaseCombine):
+    _per_atom = (
+        ("structure", "positions"),
+        ("structure", "elements"),
+        ("structure", "names"),
+    )
+
     def __init__(self):
         pass
@@ -5,11 +5,11 @@ import dataclasses
 import functools
 import pathlib
 
-import h5py
-
 from py4vasp import exception, raw
+from py4vasp._raw.cache import data_cache
 from py4vasp._raw.definition import DEFAULT_FILE, DEFAULT_SOURCE, schema
 from py4vasp._raw.mapping import Mapping
+from py4vasp._raw.pool import file_pool, open_file
 from py4vasp._raw.schema import Length, Link, error_message
 from py4vasp._util import convert
 
@@ -63,13 +63,17 @@ class _State:
         self._file = file
 
     def access(self, quantity, source):
-        source = self._get_source(quantity, source)
+        name = source or DEFAULT_SOURCE
+        source = self._get_source(quantity, name)
         filename = self._file or source.file or DEFAULT_FILE
         path = self._path / pathlib.Path(filename)
-        if source.data is not None:
-            return self._access_data_from_hdf5(quantity, source, path)
-        else:
+        if source.data is None:
             return source.data_factory(path)
+        key = data_cache.make_key(path, quantity, name)
+        if (raw_data := data_cache.get(key)) is not None:
+            return raw_data
+        raw_data = self._access_data_from_hdf5(quantity, source, path)
+        return data_cache.store(key, raw_data)
 
     def _get_source(self, quantity, source):
         source = source or DEFAULT_SOURCE
@@ -88,26 +92,12 @@ class _State:
     def _open_file(self, filename):
         if filename in self._files:
             return self._files[filename]
+        elif file_pool.is_active:
+            file = self.exit_stack.enter_context(file_pool.pinned(filename))
         else:
-            file = self._create_and_enter_context(filename)
-            self._files[filename] = file
-            return file
-
-    def _create_and_enter_context(self, filename):
-        try:
-            h5f = h5py.File(filename, "r")
-        except FileNotFoundError as error:
-            message = (
-                f"{filename} could not be opened. Please make sure the file exists."
-            )
-            raise exception.FileAccessError(message) from error
-        except OSError as error:
-            message = (
-                f"Error when reading from {filename}. Please check whether the file "
-                "format is correct and you have the permissions to read it."
-            )
-            raise exception.FileAccessError(message)
-        return self.exit_stack.enter_context(h5f)
+            file = self.exit_stack.enter_context(open_file(filename))
+        self._files[filename] = file
+        return file
 
     def _check_version(self, h5f, required, quantity):
         if not required:
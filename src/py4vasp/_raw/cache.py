@@ -0,0 +1,215 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Memoize the raw data read from the HDF5 files.
+
+Resolving a quantity requires looking up the schema, checking the version of the file,
+and wrapping every dataset. Linked quantities repeat this process recursively. The
+data cache stores the resolved raw dataclasses with all datasets read into memory,
+so that repeated accesses to the same quantity do not touch the file at all. The
+cached arrays are read-only and every access returns a copy, so that modifying the
+returned data does not affect subsequent reads. An entry becomes invalid as soon as the
+file is modified. The cache is opt-in via :meth:`DataCache.enable`.
+"""
+import collections
+import dataclasses
+import threading
+
+import numpy as np
+
+from py4vasp._raw.data_wrapper import VaspData
+from py4vasp._raw.pool import file_key
+
+DEFAULT_MAX_BYTES = 256 * 1024**2
+DEFAULT_MAX_DATASET_BYTES = 16 * 1024**2
+
+
+class _Uncacheable(Exception):
+    "Raised when the raw data contains datasets too large to be kept in memory."
+
+
+@dataclasses.dataclass
+class _Entry:
+    data: object
+    nbytes: int
+
+
+class DataCache:
+    """Cache the raw data of quantities keyed by file, quantity, and source.
+
+    Only datasets smaller than `max_dataset_bytes` are read into memory. A quantity
+    referring to a larger dataset is not cached and read from the file as usual. When
+    the total size of the cached data exceeds `max_bytes`, the least recently used
+    entries are evicted.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Memory budget of the cache in bytes.
+    max_dataset_bytes : int
+        Size of the largest dataset that is read into memory.
+    """
+
+    def __init__(
+        self, max_bytes=DEFAULT_MAX_BYTES, max_dataset_bytes=DEFAULT_MAX_DATASET_BYTES
+    ):
+        self.max_bytes = max_bytes
+        self.max_dataset_bytes = max_dataset_bytes
+        self.hits = 0
+        self.misses = 0
+        self._enabled = False
+        self._entries = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def is_active(self):
+        "Returns whether raw data is currently cached."
+        return self._enabled
+
+    @property
+    def nbytes(self):
+        "Total size of the data in the cache in bytes."
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def enable(self, max_bytes=None, max_dataset_bytes=None):
+        """Cache the raw data of all subsequent accesses in this process.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            If set, overwrite the memory budget of the cache.
+        max_dataset_bytes : int, optional
+            If set, overwrite the size of the largest dataset read into memory.
+        """
+        with self._lock:
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            if max_dataset_bytes is not None:
+                self.max_dataset_bytes = max_dataset_bytes
+            self._enabled = True
+            self._evict()
+
+    def disable(self):
+        "Stop caching and release all cached data."
+        with self._lock:
+            self._enabled = False
+            self.clear()
+
+    def clear(self):
+        "Remove all entries and reset the hit and miss counters."
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def make_key(self, filename, quantity, source):
+        "Return the key for the given quantity or None if the cache is inactive."
+        if not self.is_active:
+            return None
+        return file_key(filename), quantity, source
+
+    def get(self, key):
+        "Return the cached raw data for the key or None if it is not available."
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return _copy(entry.data)
+
+    def store(self, key, raw_data):
+        """Read all datasets of the raw data into memory and add it to the cache.
+
+        Returns
+        -------
+        A copy of the raw data with all datasets read into memory if it could be cached
+        or the original raw data otherwise.
+        """
+        if key is None:
+            return raw_data
+        try:
+            materialized, nbytes = self._materialize(raw_data, seen=set())
+        except _Uncacheable:
+            return raw_data
+        if nbytes > self.max_bytes:
+            return raw_data
+        with self._lock:
+            self._entries[key] = _Entry(materialized, nbytes)
+            self._evict()
+        return _copy(materialized)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _materialize(self, value, seen):
+        if isinstance(value, VaspData):
+            return self._materialize_vasp_data(value, seen)
+        if isinstance(value, list):
+            return self._materialize_sequence(value, seen)
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return self._materialize_dataclass(value, seen)
+        return value, 0
+
+    def _materialize_vasp_data(self, data, seen):
+        if data.is_none():
+            return data, 0
+        if isinstance(data.data, np.ndarray):
+            # linked quantities are already in memory; freeze a view so that the
+            # original array remains writable
+            array = data.data.view()
+        else:
+            nbytes = data.size * data.dtype.itemsize
+            if nbytes > self.max_dataset_bytes:
+                raise _Uncacheable
+            array = np.asarray(data)
+        array.setflags(write=False)
+        # several fields may refer to the same dataset, count its size only once
+        nbytes = 0 if id(data.data) in seen else array.nbytes
+        seen.add(id(data.data))
+        return VaspData(array), nbytes
+
+    def _materialize_sequence(self, values, seen):
+        results = [self._materialize(value, seen) for value in values]
+        return [value for value, _ in results], sum(nbytes for _, nbytes in results)
+
+    def _materialize_dataclass(self, data, seen):
+        changes = {}
+        total = 0
+        for field in dataclasses.fields(data):
+            value = getattr(data, field.name)
+            changes[field.name], nbytes = self._materialize(value, seen)
+            total += nbytes
+        return dataclasses.replace(data, **changes), total
+
+    def _evict(self):
+        if not self._entries:
+            return
+        latest = {}
+        for key in self._entries:
+            latest[key[0][0]] = key[0]
+        for key in [key for key in self._entries if latest[key[0][0]] != key[0]]:
+            del self._entries[key]
+        while self.nbytes > self.max_bytes:
+            self._entries.popitem(last=False)
+
+
+def _copy(value):
+    if isinstance(value, VaspData):
+        if value.is_none() or not isinstance(value.data, np.ndarray):
+            return value
+        return VaspData(np.array(value.data))
+    if isinstance(value, list):
+        return [_copy(element) for element in value]
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        changes = {
+            field.name: _copy(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+        return dataclasses.replace(value, **changes)
+    return value
+
+
+data_cache = DataCache()
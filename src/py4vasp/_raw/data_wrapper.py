@@ -2,6 +2,7 @@
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import textwrap
 
+import h5py
 import numpy as np
 
 from py4vasp import exception
@@ -21,6 +22,11 @@ class VaspData(np.lib.mixins.NDArrayOperatorsMixin):
     this way will access the file. If performance is an issue, make sure that this
     file I/O is reduced as much as possible.
 
+    Indexing the data reads only the selected hyperslab from the file. If you need to
+    apply several index operations successively, use the :attr:`lazy` indexer. It
+    composes the index expressions without reading any data; the file is accessed
+    only when the result is converted into an array.
+
     Parameters
     ----------
     data
@@ -48,6 +54,8 @@ class VaspData(np.lib.mixins.NDArrayOperatorsMixin):
         return np.array(self.data, *args, **kwargs)
 
     def __getitem__(self, key):
+        if isinstance(self.data, (h5py.Dataset, _LazyView)):
+            return _read(_LazyView.from_data(self.data)[key])
         return self.data[key]
 
     def __repr__(self):
@@ -90,6 +98,17 @@ class VaspData(np.lib.mixins.NDArrayOperatorsMixin):
         "Describes the type of the contained data."
         return self.data.dtype
 
+    @property
+    def lazy(self):
+        """Index the data without reading it.
+
+        >>> data.lazy[1000:2000].lazy[:, 3]
+
+        returns a VaspData object, that reads only the third component of the
+        selected steps once it is converted to an array.
+        """
+        return _LazyIndexer(self.data)
+
     def astype(self, *args, **kwargs):
         "Copy of the array, cast to a specified type."
         if self.is_none():
@@ -101,3 +120,198 @@ def _parse_scalar(data):
     if data.dtype.type == np.bytes_:
         data = data[()].decode()
     return np.array(data)
+
+
+class _LazyIndexer:
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        if isinstance(self._data, (h5py.Dataset, _LazyView)):
+            return VaspData(_LazyView.from_data(self._data)[key])
+        return VaspData(self._data[key])
+
+
+class _LazyView:
+    """Compose index expressions on a HDF5 dataset and read only the final selection.
+
+    For every dimension of the dataset, the view stores either an integer (the
+    dimension was indexed away), a range (basic slicing), or an array of indices. This
+    corresponds to orthogonal indexing, which is the same as numpy indexing when every
+    index expression contains at most one array."""
+
+    def __init__(self, dataset, indices):
+        self._dataset = dataset
+        self._indices = indices
+
+    @classmethod
+    def from_data(cls, data):
+        if isinstance(data, _LazyView):
+            return data
+        return cls(data, tuple(range(length) for length in data.shape))
+
+    @property
+    def shape(self):
+        return tuple(len(index) for index in self._indices if _is_kept(index))
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    @property
+    def dtype(self):
+        return self._dataset.dtype
+
+    def __len__(self):
+        if self.ndim == 0:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({repr(self._dataset)}, shape={self.shape})"
+
+    def __array__(self, dtype=None, copy=None):
+        result = np.asarray(self.read())
+        return result if dtype is None else result.astype(dtype, copy=False)
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        if not _is_orthogonal(key):
+            return self.read()[key]
+        key = _expand_ellipsis(key, self.ndim)
+        kept_indices = iter(key)
+        indices = tuple(
+            _compose(index, next(kept_indices)) if _is_kept(index) else index
+            for index in self._indices
+        )
+        view = _LazyView(self._dataset, indices)
+        if _advanced_indices_adjacent(key):
+            return view
+        # numpy moves the dimension of the array to the front in this case
+        position = sum(
+            isinstance(element, slice) for element in key[: _array_position(key)]
+        )
+        return np.moveaxis(view.read(), position, 0)
+
+    def read(self):
+        "Read the selected data from the file."
+        hdf5_key, post_selection = _split_indices(self._indices)
+        result = self._dataset[hdf5_key]
+        for axis, selection in post_selection:
+            if isinstance(selection, slice):
+                result = result[(slice(None),) * axis + (selection,)]
+            else:
+                result = np.take(result, selection, axis=axis)
+        return result
+
+
+def _read(view_or_array):
+    if isinstance(view_or_array, _LazyView):
+        return view_or_array.read()
+    return view_or_array
+
+
+def _is_kept(index):
+    return not isinstance(index, int)
+
+
+def _is_orthogonal(key):
+    arrays = [element for element in key if _is_array_like(element)]
+    if any(element is None for element in key) or len(arrays) > 1:
+        return False
+    return all(np.ndim(array) == 1 for array in arrays)
+
+
+def _is_array_like(element):
+    return not isinstance(element, (int, np.integer, slice)) and element is not ...
+
+
+def _array_position(key):
+    return next((i for i, element in enumerate(key) if _is_array_like(element)), None)
+
+
+def _advanced_indices_adjacent(key):
+    if _array_position(key) is None:
+        return True
+    advanced = [i for i, element in enumerate(key) if not isinstance(element, slice)]
+    return advanced[-1] - advanced[0] == len(advanced) - 1
+
+
+def _expand_ellipsis(key, ndim):
+    number_ellipsis = sum(element is ... for element in key)
+    if number_ellipsis > 1:
+        raise IndexError("an index can only have a single ellipsis ('...')")
+    if len(key) - number_ellipsis > ndim:
+        message = f"too many indices for array: array is {ndim}-dimensional, but {len(key) - number_ellipsis} were indexed"
+        raise IndexError(message)
+    missing = (slice(None),) * (ndim - len(key) + number_ellipsis)
+    if number_ellipsis == 0:
+        return key + missing
+    position = next(i for i, element in enumerate(key) if element is ...)
+    return key[:position] + missing + key[position + 1 :]
+
+
+def _compose(index, key):
+    if isinstance(key, (int, np.integer)):
+        return int(index[key])
+    if isinstance(key, slice):
+        return index[key]
+    key = np.asarray(key)
+    if key.dtype == np.bool_:
+        if len(key) != len(index):
+            message = f"boolean index did not match indexed array along axis; size of axis is {len(index)} but size of corresponding boolean axis is {len(key)}"
+            raise IndexError(message)
+        key = np.flatnonzero(key)
+    elif key.size == 0:
+        key = key.astype(np.int_)
+    elif not np.issubdtype(key.dtype, np.integer):
+        raise IndexError("arrays used as indices must be of integer (or boolean) type")
+    key = np.where(key < 0, key + len(index), key)
+    if np.any(key < 0) or np.any(key >= len(index)):
+        raise IndexError(f"index out of bounds for axis with size {len(index)}")
+    if isinstance(index, range):
+        return index.start + index.step * key
+    return index[key]
+
+
+def _split_indices(indices):
+    hdf5_key = []
+    post_selection = []
+    axis = 0
+    # h5py accepts a list of indices only for a single axis
+    fancy_allowed = True
+    for index in indices:
+        if not _is_kept(index):
+            hdf5_key.append(index)
+            continue
+        hdf5_index, selection = _split_index(index, fancy_allowed)
+        hdf5_key.append(hdf5_index)
+        fancy_allowed = fancy_allowed and not isinstance(hdf5_index, np.ndarray)
+        if selection is not None:
+            post_selection.append((axis, selection))
+        axis += 1
+    return tuple(hdf5_key), post_selection
+
+
+def _split_index(index, fancy_allowed):
+    if len(index) == 0:
+        return slice(0, 0), None
+    if isinstance(index, range):
+        if index.step > 0:
+            return slice(index[0], index[-1] + 1, index.step), None
+        return slice(index[-1], index[0] + 1, -index.step), slice(None, None, -1)
+    unique, inverse = np.unique(index, return_inverse=True)
+    lower = unique[0]
+    bounding_box = slice(lower, unique[-1] + 1)
+    # read the bounding box if most of it is needed, because h5py selects the
+    # indices individually; otherwise read only the unique indices
+    if not fancy_allowed or 2 * len(unique) > bounding_box.stop - lower:
+        return bounding_box, index - lower
+    if len(unique) == len(index) and np.array_equal(unique, index):
+        return unique, None
+    # restore the requested order and duplicates in memory
+    return unique, inverse.reshape(-1)
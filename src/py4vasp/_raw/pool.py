@@ -0,0 +1,235 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+"""Keep HDF5 files open across multiple accesses of the VASP output.
+
+By default, every access to the raw data opens the HDF5 file and closes it again at
+the end of the context. For scripts that access the same file many times, this
+overhead can dominate the run time. The file pool keeps the files open and reuses the
+handles as long as the file did not change on disk. The pool is opt-in either for the
+whole process via :meth:`FilePool.enable` or temporarily via :meth:`FilePool.session`.
+"""
+import collections
+import contextlib
+import dataclasses
+import os
+import pathlib
+import threading
+
+import h5py
+
+from py4vasp import exception
+
+DEFAULT_MAX_OPEN_FILES = 32
+
+
+def open_file(filename):
+    "Open the HDF5 file for reading and convert errors into py4vasp exceptions."
+    try:
+        return h5py.File(filename, "r")
+    except FileNotFoundError as error:
+        message = f"{filename} could not be opened. Please make sure the file exists."
+        raise exception.FileAccessError(message) from error
+    except OSError as error:
+        message = (
+            f"Error when reading from {filename}. Please check whether the file "
+            "format is correct and you have the permissions to read it."
+        )
+        raise exception.FileAccessError(message)
+
+
+@dataclasses.dataclass
+class _Handle:
+    file: h5py.File
+    path: str
+    pins: int = 0
+
+
+class FilePool:
+    """A process-wide pool of open HDF5 files.
+
+    Files are identified by their resolved path together with their inode,
+    modification time and size. If VASP overwrites a file, the old handle becomes
+    stale and a new one is opened. When more than `max_open_files` are open, the
+    least recently used handles are closed unless they are pinned by an active
+    session or are currently read from.
+
+    Parameters
+    ----------
+    max_open_files : int
+        Maximal number of files kept open simultaneously.
+    """
+
+    def __init__(self, max_open_files=DEFAULT_MAX_OPEN_FILES):
+        self.max_open_files = max_open_files
+        self._enabled = False
+        self._handles = collections.OrderedDict()
+        self._number_sessions = 0
+        self._local = threading.local()
+        self._lock = threading.RLock()
+
+    @property
+    def is_active(self):
+        "Returns whether files are currently opened through the pool."
+        return self._enabled or self._number_sessions > 0
+
+    def enable(self, max_open_files=None):
+        """Keep files open for all subsequent accesses in this process.
+
+        Parameters
+        ----------
+        max_open_files : int, optional
+            If set, overwrite the maximal number of files kept open.
+        """
+        with self._lock:
+            if max_open_files is not None:
+                self.max_open_files = max_open_files
+            self._enabled = True
+            self._evict()
+
+    def disable(self):
+        "Stop using the pool and close all files that are not used by a session."
+        with self._lock:
+            self._enabled = False
+            self._evict()
+
+    @contextlib.contextmanager
+    def session(self):
+        """Keep all files opened within this context open until the context exits.
+
+        Sessions can be nested. Inside a session, the pool is active even if it was
+        not enabled. The files opened in a session are not closed before the session
+        ends even if the number of open files exceeds the limit. A session belongs to
+        the thread that entered it, i.e., files opened by other threads are not kept
+        open by it.
+        """
+        pinned = set()
+        with self._lock:
+            self._sessions.append(pinned)
+            self._number_sessions += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._sessions.remove(pinned)
+                self._number_sessions -= 1
+                for key in pinned:
+                    self._handles[key].pins -= 1
+                self._evict()
+
+    def open(self, filename):
+        """Return an open handle to the given file.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            Name of the HDF5 file that should be opened.
+
+        Returns
+        -------
+        h5py.File
+            The file opened for reading. Do not close the file yourself, the pool
+            takes care of it.
+        """
+        key = file_key(filename)
+        with self._lock:
+            handle = self._get_handle(key, filename)
+            self._evict()
+            return handle.file
+
+    @contextlib.contextmanager
+    def pinned(self, filename):
+        """Keep the file open while the context is active.
+
+        In contrast to :meth:`open`, the file is not closed when other files are
+        opened, even if the number of open files exceeds the limit. Use this if other
+        accesses, e.g. in other threads, may open files while you read from this one.
+
+        Parameters
+        ----------
+        filename : str or pathlib.Path
+            Name of the HDF5 file that should be opened.
+
+        Returns
+        -------
+        ContextManager[h5py.File]
+            Entering the context provides the file opened for reading. Do not close
+            the file yourself, the pool takes care of it.
+        """
+        key = file_key(filename)
+        with self._lock:
+            handle = self._get_handle(key, filename)
+            handle.pins += 1
+            self._evict()
+        try:
+            yield handle.file
+        finally:
+            with self._lock:
+                handle.pins -= 1
+                self._evict()
+
+    def close(self):
+        "Close all files in the pool, that are not pinned by a session or a reader."
+        with self._lock:
+            for key in self._unpinned_keys():
+                self._handles.pop(key).file.close()
+
+    def __len__(self):
+        return len(self._handles)
+
+    def _get_handle(self, key, filename):
+        if key in self._handles:
+            self._handles.move_to_end(key)
+        else:
+            self._handles[key] = _Handle(open_file(filename), path=key[0])
+        self._pin(key)
+        return self._handles[key]
+
+    @property
+    def _sessions(self):
+        # every thread pins the files in its own innermost session
+        if not hasattr(self._local, "sessions"):
+            self._local.sessions = []
+        return self._local.sessions
+
+    def _pin(self, key):
+        if not self._sessions or key in self._sessions[-1]:
+            return
+        self._sessions[-1].add(key)
+        self._handles[key].pins += 1
+
+    def _evict(self):
+        if not self.is_active:
+            self.close()
+            return
+        for key in self._stale_keys():
+            self._handles.pop(key).file.close()
+        excess = len(self._handles) - self.max_open_files
+        for key in self._unpinned_keys()[: max(excess, 0)]:
+            self._handles.pop(key).file.close()
+
+    def _stale_keys(self):
+        latest = {}
+        for key in self._handles:
+            latest[key[0]] = key
+        return [
+            key
+            for key, handle in self._handles.items()
+            if handle.pins == 0 and latest[key[0]] != key
+        ]
+
+    def _unpinned_keys(self):
+        return [key for key, handle in self._handles.items() if handle.pins == 0]
+
+
+def file_key(filename):
+    "Identify the file by its resolved path, inode, modification time, and size."
+    path = pathlib.Path(filename).resolve()
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError as error:
+        message = f"{filename} could not be opened. Please make sure the file exists."
+        raise exception.FileAccessError(message) from error
+    return str(path), stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+file_pool = FilePool()
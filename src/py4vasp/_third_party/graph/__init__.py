@@ -14,7 +14,8 @@ from .series import Series
 go = import_.optional("plotly.graph_objects")
 pio = import_.optional("plotly.io")
 
-if import_.is_imported(go) and import_.is_imported(pio):
+
+def _register_vasp_template():
     axis_format = {"showexponent": "all", "exponentformat": "power"}
     contour = copy.copy(pio.templates["ggplot2"].data.contour[0])
     begin_red = [0, VASP_COLORS["red"]]
@@ -27,3 +28,7 @@ if import_.is_imported(go) and import_.is_imported(pio):
     pio.templates["vasp"] = go.layout.Template(data=data, layout=layout)
     pio.templates["ggplot2"].layout.shapedefaults = {}
     pio.templates.default = "ggplot2+vasp"
+
+
+# registering the template requires importing plotly, which is slow
+import_.on_import("plotly", _register_vasp_template)
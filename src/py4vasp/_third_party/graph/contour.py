@@ -3,18 +3,21 @@
 from __future__ import annotations
 
 import dataclasses
-import itertools
+import math
 
 import numpy as np
 
 from py4vasp import _config
 from py4vasp._third_party.graph import trace
-from py4vasp._util import import_
+from py4vasp._util import import_, slicing
 from py4vasp._util.slicing import Plane
 
 ff = import_.optional("plotly.figure_factory")
 go = import_.optional("plotly.graph_objects")
-interpolate = import_.optional("scipy.interpolate")
+
+_INSIDE_TOLERANCE = 1e-10
+_BARB_SCALE = 0.3
+_BARB_ANGLE = np.pi / 9
 
 
 @dataclasses.dataclass
@@ -57,6 +60,9 @@ class Contour(trace.Trace):
     scale_arrows: float = None
     """Scale arrows by this factor when converting their length to Å. None means
     autoscale them so that the arrows do not overlap."""
+    use_webgl: bool = False
+    """Draw all arrows of a quiver plot as a single WebGL trace. This renders much
+    faster if there are many arrows."""
 
     def to_plotly(self):
         lattice_supercell = np.diag(self.supercell) @ self.lattice.vectors
@@ -113,24 +119,57 @@ class Contour(trace.Trace):
             scale = max_length / current_max_length
         else:
             scale = self.scale_arrows
-        x, y = np.array([sum(points) for points in itertools.product(*meshes)]).T
-        u = scale * subsampled_data[:, :, 0].flatten()
-        v = scale * subsampled_data[:, :, 1].flatten()
+        positions = meshes[0][:, np.newaxis] + meshes[1][np.newaxis, :]
+        x, y = positions.reshape(-1, 2).T
+        u, v = scale * subsampled_data.reshape(-1, 2).T
+        if self.use_webgl:
+            return self._make_webgl_quiver(x, y, u, v)
         fig = ff.create_quiver(x, y, u, v, scale=1)
         fig.data[0].line.color = _config.VASP_COLORS["dark"]
         return fig.data[0]
 
+    def _make_webgl_quiver(self, x, y, u, v):
+        # Use the same geometry as plotly's quiver: a line from the position to the tip
+        # and two barbs with 30% of the length of the arrow at an angle of 20°.
+        tip_x = x + u
+        tip_y = y + v
+        angle = np.arctan2(v, u)
+        barb_length = _BARB_SCALE * np.hypot(u, v)
+        barbs_x = [
+            tip_x - barb_length * np.cos(angle + sign * _BARB_ANGLE) for sign in (1, -1)
+        ]
+        barbs_y = [
+            tip_y - barb_length * np.sin(angle + sign * _BARB_ANGLE) for sign in (1, -1)
+        ]
+        separator = np.full_like(x, np.nan)
+        # every arrow is drawn as start, tip, gap, first barb, tip, second barb, gap
+        line_x = np.stack(
+            (x, tip_x, separator, barbs_x[0], tip_x, barbs_x[1], separator)
+        )
+        line_y = np.stack(
+            (y, tip_y, separator, barbs_y[0], tip_y, barbs_y[1], separator)
+        )
+        return go.Scattergl(
+            x=line_x.T.flatten(),
+            y=line_y.T.flatten(),
+            mode="lines",
+            line={"color": _config.VASP_COLORS["dark"]},
+            name=self.label,
+        )
+
     def _limit_number_of_arrows(self, data_size):
-        subsamples = [1, 1]
         if self.max_number_arrows is None:
-            return subsamples
-        data_size /= 2  # ignore dimension of arrow
-        while data_size / np.prod(subsamples) > self.max_number_arrows:
-            if subsamples[0] <= subsamples[1]:
-                subsamples[0] += 1
-            else:
-                subsamples[1] += 1
-        return subsamples
+            return [1, 1]
+        number_arrows = data_size // 2  # ignore dimension of arrow
+        # The subsampling is increased alternately along both axes starting with the
+        # first one until the number of arrows is below the limit. So we need the
+        # smallest factor whose square reduces the arrows sufficiently and check
+        # whether the previous step with one less along the second axis is enough.
+        reduction = max(-(-number_arrows // self.max_number_arrows), 1)
+        factor = math.isqrt(reduction - 1) + 1
+        if factor * (factor - 1) >= reduction:
+            return [factor, factor - 1]
+        return [factor, factor]
 
     def _interpolation_required(self):
         y_position_first_vector = self.lattice.vectors[0, 1]
@@ -146,15 +185,30 @@ class Contour(trace.Trace):
         line_mesh_a = self._make_mesh(lattice, data.shape[1], 0)
         line_mesh_b = self._make_mesh(lattice, data.shape[0], 1)
         x_in, y_in = (line_mesh_a[:, np.newaxis] + line_mesh_b[np.newaxis, :]).T
-        x_in = x_in.flatten()
-        y_in = y_in.flatten()
-        z_in = data.flatten()
-        x_out, y_out = np.meshgrid(
-            np.linspace(x_in.min(), x_in.max(), shape[0]),
-            np.linspace(y_in.min(), y_in.max(), shape[1]),
-        )
-        z_out = interpolate.griddata((x_in, y_in), z_in, (x_out, y_out), method="cubic")
-        return x_out[0], y_out[:, 0], z_out
+        x_out = np.linspace(x_in.min(), x_in.max(), shape[0])
+        y_out = np.linspace(y_in.min(), y_in.max(), shape[1])
+        z_out = self._interpolate_periodic_data(lattice, x_out, y_out)
+        # only show the data within the convex hull of the grid points
+        mesh = np.stack(np.meshgrid(x_out, y_out), axis=-1)
+        z_out[~self._inside_mesh(mesh @ np.linalg.inv(lattice), data.shape)] = np.nan
+        return x_out, y_out, z_out
+
+    def _interpolate_periodic_data(self, lattice, x, y):
+        # The data is periodic in the unit cell so the interpolation of the supercell
+        # can use the data without repetition. The grid points are shifted by half a
+        # spacing relative to the origin of the cell. The rows of the mesh correspond
+        # to the y coordinate.
+        to_fractional = np.linalg.inv(lattice) * self.supercell
+        shift = 0.5 / np.array(self.data.shape)
+        origin = np.array((x[0], y[0])) @ to_fractional - shift
+        steps = np.array(((0, _spacing(y)), (_spacing(x), 0))) @ to_fractional
+        shape = (len(y), len(x))
+        return slicing.fourier_mesh(self.data, origin, steps, shape)
+
+    def _inside_mesh(self, fractions, shape):
+        lower = 0.5 / np.array(shape[::-1]) - _INSIDE_TOLERANCE
+        upper = 1 - lower
+        return np.all((lower <= fractions) & (fractions <= upper), axis=-1)
 
     def _use_data_without_interpolation(self, lattice, data):
         x = self._make_mesh(lattice, data.shape[1], 0)
@@ -216,3 +270,7 @@ class Contour(trace.Trace):
                 "xshift": shifts[0],
                 "yshift": -shifts[1],
             }
+
+
+def _spacing(mesh):
+    return mesh[1] - mesh[0] if len(mesh) > 1 else 0
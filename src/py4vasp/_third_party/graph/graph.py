@@ -5,6 +5,7 @@ import uuid
 from collections.abc import Sequence
 from dataclasses import dataclass, fields, replace
 
+import h5py
 import numpy as np
 
 from py4vasp import exception
@@ -17,6 +18,12 @@ from py4vasp._util import import_
 go = import_.optional("plotly.graph_objects")
 subplots = import_.optional("plotly.subplots")
 pd = import_.optional("pandas")
+pa = import_.optional("pyarrow")
+parquet = import_.optional("pyarrow.parquet")
+feather = import_.optional("pyarrow.feather")
+
+WEBGL_THRESHOLD = 100_000
+"Graphs with more data points than this are rendered with WebGL by default."
 
 
 @dataclass
@@ -47,6 +54,10 @@ class Graph(Sequence):
     "Height of the resulting figure."
     title: str = None
     "Title of the graph."
+    webgl: bool = None
+    """Render the series with WebGL, merge multiple lines of a series into a single
+    trace, and decimate long lines. If not set, this is enabled automatically when the
+    graph contains more than `WEBGL_THRESHOLD` data points."""
     _frozen = False
 
     def __setattr__(self, key, value):
@@ -80,15 +91,21 @@ class Graph(Sequence):
     def to_plotly(self):
         "Convert the graph to a plotly figure."
         figure = self._make_plotly_figure()
+        traces, rows, shapes, annotations = [], [], [], []
         for trace, options in self._generate_plotly_traces():
-            if options.get("row") is None:
-                figure.add_trace(trace)
-            else:
-                figure.add_trace(trace, row=options["row"], col=1)
-            for shape in options.get("shapes", ()):
-                figure.add_shape(**shape)
-            for annotation in options.get("annotations", ()):
-                figure.add_annotation(**annotation)
+            traces.append(trace)
+            rows.append(options.get("row"))
+            shapes.extend(options.get("shapes", ()))
+            annotations.extend(options.get("annotations", ()))
+        # adding all traces at once avoids revalidating the figure for every trace
+        if any(row is not None for row in rows):
+            figure.add_traces(traces, rows=rows, cols=[1] * len(rows))
+        else:
+            figure.add_traces(traces)
+        for shape in shapes:
+            figure.add_shape(**shape)
+        for annotation in annotations:
+            figure.add_annotation(**annotation)
         return figure
 
     def show(self):
@@ -119,10 +136,18 @@ class Graph(Sequence):
 
     def _generate_plotly_traces(self):
         colors = itertools.cycle(VASP_COLORS)
+        use_webgl = self._use_webgl()
         for series in self:
             series = _set_color_if_not_present(series, colors)
+            series = _set_webgl_if_requested(series, use_webgl)
             yield from series.to_plotly()
 
+    def _use_webgl(self):
+        if self.webgl is not None:
+            return self.webgl
+        number_points = sum(np.size(_data_of_trace(series)) for series in self)
+        return number_points > WEBGL_THRESHOLD
+
     def _make_plotly_figure(self):
         figure = self._figure_with_one_or_two_y_axes()
         self._set_xaxis_options(figure)
@@ -202,11 +227,7 @@ class Graph(Sequence):
         Dataframe
             A pandas dataframe with columns for each series in the graph
         """
-        df = pd.DataFrame()
-        for series in np.atleast_1d(self.series):
-            _df = self._create_and_populate_df(series)
-            df = df.join(_df, how="outer")
-        return df
+        return pd.DataFrame(self._padded_columns())
 
     def to_csv(self, filename):
         """Export graph to a csv file.
@@ -222,16 +243,75 @@ class Graph(Sequence):
         df = self.to_frame()
         df.to_csv(filename, index=False)
 
-    def _create_and_populate_df(self, series):
-        df = pd.DataFrame()
-        df[self._name_column(series, "x", None)] = series.x
-        for idx, series_y in enumerate(np.atleast_2d(series.y)):
-            df[self._name_column(series, "y", idx)] = series_y
-        if series.width is not None:
-            assert series.width.ndim == series.y.ndim
-            for idx, series_width in enumerate(np.atleast_2d(series.width)):
-                df[self._name_column(series, "width", idx)] = series_width
-        return df
+    def to_parquet(self, filename, compression=None):
+        """Export graph to a Parquet file.
+
+        The columns are the same as for `to_frame`, but the arrays are passed to
+        pyarrow directly without building a dataframe or formatting them as text.
+
+        Parameters
+        ----------
+        filename: str | Path
+            Name of the exported Parquet file
+        compression: str
+            Compression codec supported by pyarrow, e.g., "snappy" or "zstd". By
+            default, the data is not compressed.
+        """
+        table = pa.table(self._padded_columns())
+        parquet.write_table(table, filename, compression=compression or "none")
+
+    def to_feather(self, filename, compression=None):
+        """Export graph to a Feather file.
+
+        The columns are the same as for `to_frame`, but the arrays are passed to
+        pyarrow directly without building a dataframe or formatting them as text.
+
+        Parameters
+        ----------
+        filename: str | Path
+            Name of the exported Feather file
+        compression: str
+            Either "lz4" or "zstd" to compress the data. By default, the data is not
+            compressed.
+        """
+        table = pa.table(self._padded_columns())
+        feather.write_feather(
+            table, filename, compression=compression or "uncompressed"
+        )
+
+    def to_hdf(self, filename, compression=None):
+        """Export graph to an HDF5 file.
+
+        Every column of `to_frame` is written as a separate dataset at the root of the
+        file. Series of different length are not padded.
+
+        Parameters
+        ----------
+        filename: str | Path
+            Name of the exported HDF5 file
+        compression: str
+            Compression filter supported by h5py, e.g., "gzip" or "lzf". By default,
+            the data is not compressed.
+        """
+        with h5py.File(filename, "w") as h5f:
+            for name, column in self._columns():
+                h5f.create_dataset(name, data=column, compression=compression)
+
+    def _padded_columns(self):
+        # series of different length are padded with NaN at the end
+        columns = dict(self._columns())
+        length = max((len(column) for column in columns.values()), default=0)
+        return {name: _pad(column, length) for name, column in columns.items()}
+
+    def _columns(self):
+        for series in np.atleast_1d(self.series):
+            yield self._name_column(series, "x", None), np.asarray(series.x)
+            for idx, series_y in enumerate(np.atleast_2d(series.y)):
+                yield self._name_column(series, "y", idx), series_y
+            if series.width is not None:
+                assert series.width.ndim == series.y.ndim
+                for idx, series_width in enumerate(np.atleast_2d(series.width)):
+                    yield self._name_column(series, "width", idx), series_width
 
     def _name_column(self, series, suffix, idx=None):
         if series.label:
@@ -249,6 +329,14 @@ class Graph(Sequence):
         return any(has_subplot(series) for series in self)
 
 
+def _pad(column, length):
+    if len(column) == length:
+        return column
+    return np.pad(
+        column.astype(np.float64), (0, length - len(column)), constant_values=np.nan
+    )
+
+
 def _set_color_if_not_present(series, color_iterator):
     if isinstance(series, Contour):
         return series
@@ -257,6 +345,18 @@ def _set_color_if_not_present(series, color_iterator):
     return series
 
 
+def _set_webgl_if_requested(series, use_webgl):
+    if not use_webgl or getattr(series, "use_webgl", True):
+        return series
+    return replace(series, use_webgl=True)
+
+
+def _data_of_trace(series):
+    if isinstance(series, Contour):
+        return series.data
+    return getattr(series, "y", ())
+
+
 Graph._fields = tuple(field.name for field in fields(Graph))
 
 
@@ -1,7 +1,6 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import abc
-import os
 
 from py4vasp._third_party.graph.graph import Graph
 from py4vasp._util import convert
@@ -50,14 +49,81 @@ class Mixin(abc.ABC):
         filename: str | Path
             Name of the csv file which the data is exported to.
         """
-        classname = convert.quantity_name(self.__class__.__name__).strip("_")
-        filename = filename if filename is not None else f"{classname}.csv"
-        if os.path.isabs(filename):
-            writeout_path = filename
-        else:
-            writeout_path = self._path / filename
         df = self.to_frame(*args, **kwargs)
-        df.to_csv(writeout_path, index=False)
+        df.to_csv(self._writeout_path(filename, "csv"), index=False)
+
+    def to_parquet(self, *args, filename=None, compression=None, **kwargs):
+        """Converts data to a Parquet file.
+
+        Parquet stores the data in a binary columnar format, which is much faster to
+        write and read than a csv file and can be compressed. The columns are the same
+        as the ones of the dataframe generated with the :py:meth:`to_frame` method.
+        This requires pyarrow to be installed.
+
+        If no filename is provided a default filename is deduced from the
+        name of the class. As for :py:meth:`to_csv`, the filename and compression
+        must be keyword arguments, all other arguments are passed on to the
+        :py:meth:`to_graph` function.
+
+        Parameters
+        ----------
+        filename: str | Path
+            Name of the Parquet file which the data is exported to.
+        compression: str
+            Compression codec, e.g., "snappy" or "zstd". By default, the data is not
+            compressed.
+        """
+        graph = self.to_graph(*args, **kwargs)
+        path = self._writeout_path(filename, "parquet")
+        graph.to_parquet(path, compression=compression)
+
+    def to_feather(self, *args, filename=None, compression=None, **kwargs):
+        """Converts data to a Feather file.
+
+        Feather stores the data in the binary Arrow format, which can be memory mapped
+        when reading the data. The columns are the same as the ones of the dataframe
+        generated with the :py:meth:`to_frame` method. This requires pyarrow to be
+        installed.
+
+        If no filename is provided a default filename is deduced from the
+        name of the class. As for :py:meth:`to_csv`, the filename and compression
+        must be keyword arguments, all other arguments are passed on to the
+        :py:meth:`to_graph` function.
+
+        Parameters
+        ----------
+        filename: str | Path
+            Name of the Feather file which the data is exported to.
+        compression: str
+            Either "lz4" or "zstd". By default, the data is not compressed.
+        """
+        graph = self.to_graph(*args, **kwargs)
+        path = self._writeout_path(filename, "feather")
+        graph.to_feather(path, compression=compression)
+
+    def to_hdf(self, *args, filename=None, compression=None, **kwargs):
+        """Converts data to an HDF5 file.
+
+        Every column of the dataframe generated with the :py:meth:`to_frame` method
+        is written as a separate dataset, so series of different length are not
+        padded.
+
+        If no filename is provided a default filename is deduced from the
+        name of the class. As for :py:meth:`to_csv`, the filename and compression
+        must be keyword arguments, all other arguments are passed on to the
+        :py:meth:`to_graph` function.
+
+        Parameters
+        ----------
+        filename: str | Path
+            Name of the HDF5 file which the data is exported to.
+        compression: str
+            Compression filter of h5py, e.g., "gzip" or "lzf". By default, the data is
+            not compressed.
+        """
+        graph = self.to_graph(*args, **kwargs)
+        path = self._writeout_path(filename, "h5")
+        graph.to_hdf(path, compression=compression)
 
     def plot(self, *args, **kwargs):
         """Wrapper around the :py:meth:`to_graph` function.
@@ -91,13 +157,12 @@ class Mixin(abc.ABC):
         on to the :py:meth:`to_graph` function. Please check the documentation of that function
         to learn which arguments are allowed."""
         fig = self.to_plotly(*args, **kwargs)
+        fig.write_image(self._writeout_path(filename, "png"))
+
+    def _writeout_path(self, filename, extension):
         classname = convert.quantity_name(self.__class__.__name__).strip("_")
-        filename = filename if filename is not None else f"{classname}.png"
-        if os.path.isabs(filename):
-            writeout_path = filename
-        else:
-            writeout_path = self._path / filename
-        fig.write_image(writeout_path)
+        filename = filename if filename is not None else f"{classname}.{extension}"
+        return convert.to_writeout_path(self._path, filename)
 
 
 def _merge_graphs(graphs):
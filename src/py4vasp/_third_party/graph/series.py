@@ -10,6 +10,10 @@ from py4vasp._util import import_
 
 go = import_.optional("plotly.graph_objects")
 
+MAX_POINTS_PER_LINE = 2000
+"""Lines rendered with WebGL are decimated to at most this many points by keeping the
+minimum and maximum within equally sized intervals."""
+
 
 @dataclass
 class Series(trace.Trace):
@@ -37,6 +41,13 @@ class Series(trace.Trace):
     "The color used for this series."
     marker: str = None
     "Which marker is used for the series, None defaults to line mode."
+    merge_lines: bool = False
+    """Combine all lines of the series into a single trace where the lines are
+    separated by gaps. This speeds up plotting many lines, e.g., a band structure."""
+    use_webgl: bool = False
+    """Render the series as a single WebGL trace. Multiple lines are merged as for
+    `merge_lines` and long lines are decimated, which reduces the size of the figure
+    substantially."""
     _frozen = False
 
     def __post_init__(self):
@@ -65,6 +76,9 @@ class Series(trace.Trace):
         )
 
     def to_plotly(self):
+        if self.merge_lines or self.use_webgl:
+            yield self._make_merged_trace(), {"row": self.subplot}
+            return
         first_trace = True
         for item in enumerate(np.atleast_2d(np.array(self.y))):
             yield self._make_trace(*item, first_trace), {"row": self.subplot}
@@ -80,6 +94,31 @@ class Series(trace.Trace):
             options = self._options_points(y, width, first_trace)
         return go.Scatter(**options)
 
+    def _make_merged_trace(self):
+        ys = np.atleast_2d(self.y)
+        max_points = MAX_POINTS_PER_LINE if self.use_webgl else None
+        if self._is_line():
+            x, y = _join_with_gaps(*_decimate(self.x, ys, max_points))
+            options = {**self._options_line(y, first_trace=True), "x": x}
+        elif self._is_area():
+            widths = np.broadcast_to(self.width, ys.shape)
+            x_lower, lower = _decimate(self.x, ys - widths, max_points)
+            x_upper, upper = _decimate(self.x, ys + widths, max_points)
+            x = np.hstack((x_lower, x_upper[:, ::-1]))
+            y = np.hstack((lower, upper[:, ::-1]))
+            x, y = _join_with_gaps(x, y)
+            options = self._options_area(ys[0], widths[0], first_trace=True)
+            options.update(x=x, y=y)
+        else:
+            width = None
+            if self.width is not None:
+                width = np.concatenate([self._get_width(i) for i in range(len(ys))])
+            options = self._options_points(ys.flatten(), width, first_trace=True)
+            options["x"] = np.tile(self.x, len(ys))
+        if self.use_webgl:
+            return go.Scattergl(**options)
+        return go.Scatter(**options)
+
     def _get_width(self, index):
         if self.width is None:
             return None
@@ -136,4 +175,34 @@ class Series(trace.Trace):
         return ()
 
 
+def _decimate(x, ys, max_points):
+    # Keep the first and the last point and the minimum and maximum of every interval
+    # so that the rendered lines look the same at the resolution of the screen. All
+    # lines are decimated at once by padding them to a multiple of the interval size.
+    number_points = len(x)
+    if max_points is None or number_points <= max_points:
+        return np.tile(x, (len(ys), 1)), ys
+    number_intervals = max(1, (max_points - 2) // 2)
+    interval_size = -(-number_points // number_intervals)
+    padding = number_intervals * interval_size - number_points
+    padded = np.pad(ys, ((0, 0), (0, padding)), mode="edge")
+    padded = padded.reshape(len(ys), number_intervals, interval_size)
+    offset = np.arange(number_intervals)[:, np.newaxis] * interval_size
+    extrema = np.stack((np.argmin(padded, axis=-1), np.argmax(padded, axis=-1)))
+    extrema = np.minimum(
+        np.sort(extrema, axis=0).transpose(1, 2, 0) + offset, number_points - 1
+    )
+    first = np.zeros((len(ys), 1), dtype=np.int_)
+    last = np.full((len(ys), 1), number_points - 1)
+    indices = np.hstack((first, extrema.reshape(len(ys), -1), last))
+    return x[indices], np.take_along_axis(ys, indices, axis=-1)
+
+
+def _join_with_gaps(x, y):
+    gap = np.full((len(x), 1), np.nan)
+    x = np.hstack((x, gap)).flatten()[:-1]
+    y = np.hstack((y, gap)).flatten()[:-1]
+    return x, y
+
+
 Series._fields = tuple(field.name for field in fields(Series))
@@ -2,6 +2,7 @@
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import contextlib
 import os
+import sys
 
 from py4vasp._util import import_
 
@@ -28,7 +29,8 @@ def error_handling():
 
 
 def _get_ipython():
-    if import_.is_imported(IPython):
+    # IPython has to be imported already if the code runs inside an IPython shell
+    if "IPython" in sys.modules and import_.is_imported(IPython):
         return IPython.get_ipython()
     else:
         return None
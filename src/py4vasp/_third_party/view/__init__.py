@@ -1,4 +1,4 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 from .mixin import Mixin
-from .view import GridQuantity, IonArrow, Isosurface, View
+from .view import GridQuantity, IonArrow, Isosurface, View, replicate
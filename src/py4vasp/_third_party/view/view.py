@@ -14,9 +14,45 @@ from py4vasp._util import convert, import_
 
 ase = import_.optional("ase")
 ase_cube = import_.optional("ase.io.cube")
+ase_symbols = import_.optional("ase.symbols")
 nglview = import_.optional("nglview")
 
 CUBE_FILENAME = "quantity.cube"
+_WRAP_TOLERANCE = 1e-7  # same as ase, keeps slightly negative coordinates near 0
+
+
+def replicate(positions, supercell, ion_major=False):
+    """Replicate the ions of the unit cell to fill a supercell.
+
+    Parameters
+    ----------
+    positions : np.ndarray
+        Direct coordinates of the ions with shape (..., ions, 3). Leading dimensions,
+        e.g., the steps of a trajectory, are kept.
+    supercell : np.ndarray
+        Number of repetitions of the unit cell along each lattice vector.
+    ion_major : bool
+        If set, all copies of the first ion come first, followed by all copies of the
+        second ion, and so on. Otherwise, the ions of every copy of the unit cell are
+        consecutive as for the `repeat` method of ase.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The direct coordinates of the ions in the supercell, still in units of the
+        lattice vectors of the unit cell, and the index of the ion in the unit cell,
+        which each ion of the supercell is a copy of.
+    """
+    positions = np.asarray(positions)
+    translations = np.indices(supercell).reshape(3, -1).T
+    ion_indices = np.arange(positions.shape[-2])
+    if ion_major:
+        positions = positions[..., :, np.newaxis, :] + translations
+        ion_indices = np.repeat(ion_indices, len(translations))
+    else:
+        positions = positions[..., np.newaxis, :, :] + translations[:, np.newaxis]
+        ion_indices = np.tile(ion_indices, len(translations))
+    return positions.reshape(*positions.shape[:-3], -1, 3), ion_indices
 
 
 class _Arrow3d(NamedTuple):
@@ -134,7 +170,7 @@ class View:
         determine which methods are called (either isosurface, arrows, etc).
         """
         self._verify()
-        trajectory = [self._create_atoms(i) for i in self._iterate_trajectory_frames()]
+        trajectory = self._create_trajectory()
         ngl_trajectory = nglview.ASETrajectory(trajectory)
         widget = nglview.NGLWidget(ngl_trajectory)
         widget.camera = self.camera
@@ -194,17 +230,25 @@ attribute is supplied with its corresponding grid scalar or ion arrow component.
                 f"Lattice vectors must be a 3x3 unit cell but have the shape {cell_shape}."
             )
 
-    def _create_atoms(self, step):
-        symbols = "".join(self.elements[step])
-        atoms = ase.Atoms(symbols, cell=self.lattice_vectors[step], pbc=True)
+    def _create_trajectory(self):
         shift = np.zeros(3) if self.shift is None else self.shift
-        atoms.set_scaled_positions(np.add(self.positions[step], shift))
-        atoms.wrap()
-        atoms = atoms.repeat(self.supercell)
-        return atoms
-
-    def _iterate_trajectory_frames(self):
-        return range(len(self.positions))
+        positions = np.add(self.positions, shift) + _WRAP_TOLERANCE
+        positions = np.mod(positions, 1) - _WRAP_TOLERANCE
+        supercell = np.broadcast_to(self.supercell, 3)
+        positions, ion_indices = replicate(positions, supercell)
+        lattice_vectors = np.asarray(self.lattice_vectors)
+        cartesian_positions = positions @ lattice_vectors
+        supercell_vectors = supercell[:, np.newaxis] * lattice_vectors
+        trajectory = []
+        for elements, cell, positions in zip(
+            self.elements, supercell_vectors, cartesian_positions
+        ):
+            numbers = np.asarray(ase_symbols.symbols2numbers(elements))
+            atoms = ase.Atoms(
+                numbers=numbers[ion_indices], cell=cell, positions=positions, pbc=True
+            )
+            trajectory.append(atoms)
+        return trajectory
 
     def _show_cell(self, widget):
         widget.add_unitcell()
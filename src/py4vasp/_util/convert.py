@@ -1,5 +1,6 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import os
 import re
 import textwrap
 
@@ -20,6 +21,13 @@ def to_complex(array):
     return array.view(np.complex128).reshape(array.shape[:-1])
 
 
+def to_writeout_path(directory, filename):
+    "Relative filenames refer to the directory of the calculation"
+    if os.path.isabs(filename):
+        return filename
+    return directory / filename
+
+
 def quantity_name(quantity):
     if quantity in ["CONTCAR"]:
         return quantity
@@ -1,27 +1,96 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import importlib
+import sys
 
 from py4vasp import exception
 
+_HOOKS = {}
+
+
+class _LazyModule:
+    """Proxy for an optional module that is imported on the first attribute access.
+
+    Many optional dependencies (plotly, ase, scipy, ...) take a long time to import.
+    Deferring the import until the module is actually used keeps `import py4vasp`
+    fast for scripts that only need a subset of the functionality.
+    """
 
-class _ModulePlaceholder:
     def __init__(self, name):
         self._name = name
+        self._module = None
+        self._error = None
 
     def __getattr__(self, attr):
-        raise exception.ModuleNotInstalled(
-            "You use an optional part of py4vasp that relies on the package "
-            f"'{self._name}'. Please install the package to use this functionality."
-        )
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "imported" if self._module is not None else "not imported"
+        return f"<lazy module '{self._name}' ({state})>"
+
+    def _load(self):
+        if self._module is not None:
+            return self._module
+        if self._error is None:
+            try:
+                self._module = importlib.import_module(self._name)
+            except Exception as error:
+                self._error = error
+        if self._error is not None:
+            raise exception.ModuleNotInstalled(
+                "You use an optional part of py4vasp that relies on the package "
+                f"'{self._name}'. Please install the package to use this functionality."
+            ) from self._error
+        _run_hooks(self._name)
+        return self._module
 
 
 def optional(name):
-    try:
-        return importlib.import_module(name)
-    except:
-        return _ModulePlaceholder(name)
+    """Return a proxy for the optional module that imports it on first use.
+
+    Parameters
+    ----------
+    name : str
+        Fully qualified name of the module.
+
+    Returns
+    -------
+    A proxy that forwards all attribute accesses to the module. If the module is not
+    installed, accessing an attribute raises a ModuleNotInstalled exception.
+    """
+    return _LazyModule(name)
 
 
 def is_imported(module):
-    return not isinstance(module, _ModulePlaceholder)
+    "Check whether the module is available; a lazy module is imported if necessary."
+    if not isinstance(module, _LazyModule):
+        return True
+    try:
+        module._load()
+        return True
+    except exception.ModuleNotInstalled:
+        return False
+
+
+def on_import(package, hook):
+    """Run a function once the first module of the package is imported via a proxy.
+
+    If the package was already imported, the function runs immediately.
+
+    Parameters
+    ----------
+    package : str
+        Name of the top-level package, e.g., "plotly".
+    hook : Callable[[], None]
+        Function setting up the package for the use with py4vasp.
+    """
+    _HOOKS.setdefault(package, []).append(hook)
+    if package in sys.modules:
+        _run_hooks(package)
+
+
+def _run_hooks(name):
+    package = name.partition(".")[0]
+    # remove the hooks before running them, because they may access the package
+    for hook in _HOOKS.pop(package, ()):
+        hook()
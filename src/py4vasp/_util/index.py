@@ -25,10 +25,18 @@ like in this example or a `slice`. The first two selections will return `data[:,
 and `data[:,1,1]`, respectively. The last selection is equivalent to
 `np.sum(data[:,:,2], axis=-1)` because we sum over all dimensions mentioned as keys
 in `maps`.
+
+For the default summation, a selection is compiled into a plan consisting of the sign
+and the index of every term, where adjacent ranges are merged into a single slice. The
+plans are cached per maps and selection, so that evaluating the same selection again
+does not need to resolve the selection tree.
 """
+
 import abc
+import collections
 import dataclasses
 import itertools
+import threading
 
 import numpy as np
 
@@ -85,6 +93,8 @@ class Selector:
         self._number_labels = self._make_number_labels(maps)
         self._indices = self._make_default_indices(maps, self._data.ndim)
         self._reduction = reduction
+        can_compile = reduction is np.sum and not self._data.is_none()
+        self._maps_key = _freeze_maps(maps) if can_compile else None
 
     def _make_map(self, maps):
         return {
@@ -141,11 +151,25 @@ class Selector:
             will reduce over all dimensions provided in the initialization of the class,
             i.e., ndim of the result = ndim of data - len(maps).
         """
+        if self._maps_key is None:
+            return self._reduce_slices(selection)
+        return self._get_plan(selection).apply(self._data)
+
+    def _reduce_slices(self, selection):
         return sum(
             slices.reduce(self._data, self._reduction, axis=self._axes)
             for slices in self._get_all_slices(selection)
         )
 
+    def _get_plan(self, selection):
+        key = (self._maps_key, self._data.ndim, repr(selection))
+        plan = _plan_cache.get(key)
+        if plan is None:
+            all_slices = self._get_all_slices(selection)
+            plan = _Plan.compile(all_slices, self._axes)
+            _plan_cache.store(key, plan)
+        return plan
+
     def label(self, selection):
         """Construct a label for a particular selection.
 
@@ -265,6 +289,118 @@ def _data_contiguous(slice_):
     return isinstance(slice_, slice) and slice_.step in (1, None)
 
 
+@dataclasses.dataclass
+class _Plan:
+    terms: list
+    "The sign and the index into the data for every term of the selection."
+    axes: tuple
+    "The dimensions that are summed over."
+
+    @classmethod
+    def compile(cls, all_slices, axes):
+        terms = [(slices.factor, slices.indices) for slices in all_slices]
+        return cls(_merge_terms(terms, axes), axes)
+
+    def apply(self, data):
+        return sum(
+            factor * np.sum(data[indices], axis=self.axes)
+            for factor, indices in self.terms
+        )
+
+
+def _merge_terms(terms, axes):
+    # combine terms with the same sign whose indices are adjacent along a single
+    # dimension, so that they are summed with a single reduction
+    merged = []
+    for factor, indices in terms:
+        for position, (other_factor, other_indices) in enumerate(merged):
+            if factor != other_factor:
+                continue
+            combined = _combine_indices(indices, other_indices, axes)
+            if combined is not None:
+                merged[position] = (factor, combined)
+                break
+        else:
+            merged.append((factor, indices))
+    return merged
+
+
+def _combine_indices(first, second, axes):
+    different = [
+        axis
+        for axis in axes
+        if _freeze_index(first[axis]) != _freeze_index(second[axis])
+    ]
+    if len(different) != 1:
+        return None
+    axis = different[0]
+    slice_ = _adjacent_slices(first[axis], second[axis])
+    if slice_ is None:
+        return None
+    return first[:axis] + (slice_,) + first[axis + 1 :]
+
+
+def _adjacent_slices(first, second):
+    if not (_simple_slice(first) and _simple_slice(second)):
+        return None
+    if first.stop == second.start:
+        return slice(first.start, second.stop)
+    if second.stop == first.start:
+        return slice(second.start, first.stop)
+    return None
+
+
+def _simple_slice(slice_):
+    if not isinstance(slice_, slice) or slice_.step not in (None, 1):
+        return False
+    return all(isinstance(x, int) and x >= 0 for x in (slice_.start, slice_.stop))
+
+
+class _PlanCache:
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self._plans = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+            return plan
+
+    def store(self, key, plan):
+        with self._lock:
+            self._plans[key] = plan
+            while len(self._plans) > self.max_size:
+                self._plans.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._plans.clear()
+
+    def __len__(self):
+        return len(self._plans)
+
+
+_plan_cache = _PlanCache()
+
+
+def _freeze_maps(maps):
+    return tuple(
+        (dim, tuple((key, _freeze_index(index)) for key, index in map_.items()))
+        for dim, map_ in maps.items()
+    )
+
+
+def _freeze_index(index):
+    if isinstance(index, slice):
+        return ("slice", index.start, index.stop, index.step)
+    if isinstance(index, int):
+        return index
+    return tuple(np.ravel(index).tolist())
+
+
 class _Slices:
     def __init__(self, indices):
         self._default = indices
@@ -291,6 +427,14 @@ class _Slices:
         self._factor *= 1 if operator == "+" else -1
         return self
 
+    @property
+    def factor(self):
+        return self._factor
+
+    @property
+    def indices(self):
+        return tuple(self._indices)
+
     def reduce(self, data, reduction, axis):
         if isinstance(reduction, type) and issubclass(reduction, Reduction):
             keys = [str(key) for key in self._keys]
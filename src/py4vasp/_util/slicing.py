@@ -1,6 +1,7 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import dataclasses
+import itertools
 
 import numpy as np
 
@@ -8,6 +9,7 @@ from py4vasp import exception
 
 INDICES = {"a": 0, "b": 1, "c": 2}
 AXIS = ("x", "y", "z")
+_ON_GRID_TOLERANCE = 1e-12
 PLANE = """\
 You need to specify a plane defined by two of the lattice vectors by selecting
 a *cut* along the third one. You must only select a single cut and the value
@@ -105,9 +107,8 @@ def grid_scalar(data, plane, fraction):
     """
     _raise_error_if_cut_unknown(plane.cut)
     index = INDICES[plane.cut]
-    length = data.shape[index]
     slice_ = [slice(None), slice(None), slice(None)]
-    slice_[index] = np.round(length * fraction).astype(np.int_) % length
+    slice_[index] = grid_index(data.shape[index], fraction)
     return data[tuple(slice_)]
 
 
@@ -140,10 +141,277 @@ def grid_vector(data, plane, fraction):
     index = INDICES[plane.cut]
     length = data.shape[index + 1]  # add 1 to account for the vector dimension
     slice_ = [slice(None), slice(None), slice(None), slice(None)]
-    slice_[index + 1] = np.round(length * fraction).astype(np.int_) % length
+    slice_[index + 1] = grid_index(length, fraction)
     return _project_vectors_to_plane(plane, data[tuple(slice_)])
 
 
+def grid_index(length, fraction):
+    """Returns the index of the grid point at a fractional position along one lattice
+    vector.
+
+    Use this to select the plane of grid data before reading it, e.g., to read only
+    the relevant part of a large array from file.
+
+    Parameters
+    ----------
+    length : int
+        Number of grid points along the lattice vector.
+    fraction : float
+        Fractional position along the lattice vector. Periodic boundaries are assumed.
+
+    Returns
+    -------
+    int
+        The index of the grid point closest to the fractional position.
+    """
+    return int(np.round(length * fraction).astype(np.int_) % length)
+
+
+def fourier_plane(data, plane, fraction, shape=None):
+    """Interpolates a 2d plane of periodic grid data at an arbitrary fraction.
+
+    In contrast to :func:`grid_scalar`, the fraction is not rounded to the nearest
+    grid point. Instead the data is interpolated with trigonometric polynomials, which
+    is exact for data that is band limited on the grid, e.g., quantities obtained from
+    plane waves. Optionally, the plane is resampled onto a finer or coarser regular
+    mesh along the two remaining lattice vectors. The interpolation is separable, so
+    the cost and memory scale with the size of the output.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Data on a grid. The last three dimensions should correspond to the three
+        lattice vectors; any leading dimensions, e.g., vector components, are kept.
+    plane : Plane
+        Defines the 2d plane to which the data is reduced.
+    fraction : float
+        Fractional position of the plane along the cut lattice vector. Periodic
+        boundaries are assumed.
+    shape : tuple[int, int]
+        Number of points of the output mesh along the two remaining lattice vectors.
+        If not set, the mesh of the grid is used.
+
+    Returns
+    -------
+    np.ndarray
+        An array where the dimension selected by cut has been removed by interpolating
+        the data in the plane at the specified fraction.
+    """
+    _raise_error_if_cut_unknown(plane.cut)
+    axis = data.ndim - 3 + INDICES[plane.cut]
+    weights = fourier_weights(data.shape[axis], fraction)[0]
+    result = np.tensordot(data, weights, axes=(axis, 0))
+    if shape is None:
+        return result
+    for points, axis in zip(shape, (-2, -1)):
+        fractions = np.arange(points) / points
+        weights = fourier_weights(result.shape[axis], fractions)
+        result = np.moveaxis(np.tensordot(result, weights, axes=(axis, 1)), -1, axis)
+    return result
+
+
+def fourier_line(data, start, end, num_points=100):
+    """Interpolates periodic grid data along a straight line.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Data on a grid, where the last three dimensions correspond to the three
+        lattice vectors.
+    start, end : np.ndarray
+        Fractional coordinates of the first and the last point of the line.
+    num_points : int
+        Number of equidistant points along the line including both end points.
+
+    Returns
+    -------
+    np.ndarray
+        The interpolated data along the line; the last dimension runs over the points.
+    """
+    positions = np.linspace(start, end, num_points)
+    return fourier_interpolate(data, positions)
+
+
+def fourier_interpolate(data, positions):
+    """Evaluates the trigonometric interpolation of periodic grid data at arbitrary
+    positions.
+
+    The trigonometric interpolation reproduces the data exactly on the grid points and
+    uses a symmetric treatment of the Nyquist frequency, so that real data yields real
+    results. The positions are processed in chunks so that the intermediate arrays do
+    not exceed the size of the data.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Data on a grid. The trailing dimensions are the periodic grid dimensions; their
+        number is given by the last dimension of the positions.
+    positions : np.ndarray
+        Fractional coordinates of the points at which the data is interpolated. The
+        position of the grid point with index n along an axis with N points is n / N.
+
+    Returns
+    -------
+    np.ndarray
+        The interpolated data with the leading dimensions of the data followed by the
+        leading dimensions of the positions.
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    number_axes = positions.shape[-1]
+    grid_shape = data.shape[data.ndim - number_axes :]
+    points = positions.reshape(-1, number_axes)
+    chunk_size = max(1, grid_shape[-1])
+    chunks = [
+        _fourier_interpolate_chunk(data, grid_shape, points[start : start + chunk_size])
+        for start in range(0, max(len(points), 1), chunk_size)
+    ]
+    result = np.concatenate(chunks, axis=-1)
+    return result.reshape(*result.shape[:-1], *positions.shape[:-1])
+
+
+def _fourier_interpolate_chunk(data, grid_shape, points):
+    weights = [
+        fourier_weights(length, fractions)
+        for length, fractions in zip(grid_shape, points.T)
+    ]
+    # contract the last grid axis with a matrix product and keep the points as the
+    # trailing dimension; the remaining axes are contracted point by point
+    result = data @ weights[-1].T
+    for weight in reversed(weights[:-1]):
+        result = np.einsum("...np,pn->...p", result, weight)
+    return result
+
+
+def fourier_mesh(data, origin, steps, shape):
+    """Evaluates the trigonometric interpolation of periodic 2d grid data on a regular
+    mesh.
+
+    The mesh may be rotated or sheared with respect to the grid. If one grid axis is
+    constant along one direction of the mesh, which is the case whenever one of the
+    vectors spanning the grid is aligned with an axis of the mesh, the evaluation is
+    separable and scales with the size of the output times the number of points
+    along one grid axis. Otherwise, all Fourier components are summed for every mesh
+    point.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        2d data on a periodic grid.
+    origin : np.ndarray
+        Fractional coordinates of the first point of the mesh.
+    steps : np.ndarray
+        Fractional coordinates of the steps between neighboring mesh points along the
+        first and the second direction of the mesh.
+    shape : tuple[int, int]
+        Number of mesh points along the two directions.
+
+    Returns
+    -------
+    np.ndarray
+        The interpolated data with the given shape.
+    """
+    coefficients, frequencies = _fourier_coefficients(data)
+    origin = np.asarray(origin, dtype=np.float64)
+    steps = np.asarray(steps, dtype=np.float64)
+    for swap_grid, swap_mesh in itertools.product((False, True), repeat=2):
+        grid = (1, 0) if swap_grid else (0, 1)
+        mesh = (1, 0) if swap_mesh else (0, 1)
+        if not _is_constant_along_mesh(steps[mesh[1], grid[1]], shape[mesh[1]]):
+            continue
+        result = _fourier_mesh_separable(
+            coefficients.transpose(grid),
+            [frequencies[axis] for axis in grid],
+            origin[list(grid)],
+            steps[np.ix_(mesh, grid)],
+            [shape[axis] for axis in mesh],
+        )
+        return result.transpose(mesh)
+    return _fourier_mesh_direct(coefficients, frequencies, origin, steps, shape)
+
+
+def _fourier_coefficients(data):
+    # Fourier coefficients where the Nyquist frequency of an even number of points is
+    # split symmetrically between the positive and the negative frequency
+    coefficients = np.fft.fftn(data) / data.size
+    frequencies = []
+    for axis, length in enumerate(data.shape):
+        frequency = np.fft.fftfreq(length, 1 / length)
+        if length % 2 == 0:
+            index = (slice(None),) * axis + (slice(length // 2, length // 2 + 1),)
+            coefficients[index] /= 2
+            coefficients = np.concatenate((coefficients, coefficients[index]), axis)
+            frequency = np.append(frequency, length // 2)
+        frequencies.append(frequency)
+    return coefficients, frequencies
+
+
+def _is_constant_along_mesh(step, points):
+    return abs(step) * points < _ON_GRID_TOLERANCE
+
+
+def _fourier_mesh_separable(coefficients, frequencies, origin, steps, shape):
+    # the second grid coordinate only depends on the first mesh index, so the sum
+    # over the second frequency is done once per row of the mesh
+    rows = np.arange(shape[0])
+    first = origin[0] + rows * steps[0, 0]
+    second = origin[1] + rows * steps[0, 1]
+    partial = _phases(second, frequencies[1]) @ coefficients.T
+    partial *= _phases(first, frequencies[0])
+    columns = np.arange(shape[1]) * steps[1, 0]
+    return np.real(partial @ _phases(columns, frequencies[0]).T)
+
+
+def _fourier_mesh_direct(coefficients, frequencies, origin, steps, shape):
+    frequencies = np.stack(np.meshgrid(*frequencies, indexing="ij"), axis=-1)
+    frequencies = frequencies.reshape(-1, 2)
+    coefficients = coefficients.flatten()
+    result = np.zeros(shape)
+    chunk_size = max(1, max(shape))
+    for start in range(0, len(coefficients), chunk_size):
+        frequency = frequencies[start : start + chunk_size]
+        rows = _phases(np.arange(shape[0]), frequency @ steps[0])
+        rows *= coefficients[start : start + chunk_size] * _phases(
+            1, frequency @ origin
+        )
+        columns = _phases(np.arange(shape[1]), frequency @ steps[1])
+        result += np.real(rows @ columns.T)
+    return result
+
+
+def _phases(positions, frequencies):
+    return np.exp(2j * np.pi * np.multiply.outer(positions, frequencies))
+
+
+def fourier_weights(length, fractions):
+    """Returns the weights of the grid points for a trigonometric interpolation along
+    one periodic axis.
+
+    Parameters
+    ----------
+    length : int
+        Number of grid points along the axis.
+    fractions : float or np.ndarray
+        Fractional positions at which the data is interpolated.
+
+    Returns
+    -------
+    np.ndarray
+        A matrix with one row for every fraction and one column for every grid point.
+        Multiplying it with the data along the axis yields the interpolated values.
+    """
+    fractions = np.atleast_1d(np.asarray(fractions, dtype=np.float64))
+    distance = np.subtract.outer(fractions * length, np.arange(length))
+    # periodic sinc kernel; for an even number of points the Nyquist frequency is
+    # split symmetrically, which leads to the additional cosine
+    numerator = np.sin(np.pi * distance)
+    denominator = length * np.sin(np.pi * distance / length)
+    if length % 2 == 0:
+        numerator = numerator * np.cos(np.pi * distance / length)
+    on_grid = np.abs(denominator) < _ON_GRID_TOLERANCE
+    denominator = np.where(on_grid, 1, denominator)
+    return np.where(on_grid, 1, numerator / denominator)
+
+
 def _project_vectors_to_plane(plane, data):
     # We want to want to project the vector r onto the plane spanned by the vectors
     # u and v. Let the result be s = a u + b v. We can obtain the projected vector by
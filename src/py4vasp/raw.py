@@ -16,5 +16,7 @@ enforce the read operation before the file is closed.
 """
 
 from py4vasp._raw.access import access
+from py4vasp._raw.cache import data_cache
 from py4vasp._raw.data import *
 from py4vasp._raw.definition import get_schema, selections
+from py4vasp._raw.pool import file_pool
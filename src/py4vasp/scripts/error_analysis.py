@@ -74,6 +74,20 @@ def get_options(args=sys.argv[1:]):
         help="Supply flag (without keyword) if you want to have XY txt files for the computed errors.\n"
         + "Default output will be a csv file (ErrorAnalysis.csv) containing all analysed errors",
     )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of threads used to read the vaspout.h5 files in parallel.",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="Process the configurations in chunks of this size to limit the memory.",
+    )
     options = parser.parse_args(args)
 
     return options
@@ -135,7 +149,10 @@ def make_plot(cls, show=False, pdf=False, graph_name="ErrorAnalysis.pdf"):
 def main():
     options = get_options(sys.argv[1:])
     mlff_error_analysis = MLFFErrorAnalysis.from_files(
-        dft_data=options.DFTfiles, mlff_data=options.MLfiles
+        dft_data=options.DFTfiles,
+        mlff_data=options.MLfiles,
+        workers=options.workers,
+        chunk_size=options.chunk_size,
     )
     if options.XYtextFile:
         write_energy_error_file(mlff_error_analysis)
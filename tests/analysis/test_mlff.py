@@ -5,14 +5,17 @@ from pathlib import Path
 from typing import Dict
 from unittest.mock import patch
 
+import h5py
 import numpy as np
 import pytest
 
-from py4vasp import exception
+from py4vasp import exception, raw
 from py4vasp._analysis.mlff import MLFFErrorAnalysis
 from py4vasp._calculation.energy import Energy
 from py4vasp._calculation.force import Force
 from py4vasp._calculation.stress import Stress
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._raw.write import write
 
 
 class BaseCalculations:
@@ -52,12 +55,15 @@ class MockCalculations:
         return _cls
 
     def number_of_calculations(self):
-        num_ions = len(self.forces.read()["mlff_data"])
-        return {"dft_data": num_ions, "mlff_data": num_ions}
+        number = len(self._paths["mlff_data"])
+        return {"dft_data": number, "mlff_data": number}
 
     def paths(self):
         return self._paths
 
+    def chunks(self, size):
+        yield self
+
 
 @pytest.fixture
 def mock_calculations(raw_data):
@@ -355,3 +361,119 @@ def test_multiple_stress_computation(mock_multiple_calculations):
         normalize_by_configurations=True
     )
     assert np.array_equal(expected_stress_error, output_stress_error)
+
+
+def test_read_each_quantity_once(mock_calculations):
+    with patch.object(BaseCalculations, "read", autospec=True) as mock_read:
+        mock_read.side_effect = lambda self, *args, **kwargs: self._data
+        MLFFErrorAnalysis._from_data(mock_calculations)
+    assert mock_read.call_count == 3
+
+
+def _write_calculation(path, raw_data):
+    path.mkdir()
+    raw_energy = raw_data.energy("relax", randomize=True)
+    raw_force = raw_data.force("Sr2TiO4", randomize=True)
+    raw_stress = raw_data.stress("Sr2TiO4", randomize=True)
+    raw_stress.structure = raw_force.structure
+    with h5py.File(path / DEFAULT_FILE, "w") as h5f:
+        write(h5f, raw_energy)
+        write(h5f, raw_force)
+        write(h5f, raw_stress)
+
+
+@pytest.fixture
+def calculation_files(tmp_path, raw_data):
+    paths = {}
+    for datatype in ("dft_data", "mlff_data"):
+        _write_calculation(tmp_path / datatype, raw_data)
+        paths[datatype] = tmp_path / datatype
+    return paths
+
+
+@pytest.fixture
+def many_calculation_files(tmp_path, raw_data):
+    paths = {}
+    for datatype in ("dft_data", "mlff_data"):
+        for i in range(5):
+            _write_calculation(tmp_path / f"{datatype}_{i}", raw_data)
+        paths[datatype] = tmp_path / f"{datatype}_*"
+    return paths
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_open_each_file_once(calculation_files, workers):
+    with patch("h5py.File", wraps=h5py.File) as mock_file:
+        error_analysis = MLFFErrorAnalysis.from_paths(
+            **calculation_files, workers=workers
+        )
+    assert mock_file.call_count == 2
+    assert error_analysis.dft.forces.flags.c_contiguous
+    assert error_analysis.dft.nconfig == 1
+    assert len(raw.file_pool) == 0
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_number_of_open_files_is_bounded(many_calculation_files, workers):
+    open_files = []
+    h5py_file = h5py.File
+
+    def open_file(*args, **kwargs):
+        open_files.append(len(raw.file_pool))
+        return h5py_file(*args, **kwargs)
+
+    max_open_files = raw.file_pool.max_open_files
+    raw.file_pool.max_open_files = 4
+    try:
+        with patch("h5py.File", side_effect=open_file):
+            error_analysis = MLFFErrorAnalysis.from_paths(
+                **many_calculation_files, workers=workers
+            )
+    finally:
+        raw.file_pool.max_open_files = max_open_files
+    assert len(open_files) == 10
+    assert max(open_files) < 4
+    assert error_analysis.dft.nconfig == 5
+    assert len(raw.file_pool) == 0
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 10])
+def test_streaming_errors(many_calculation_files, chunk_size, Assert):
+    reference = MLFFErrorAnalysis.from_paths(**many_calculation_files)
+    streaming = MLFFErrorAnalysis.from_paths(
+        **many_calculation_files, chunk_size=chunk_size
+    )
+    assert not hasattr(streaming.dft, "forces")
+    assert streaming.dft.nconfig == reference.dft.nconfig == 5
+    Assert.allclose(streaming.dft.nions, reference.dft.nions)
+    Assert.allclose(streaming.mlff.energies, reference.mlff.energies)
+    for normalize in (False, True):
+        Assert.allclose(
+            streaming.get_energy_error_per_atom(normalize),
+            reference.get_energy_error_per_atom(normalize),
+        )
+        Assert.allclose(
+            streaming.get_force_rmse(normalize), reference.get_force_rmse(normalize)
+        )
+        Assert.allclose(
+            streaming.get_stress_rmse(normalize), reference.get_stress_rmse(normalize)
+        )
+    expected = reference.get_force_rmse_per_element()
+    actual = streaming.get_force_rmse_per_element()
+    assert actual.keys() == expected.keys() == {"Sr", "Ti", "O"}
+    for element in expected:
+        Assert.allclose(actual[element], expected[element])
+
+
+def test_force_rmse_per_element(mock_multiple_calculations):
+    mlff_error_analysis = MLFFErrorAnalysis._from_data(mock_multiple_calculations)
+    forces_dict = mock_multiple_calculations.forces.read()
+    dft_forces = _iter_properties("forces", forces_dict["dft_data"])
+    mlff_forces = _iter_properties("forces", forces_dict["mlff_data"])
+    structures = _iter_properties("structure", forces_dict["dft_data"], False)
+    elements = _iter_properties("elements", structures)
+    output = mlff_error_analysis.get_force_rmse_per_element()
+    for element in ("Sr", "Ti", "O"):
+        difference = (dft_forces - mlff_forces)[elements == element]
+        expected = np.sqrt(np.mean(difference**2))
+        assert np.isclose(output[element], expected)
@@ -1,12 +1,18 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import h5py
+import numpy as np
 import pytest
 
-from py4vasp import Batch
+from py4vasp import Batch, exception
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._raw.write import write
 
 
 def test_error_when_using_constructor():
@@ -148,3 +154,198 @@ def test_has_attributes(mock_access, mock_from_path):
     assert output_read.keys() == {"path_name_1", "path_name_2"}
     assert isinstance(output_read["path_name_1"], list)
     assert isinstance(output_read["path_name_2"], list)
+
+
+@pytest.fixture
+def force_calculations(tmp_path, raw_data):
+    raw_forces = []
+    for i in range(4):
+        path = tmp_path / f"calc_{i}"
+        path.mkdir()
+        if i == 2:
+            continue  # calculation without output
+        raw_force = raw_data.force("Sr2TiO4", randomize=True)
+        with h5py.File(path / DEFAULT_FILE, "w") as h5f:
+            write(h5f, raw_force)
+        raw_forces.append(raw_force)
+    raw_forces.insert(2, None)
+    return tmp_path, raw_forces
+
+
+@pytest.mark.parametrize("executor", ("thread", "process"))
+def test_read_broken_file_in_parallel(force_calculations, executor, Assert):
+    path, raw_forces = force_calculations
+    with h5py.File(path / "calc_2" / DEFAULT_FILE, "w") as h5f:
+        write(h5f, raw_forces[0])
+        del h5f["results/positions/ion_types"]
+        h5f["results/positions/ion_types"] = np.zeros(3)
+    batch = Batch.from_paths(workers=2, executor=executor, calcs=path / "calc_*")
+    with pytest.warns(UserWarning, match="calc_2") as record:
+        output_read = batch.forces.read()
+    assert "1 of 4 calculations failed" in str(record[0].message)
+    for raw_force, force in zip(raw_forces, output_read["calcs"]):
+        if raw_force is None:
+            assert isinstance(force, exception.Py4VaspError)
+            assert "calc_2" in str(force)
+        else:
+            Assert.allclose(force["forces"], raw_force.forces[-1])
+    with pytest.raises(exception.Py4VaspError, match="calc_2"):
+        batch.forces.read(stack=True)
+
+
+@pytest.mark.parametrize("executor", ("thread", "process"))
+def test_read_in_parallel(force_calculations, executor, Assert):
+    path, raw_forces = force_calculations
+    batch = Batch.from_paths(workers=2, executor=executor, calcs=path / "calc_*")
+    with pytest.warns(UserWarning, match="1 of 4 calculations failed"):
+        output_read = batch.forces.read()
+    for raw_force, force in zip(raw_forces, output_read["calcs"]):
+        if raw_force is None:
+            assert isinstance(force, exception.FileAccessError)
+        else:
+            Assert.allclose(force["forces"], raw_force.forces[-1])
+
+
+def test_read_in_parallel_on_request(force_calculations, Assert):
+    path, raw_forces = force_calculations
+    batch = Batch.from_paths(first=path / "calc_0", second=path / "calc_3")
+    output_read = batch.forces.read(parallel=True)
+    Assert.allclose(output_read["first"][0]["forces"], raw_forces[0].forces[-1])
+    Assert.allclose(output_read["second"][0]["forces"], raw_forces[3].forces[-1])
+
+
+def test_read_in_fresh_process(force_calculations):
+    # the refinement classes are imported lazily, so the combine classes must not
+    # rely on other code importing them first
+    path, _ = force_calculations
+    code = f"""\
+import py4vasp
+batch = py4vasp.Batch.from_paths(calc=r"{path / 'calc_0'}")
+print(batch.forces.read()["calc"][0]["forces"].shape)
+"""
+    command = (sys.executable, "-c", code)
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "(7, 3)"
+
+
+def test_serial_read_raises_error(force_calculations):
+    path, _ = force_calculations
+    batch = Batch.from_paths(workers=2, calcs=path / "calc_*")
+    with pytest.raises(exception.FileAccessError):
+        batch.forces.read(parallel=False)
+
+
+def test_unknown_executor():
+    with pytest.raises(exception.IncorrectUsage):
+        Batch.from_paths(executor="unknown", path_name="path")
+
+
+@pytest.fixture
+def mixed_calculations(tmp_path, raw_data):
+    raw_calculations = []
+    for i, system in enumerate(("Sr2TiO4", "Fe3O4", "Sr2TiO4")):
+        path = tmp_path / f"calc_{i}"
+        path.mkdir()
+        raw_calculation = {
+            "energy": raw_data.energy("relax", randomize=True),
+            "force": raw_data.force(system, randomize=True),
+            "stress": raw_data.stress(system, randomize=True),
+        }
+        with h5py.File(path / DEFAULT_FILE, "w") as h5f:
+            for raw_quantity in raw_calculation.values():
+                write(h5f, raw_quantity)
+        raw_calculations.append(raw_calculation)
+    return tmp_path, raw_calculations
+
+
+def test_read_stacked_forces(mixed_calculations, Assert):
+    path, raw_calculations = mixed_calculations
+    batch = Batch.from_paths(calcs=path / "calc_*")
+    reference = batch.forces.read()["calcs"]
+    stacked = batch.forces.read(stack=True)["calcs"]
+    number_ions = [len(force["forces"]) for force in reference]
+    Assert.allclose(stacked["offsets"], np.cumsum([0] + number_ions))
+    for key in ("forces",):
+        expected = np.concatenate([force[key] for force in reference])
+        Assert.allclose(stacked[key], expected)
+    for key in ("positions", "elements", "names"):
+        expected = np.concatenate([force["structure"][key] for force in reference])
+        assert np.array_equal(stacked["structure"][key], expected)
+    lattice_vectors = [force["structure"]["lattice_vectors"] for force in reference]
+    assert stacked["structure"]["lattice_vectors"].shape == (3, 3, 3)
+    Assert.allclose(stacked["structure"]["lattice_vectors"], lattice_vectors)
+
+
+def test_read_stacked_stresses(mixed_calculations, Assert):
+    path, raw_calculations = mixed_calculations
+    batch = Batch.from_paths(workers=2, calcs=path / "calc_*")
+    stacked = batch.stresses.read(stack=True)["calcs"]
+    expected = [
+        raw_calculation["stress"].stress[-1] for raw_calculation in raw_calculations
+    ]
+    assert stacked["stress"].shape == (3, 3, 3)
+    Assert.allclose(stacked["stress"], expected)
+    assert len(stacked["offsets"]) == 4
+
+
+def test_read_stacked_energies(mixed_calculations, Assert):
+    path, raw_calculations = mixed_calculations
+    batch = Batch.from_paths(calcs=path / "calc_*")
+    reference = batch.energies.read("TOTEN")["calcs"]
+    stacked = batch.energies.read("TOTEN", stack=True)["calcs"]
+    assert stacked.keys() == reference[0].keys()
+    for key, value in stacked.items():
+        assert value.shape == (3,)
+        Assert.allclose(value, [energy[key] for energy in reference])
+    assert "offsets" not in stacked
+
+
+def test_read_stacked_without_nested_dictionaries(mixed_calculations):
+    path, _ = mixed_calculations
+    batch = Batch.from_paths(calcs=path / "calc_*")
+    with patch("py4vasp._calculation.force.Force.read") as mock_read:
+        batch.forces.read(stack=True)
+    mock_read.assert_not_called()
+
+
+def test_read_stacked_inconsistent_entries(tmp_path, raw_data):
+    for i, selection in enumerate(("relax", "MD")):
+        path = tmp_path / f"calc_{i}"
+        path.mkdir()
+        with h5py.File(path / DEFAULT_FILE, "w") as h5f:
+            write(h5f, raw_data.energy(selection))
+    batch = Batch.from_paths(calcs=tmp_path / "calc_*")
+    with pytest.raises(exception.IncorrectUsage, match="calculation 1"):
+        batch.energies.read(stack=True)
+
+
+def test_read_stacked_raises_error(force_calculations):
+    path, _ = force_calculations
+    batch = Batch.from_paths(workers=2, calcs=path / "calc_*")
+    with pytest.raises(exception.FileAccessError):
+        batch.forces.read(stack=True)
+
+
+def test_chunks(tmp_path):
+    for i in range(5):
+        (tmp_path / f"calc_{i}").mkdir()
+    batch = Batch.from_paths(workers=2, calcs=tmp_path / "calc_*", single=tmp_path)
+    chunks = list(batch.chunks(2))
+    assert len(chunks) == 3
+    assert chunks[0].paths()["calcs"] == batch.paths()["calcs"][:2]
+    assert chunks[2].paths()["calcs"] == batch.paths()["calcs"][4:]
+    assert chunks[0].paths()["single"] == [tmp_path]
+    assert chunks[1].paths()["single"] == []
+    assert chunks[1].number_of_calculations() == {"calcs": 2, "single": 0}
+    assert all(chunk._workers == 2 for chunk in chunks)
+    with pytest.raises(exception.IncorrectUsage):
+        next(batch.chunks(0))
+
+
+def test_chunks_from_files(tmp_path):
+    for i in range(3):
+        (tmp_path / f"calc_{i}.h5").touch()
+    batch = Batch.from_files(calcs=tmp_path / "calc_*.h5")
+    chunks = list(batch.chunks(2))
+    assert chunks[1].files()["calcs"] == batch.files()["calcs"][2:]
+    assert chunks[1].paths()["calcs"] == [tmp_path.resolve()]
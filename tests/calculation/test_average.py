@@ -0,0 +1,44 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import numpy as np
+import pytest
+
+from py4vasp import exception
+from py4vasp._calculation import _average
+
+
+@pytest.mark.parametrize("axis", (0, 1, 2))
+@pytest.mark.parametrize("chunk_size", (1, 3, 100))
+def test_planar_average(axis, chunk_size, Assert):
+    data = np.random.random((7, 5, 6))
+    reads = []
+
+    def read_slab(slab):
+        reads.append(slab)
+        return data[slab]
+
+    actual = _average.planar_average(read_slab, data.shape, axis, chunk_size)
+    other_axes = tuple(other for other in range(3) if other != axis)
+    Assert.allclose(actual, np.mean(data, axis=other_axes))
+    assert len(reads) == -(-len(data) // chunk_size)
+
+
+def test_macroscopic_average_of_periodic_signal(Assert):
+    x = np.arange(60)
+    values = 2.0 + np.sin(2 * np.pi * x / 6) + np.cos(2 * np.pi * x / 4)
+    Assert.allclose(_average.macroscopic_average(values, (6, 4)), 2.0)
+
+
+@pytest.mark.parametrize("width", (1, 3, 4, 2.5))
+def test_macroscopic_average_matches_direct_convolution(width, Assert):
+    values = np.random.random(20)
+    weights = np.clip(width / 2 - np.abs(np.arange(-5, 6)) + 0.5, 0, 1)
+    weights /= np.sum(weights)
+    padded = np.concatenate((values[-5:], values, values[:5]))
+    expected = np.convolve(padded, weights, mode="valid")
+    Assert.allclose(_average.macroscopic_average(values, width), expected)
+
+
+def test_incorrect_width():
+    with pytest.raises(exception.IncorrectUsage):
+        _average.macroscopic_average(np.zeros(10), 0)
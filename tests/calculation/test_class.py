@@ -1,6 +1,8 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import os
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
@@ -61,6 +63,29 @@ def test_all_attributes(mock_access):
     mock_access.return_value.__enter__.assert_not_called()
 
 
+def test_quantities_are_imported_on_first_access():
+    code = """\
+import sys
+import py4vasp
+calc = py4vasp.Calculation.from_path(".")
+before = [module for module in sys.modules if module.startswith("py4vasp._calculation.")]
+calc.energy
+print(len(before), "py4vasp._calculation.energy" in sys.modules, "py4vasp._calculation.dos" in sys.modules)
+"""
+    command = (sys.executable, "-c", code)
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ["0", "True", "False"]
+
+
+def test_documentation_of_quantities():
+    from py4vasp._calculation.dos import Dos
+    from py4vasp._calculation.phonon_band import PhononBand
+
+    assert Calculation.dos.__doc__ == Dos.__doc__
+    calc = Calculation.from_path("test_path")
+    assert type(calc.phonon).band.__doc__ == PhononBand.__doc__
+
+
 @pytest.mark.skip("Input files are not included in current release.")
 def test_input_files_from_path():
     with patch("py4vasp._control.base.InputFile.__init__", return_value=None) as mock:
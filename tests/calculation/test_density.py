@@ -2,13 +2,18 @@
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import dataclasses
 import types
+from unittest.mock import patch
 
+import h5py
 import numpy as np
 import pytest
 
 from py4vasp import _config, exception, raw
+from py4vasp._calculation import _average
 from py4vasp._calculation.density import Density
 from py4vasp._calculation.structure import Structure
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._raw.write import write
 from py4vasp._third_party.view import Isosurface
 
 
@@ -427,6 +432,79 @@ def test_noncollinear_to_quiver(noncollinear_density, Assert):
     assert series.label == expected_label
 
 
+@pytest.mark.parametrize("method", ("to_contour", "to_quiver"))
+def test_read_only_plane_from_file(raw_data, tmp_path, method, Assert):
+    raw_density = raw_data.density("Fe3O4 noncollinear")
+    with h5py.File(tmp_path / DEFAULT_FILE, "w") as h5f:
+        write(h5f, raw_density.structure)
+    with h5py.File(tmp_path / "vaspwave.h5", "w") as h5f:
+        write(h5f, raw_density)
+    expected = getattr(Density.from_data(raw_density), method)(b=0.3)
+    keys = []
+    read = h5py.Dataset.__getitem__
+
+    def spy(dataset, key):
+        if dataset.name == "/charge/charge":
+            keys.append(key)
+        return read(dataset, key)
+
+    with patch.object(h5py.Dataset, "__getitem__", spy):
+        actual = getattr(Density.from_path(tmp_path), method)(b=0.3)
+    Assert.allclose(actual.series[0].data, expected.series[0].data)
+    assert len(keys) > 0
+    index = round(0.3 * raw_density.charge.shape[2])
+    for key in keys:
+        assert key[2] == slice(index, index + 1, 1)
+
+
+@pytest.mark.parametrize(
+    "direction, axes", (("a", (1, 2)), ("b", (0, 2)), ("c", (0, 1)))
+)
+def test_to_planar_average(reference_density, direction, axes, Assert):
+    source = reference_density.ref.source
+    expected = reference_density.ref.output[source]
+    expected = np.mean(expected if source == "charge" else expected[0], axis=axes)
+    index = "abc".index(direction)
+    length = np.linalg.norm(reference_density.ref.structure.lattice_vectors()[index])
+    graph = reference_density.to_planar_average(direction=direction, chunk_size=3)
+    assert len(graph) == 1
+    assert graph.xlabel == f"distance along lattice vector {direction} (Å)"
+    assert graph.ylabel == "planar average"
+    series = graph.series[0]
+    assert series.label == source
+    Assert.allclose(series.x, np.arange(len(expected)) * length / len(expected))
+    Assert.allclose(series.y, expected)
+
+
+def test_collinear_to_planar_average(collinear_density, Assert):
+    if collinear_density.ref.source == "charge":
+        expected = collinear_density.ref.output["magnetization"]
+    else:
+        expected = collinear_density.ref.output["kinetic_energy"][1]
+    graph = collinear_density.to_planar_average("3")
+    Assert.allclose(graph.series[0].y, np.mean(expected, axis=(0, 1)))
+
+
+def test_to_macroscopic_average(nonpolarized_density, Assert):
+    window = (1.5, 2.3)
+    planar_average = nonpolarized_density.to_planar_average().series[0]
+    spacing = planar_average.x[1]
+    expected = _average.macroscopic_average(
+        planar_average.y, np.divide(window, spacing)
+    )
+    graph = nonpolarized_density.to_macroscopic_average(window=window)
+    assert graph.ylabel == "macroscopic average"
+    Assert.allclose(graph.series[0].x, planar_average.x)
+    Assert.allclose(graph.series[0].y, expected)
+
+
+def test_incorrect_direction_for_average(nonpolarized_density):
+    with pytest.raises(exception.IncorrectUsage):
+        nonpolarized_density.to_planar_average(direction="x")
+    with pytest.raises(exception.IncorrectUsage):
+        nonpolarized_density.to_planar_average(chunk_size=0)
+
+
 def test_to_quiver_supercell(collinear_density, Assert):
     graph = collinear_density.to_quiver(a=0, supercell=2)
     Assert.allclose(graph.series[0].supercell, (2, 2))
@@ -504,5 +582,8 @@ def test_print(reference_density, format_):
 
 def test_factory_methods(raw_data, check_factory_methods):
     data = raw_data.density("Fe3O4 collinear")
-    parameters = {"to_contour": {"a": 0.3}}
+    parameters = {
+        "to_contour": {"a": 0.3},
+        "to_macroscopic_average": {"window": 1.0},
+    }
     check_factory_methods(Density, data, parameters)
@@ -59,6 +59,7 @@ def test_plot_dispersion(dispersion, Assert):
         Assert.allclose(series.y, bands[:, :, index])
         assert series.label == label
         assert series.width is None
+        assert series.merge_lines
 
 
 def check_xticks(actual, reference, Assert):
@@ -91,6 +92,7 @@ def test_plot_dispersion_with_projections(dispersion, Assert):
         Assert.allclose(series.y, bands[:, :, component])
         assert series.label == label
         Assert.allclose(series.width, width.T)
+        assert series.merge_lines
 
 
 def test_print(dispersion, format_):
@@ -2,11 +2,12 @@
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 
 import types
+from unittest.mock import patch
 
 import numpy as np
 import pytest
 
-from py4vasp import exception
+from py4vasp import exception, raw
 from py4vasp._calculation.electronic_minimization import ElectronicMinimization
 
 
@@ -96,3 +97,97 @@ def test_is_converged(electronic_minimization):
 # def test_factory_methods(raw_data, check_factory_methods):
 #     data = raw_data.electronic_minimization()
 #     check_factory_methods(ElectronicMinimization, data)
+
+
+@pytest.fixture
+def multiple_ionic_steps(raw_data):
+    raw_elmin = raw_data.electronic_minimization()
+    lengths = [3, 5, 2, 4]
+    iteration_number = np.concatenate([np.arange(1, n + 1) for n in lengths])
+    convergence_data = np.random.rand(len(iteration_number), 7)
+    convergence_data[:, 0] = iteration_number
+    raw_elmin.convergence_data = raw.VaspData(convergence_data)
+    electronic_minimization = ElectronicMinimization.from_data(raw_elmin)
+    electronic_minimization.ref = types.SimpleNamespace()
+    electronic_minimization.ref.offsets = np.cumsum([0, *lengths])
+    electronic_minimization.ref.data = convergence_data
+    return electronic_minimization
+
+
+@pytest.mark.parametrize(
+    "steps, selected",
+    [(-1, [3]), (1, [1]), (slice(1, 3), [1, 2]), (slice(None, None, 2), [0, 2])],
+)
+def test_read_flat(multiple_ionic_steps, steps, selected, Assert):
+    electronic_minimization = multiple_ionic_steps
+    if steps != -1:
+        electronic_minimization = electronic_minimization[steps]
+    actual = electronic_minimization.read(flat=True)
+    offsets = multiple_ionic_steps.ref.offsets
+    rows = np.concatenate([np.arange(offsets[i], offsets[i + 1]) for i in selected])
+    expected = multiple_ionic_steps.ref.data[rows]
+    Assert.allclose(actual["offsets"], np.cumsum([0, *np.diff(offsets)[selected]]))
+    Assert.allclose(actual["E"], expected[:, 1])
+    Assert.allclose(actual["rms(c)"], expected[:, 6])
+
+
+def test_read_multiple_ionic_steps(multiple_ionic_steps, Assert):
+    actual = multiple_ionic_steps[1:3].read("dE")
+    offsets = multiple_ionic_steps.ref.offsets
+    expected = multiple_ionic_steps.ref.data[:, 2]
+    assert len(actual["dE"]) == 2
+    Assert.allclose(actual["dE"][0], expected[offsets[1] : offsets[2]])
+    Assert.allclose(actual["dE"][1], expected[offsets[2] : offsets[3]])
+    actual = multiple_ionic_steps.read("dE")
+    Assert.allclose(actual["dE"], expected[offsets[3] :])
+
+
+def test_to_frame(multiple_ionic_steps, Assert, not_core):
+    df = multiple_ionic_steps[::2].to_frame()
+    offsets = multiple_ionic_steps.ref.offsets
+    expected = multiple_ionic_steps.ref.data
+    rows = np.r_[offsets[0] : offsets[1], offsets[2] : offsets[3]]
+    assert list(df.columns) == [
+        "ionic_step",
+        "N",
+        "E",
+        "dE",
+        "deps",
+        "ncg",
+        "rms",
+        "rms(c)",
+    ]
+    Assert.allclose(df["ionic_step"], [1, 1, 1, 3, 3])
+    Assert.allclose(df["N"], expected[rows, 0])
+    Assert.allclose(df["rms"], expected[rows, 5])
+
+
+def test_print_multiple_ionic_steps(multiple_ionic_steps):
+    actual = str(multiple_ionic_steps[:])
+    assert actual.count("N\t\tE") == len(multiple_ionic_steps.ref.offsets) - 1
+    assert len(actual.splitlines()) == len(multiple_ionic_steps.ref.data) + 4
+
+
+def test_to_frame_reads_iteration_number_once(multiple_ionic_steps):
+    keys = []
+    getitem = raw.VaspData.__getitem__
+
+    def spy(data, key):
+        keys.append(key)
+        return getitem(data, key)
+
+    with patch.object(raw.VaspData, "__getitem__", spy):
+        multiple_ionic_steps[1:].to_frame()
+    assert keys.count((slice(None), 0)) == 1
+
+
+def test_plot_multiple_ionic_steps(multiple_ionic_steps, Assert):
+    graph = multiple_ionic_steps[1:3].plot("dE")
+    offsets = multiple_ionic_steps.ref.offsets
+    data = multiple_ionic_steps.ref.data
+    assert len(graph.series) == 2
+    for series, step in zip(graph.series, (1, 2)):
+        rows = slice(offsets[step], offsets[step + 1])
+        assert series.label == f"dE (step {step + 1})"
+        Assert.allclose(series.x, data[rows, 0])
+        Assert.allclose(series.y, data[rows, 2])
@@ -201,3 +201,14 @@ def test_print(steps, step_label, MD_energy, format_):
 def test_factory_methods(raw_data, check_factory_methods):
     data = raw_data.energy("MD")
     check_factory_methods(Energy, data)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 3])
+def test_iter_steps(MD_energy, chunk_size, Assert):
+    chunks = list(MD_energy.iter_steps("TOTEN, EKIN", chunk_size=chunk_size))
+    size = chunk_size or 1
+    assert len(chunks) == -(-MD_energy.ref.number_steps // size)
+    for start, chunk in zip(range(0, MD_energy.ref.number_steps, size), chunks):
+        steps = slice(start, start + size) if chunk_size else start
+        Assert.allclose(chunk["TOTEN"], MD_energy.ref.values[0, steps])
+        Assert.allclose(chunk["EKIN"], MD_energy.ref.values[1, steps])
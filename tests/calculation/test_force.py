@@ -1,12 +1,16 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import types
+from unittest.mock import patch
 
+import h5py
 import pytest
 
 from py4vasp import _config, exception
 from py4vasp._calculation.force import Force
 from py4vasp._calculation.structure import Structure
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._raw.write import write
 
 
 @pytest.fixture
@@ -114,3 +118,42 @@ POSITION                                       TOTAL-FORCE (eV/Angst)
 def test_factory_methods(raw_data, check_factory_methods):
     data = raw_data.force("Fe3O4")
     check_factory_methods(Force, data)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 2, 5])
+def test_iter_steps(forces, steps, chunk_size, Assert):
+    selected = forces if steps == -1 else forces[steps]
+    chunks = list(selected.iter_steps(chunk_size=chunk_size))
+    number_steps = len(forces.ref.forces)
+    all_steps = range(number_steps) if steps == -1 else range(number_steps)[steps]
+    if isinstance(all_steps, int):
+        all_steps = range(all_steps, all_steps + 1)
+    size = chunk_size or 1
+    assert len(chunks) == -(-len(all_steps) // size)
+    for start, chunk in zip(range(0, len(all_steps), size), chunks):
+        selection = all_steps[start : start + size]
+        selection = (
+            slice(selection.start, selection.stop) if chunk_size else selection[0]
+        )
+        reference_structure = forces.ref.structure[selection].read()
+        Assert.same_structure(chunk["structure"], reference_structure)
+        Assert.allclose(chunk["forces"], forces.ref.forces[selection])
+
+
+def test_iter_steps_opens_file_once(raw_data, tmp_path):
+    raw_forces = raw_data.force("Sr2TiO4")
+    with h5py.File(tmp_path / DEFAULT_FILE, "w") as h5f:
+        write(h5f, raw_forces)
+    forces = Force.from_path(tmp_path)
+    with patch("h5py.File", wraps=h5py.File) as mock_file:
+        chunks = list(forces[1:].iter_steps(chunk_size=2))
+    mock_file.assert_called_once()
+    assert len(chunks) == 2
+    assert chunks[0]["forces"].shape == (2, *raw_forces.forces.shape[1:])
+
+
+def test_iter_steps_incorrect_chunk_size(Sr2TiO4):
+    with pytest.raises(exception.IncorrectUsage):
+        next(Sr2TiO4.iter_steps(chunk_size=0))
+    with pytest.raises(exception.IncorrectUsage):
+        next(Sr2TiO4[999].iter_steps())
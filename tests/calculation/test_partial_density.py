@@ -2,13 +2,23 @@
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import dataclasses
 import types
+from unittest.mock import patch
 
+import h5py
 import numpy as np
 import pytest
 
-from py4vasp import _config
-from py4vasp._calculation.partial_density import PartialDensity, STM_settings
+from py4vasp import _config, raw
+from py4vasp._calculation import _average
+from py4vasp._calculation.partial_density import (
+    PartialDensity,
+    STM_settings,
+    _CurrentScanner,
+    _min_of_z_charge,
+)
 from py4vasp._calculation.structure import Structure
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._raw.write import write
 from py4vasp._util.slicing import plane
 from py4vasp.exception import IncorrectUsage, NoData, NotImplemented
 
@@ -228,6 +238,40 @@ def test_split_bands_to_numpy(
     Assert.allclose(actual, np.asarray(expected).T[:, :, :, 0, band_index, 0])
 
 
+def test_iter_bands(PolarizedAllSplitPartialDensity, spin, Assert, not_core):
+    partial_density = PolarizedAllSplitPartialDensity
+    bands = partial_density.ref.bands
+    kpoint = partial_density.ref.kpoints[-1]
+    actual = list(partial_density.iter_bands(spin, kpoint=kpoint))
+    assert [band for band, _ in actual] == list(bands)
+    for band, density in actual:
+        expected = partial_density.to_numpy(spin, band=band, kpoint=kpoint)
+        Assert.allclose(density, expected)
+
+
+def test_to_numpy_reads_only_selection(raw_data, tmp_path, Assert):
+    raw_partial_density = raw_data.partial_density("split_bands and spin_polarized")
+    with h5py.File(tmp_path / DEFAULT_FILE, "w") as h5f:
+        write(h5f, raw.Version(6, 5))
+        write(h5f, raw_partial_density)
+    partial_density = PartialDensity.from_path(tmp_path)
+    band = raw_partial_density.bands[1]
+    expected = np.asarray(raw_partial_density.partial_charge)[0, 1]
+    keys = []
+    read = h5py.Dataset.__getitem__
+
+    def spy(dataset, key):
+        if dataset.name.endswith("parchg"):
+            keys.append(key)
+        return read(dataset, key)
+
+    with patch.object(h5py.Dataset, "__getitem__", spy):
+        actual = partial_density.to_numpy("up", band=band)
+    Assert.allclose(actual, 0.5 * (expected[0] + expected[1]).T)
+    assert len(keys) == 1
+    assert keys[0][:2] == (0, 1)
+
+
 def test_to_stm_split(PolarizedAllSplitPartialDensity, not_core):
     msg = "set LSEPK and LSEPB to .FALSE. in the INCAR file."
     with pytest.raises(NotImplemented) as excinfo:
@@ -351,6 +395,64 @@ def test_to_stm_nonsplit_constant_current_non_ortho(
     assert f"{current:.2f}" in actual.title
 
 
+@pytest.mark.parametrize("interpolation_factor", (10, 2.5))
+@pytest.mark.parametrize("block_size", (_CurrentScanner.block_size, 100))
+def test_constant_current_agrees_with_dense_spline(
+    NonSplitPartialDensityCaAs3_110, interpolation_factor, block_size, Assert, not_core
+):
+    interpolate = pytest.importorskip("scipy.interpolate")
+    partial_density = NonSplitPartialDensityCaAs3_110
+    settings = STM_settings(interpolation_factor=interpolation_factor)
+    current = 0.1
+    with patch.object(_CurrentScanner, "block_size", block_size):
+        actual = partial_density.to_stm(
+            "current", current=current, stm_settings=settings
+        )
+    # reference evaluating the spline on a dense grid in z
+    charge = partial_density._get_stm_data("total", settings)
+    z_start = _min_of_z_charge(charge, settings.sigma_z, settings.truncate)
+    charge = np.roll(charge, -z_start, axis=2)
+    number_z = charge.shape[2]
+    z_step = 1 / interpolation_factor
+    z_grid = np.arange(number_z, 0, -z_step)
+    splines = interpolate.CubicSpline(range(number_z), charge, axis=-1)
+    scan = z_grid[np.argmax(splines(z_grid) >= current * 1e-9, axis=-1)]
+    expected = z_step * (scan - scan.min())
+    Assert.allclose(actual.series.data, expected, tolerance=100)
+
+
+def test_to_stm_series(PolarizedNonSplitPartialDensity, spin, Assert, not_core):
+    partial_density = PolarizedNonSplitPartialDensity
+    tip_heights = [1.5, 2.0]
+    currents = [1, 5, 10]
+    supercell = np.asarray([2, 3])
+    actual = partial_density.to_stm_series(
+        spin, tip_heights=tip_heights, currents=currents, supercell=supercell
+    )
+    assert len(actual) == len(tip_heights) + len(currents)
+    expected = [
+        partial_density.to_stm(f"height({spin})", tip_height=tip_height)
+        for tip_height in tip_heights
+    ]
+    expected += [
+        partial_density.to_stm(f"current({spin})", current=current)
+        for current in currents
+    ]
+    for series, reference in zip(actual, expected):
+        Assert.allclose(series.data, reference.series.data)
+        assert series.label == reference.series.label
+        Assert.allclose(series.supercell, supercell)
+
+
+def test_to_stm_series_incorrect_usage(PolarizedNonSplitPartialDensity, not_core):
+    with pytest.raises(IncorrectUsage):
+        PolarizedNonSplitPartialDensity.to_stm_series()
+    with pytest.raises(IncorrectUsage):
+        PolarizedNonSplitPartialDensity.to_stm_series("current", currents=[1])
+    with pytest.raises(IncorrectUsage):
+        PolarizedNonSplitPartialDensity.to_stm_series(tip_heights=[8.4])
+
+
 def test_stm_default_settings(PolarizedNonSplitPartialDensity, not_core):
     actual = dataclasses.asdict(PolarizedNonSplitPartialDensity.stm_settings)
     defaults = {
@@ -406,6 +508,33 @@ def test_interpolation_setting_change(PolarizedNonSplitPartialDensity, not_core)
     assert not np.allclose(graph_def.series.data, graph_less_interp_points.series.data)
 
 
+def test_to_planar_average(PolarizedNonSplitPartialDensity, spin, Assert, not_core):
+    graph = PolarizedNonSplitPartialDensity.to_planar_average(spin, chunk_size=7)
+    expected = PolarizedNonSplitPartialDensity.to_numpy(spin)
+    Assert.allclose(graph.series[0].y, np.mean(expected, axis=(0, 1)))
+
+
+def test_averages_of_band_and_kpoint(
+    PolarizedAllSplitPartialDensity, spin, Assert, not_core
+):
+    partial_density = PolarizedAllSplitPartialDensity
+    band = partial_density.ref.bands[-1]
+    kpoint = partial_density.ref.kpoints[-1]
+    density = partial_density.to_numpy(spin, band=band, kpoint=kpoint)
+    expected = np.mean(density, axis=(0, 1))
+    graph = partial_density.to_planar_average(spin, band=band, kpoint=kpoint)
+    Assert.allclose(graph.series[0].y, expected)
+    assert f"band {band}" in graph.series[0].label
+    assert f"k-point {kpoint}" in graph.series[0].label
+    graph = partial_density.to_macroscopic_average(
+        spin, window=1.0, band=band, kpoint=kpoint, direction="c"
+    )
+    spacing = graph.series[0].x[1]
+    expected = _average.macroscopic_average(expected, 1.0 / spacing)
+    Assert.allclose(graph.series[0].y, expected)
+
+
 def test_factory_methods(raw_data, check_factory_methods):
     data = raw_data.partial_density("spin_polarized")
-    check_factory_methods(PartialDensity, data)
+    parameters = {"to_macroscopic_average": {"window": 1.0}}
+    check_factory_methods(PartialDensity, data, parameters)
@@ -7,6 +7,7 @@ import numpy as np
 import pytest
 
 from py4vasp import _config, exception, raw
+from py4vasp._calculation import _average
 from py4vasp._calculation.potential import Potential
 from py4vasp._calculation.structure import Structure
 from py4vasp._third_party.view import Isosurface
@@ -203,6 +204,29 @@ def test_empty_potential(raw_data, selection):
         potential.plot(selection)
 
 
+def test_to_planar_average(reference_potential, Assert):
+    graph = reference_potential.to_planar_average(direction="b")
+    assert len(graph) == 1
+    assert graph.series[0].label == "total potential"
+    expected = np.mean(reference_potential.ref.output["total"], axis=(0, 2))
+    Assert.allclose(graph.series[0].y, expected)
+
+
+def test_spin_polarized_to_macroscopic_average(raw_data, Assert):
+    raw_potential = raw_data.potential("Fe3O4 collinear all")
+    potential = Potential.from_data(raw_potential)
+    expected = separate_potential("xc", raw_potential.xc_potential)
+    graph = potential.to_macroscopic_average("xc(up) down", window=2.0)
+    assert [series.label for series in graph] == [
+        "xc potential(up)",
+        "total potential(down)",
+    ]
+    planar_average = np.mean(expected["xc_up"], axis=(0, 1))
+    spacing = graph.series[0].x[1]
+    expected = _average.macroscopic_average(planar_average, 2.0 / spacing)
+    Assert.allclose(graph.series[0].y, expected)
+
+
 def test_print(reference_potential, format_):
     actual, _ = format_(reference_potential)
     assert actual == {"text/plain": reference_potential.ref.string}
@@ -210,4 +234,5 @@ def test_print(reference_potential, format_):
 
 def test_factory_methods(raw_data, check_factory_methods):
     data = raw_data.potential("Fe3O4 collinear total")
-    check_factory_methods(Potential, data)
+    parameters = {"to_macroscopic_average": {"window": 1.0}}
+    check_factory_methods(Potential, data, parameters)
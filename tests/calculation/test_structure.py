@@ -1,14 +1,20 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import io
 import re
 import types
+from unittest.mock import patch
 
+import h5py
 import numpy as np
 import pytest
 
 from py4vasp import exception
+from py4vasp._calculation import _trajectory
 from py4vasp._calculation._stoichiometry import Stoichiometry
-from py4vasp._calculation.structure import Structure
+from py4vasp._calculation.structure import EV_PER_A3_TO_KB, Structure
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._raw.write import write
 from py4vasp._util import check
 
 REF_POSCAR = """\
@@ -210,8 +216,11 @@ def test_to_poscar(Sr2TiO4, Ca3AsBr3):
     expected_poscar = REF_POSCAR.replace("Sr2TiO4", "Sr2TiO4 (step 1)")
     assert Sr2TiO4[0].to_POSCAR(**Sr2TiO4.ion_type_arg) == expected_poscar
     for steps in (slice(None), slice(1, 3)):
-        with pytest.raises(exception.NotImplemented):
-            Sr2TiO4[steps].to_POSCAR()
+        poscars = Sr2TiO4[steps].to_POSCAR(**Sr2TiO4.ion_type_arg)
+        range_ = range(len(Sr2TiO4.ref.positions))[steps]
+        assert len(poscars) == len(range_)
+        for step, poscar in zip(range_, poscars):
+            assert poscar == Sr2TiO4[step].to_POSCAR(**Sr2TiO4.ion_type_arg)
     assert Ca3AsBr3.to_POSCAR() == REF_Ca3AsBr3
 
 
@@ -285,6 +294,80 @@ def test_to_ase_Ca3AsBr3(Ca3AsBr3, Assert, not_core):
     assert all(structure.pbc)
 
 
+@pytest.fixture
+def Sr2TiO4_file(tmp_path, raw_data):
+    raw_structure = raw_data.structure("Sr2TiO4")
+    raw_force = raw_data.force("Sr2TiO4", randomize=True)
+    raw_stress = raw_data.stress("Sr2TiO4", randomize=True)
+    raw_energy = raw_data.energy("relax", randomize=True)
+    with h5py.File(tmp_path / DEFAULT_FILE, "w") as h5f:
+        for raw_quantity in (raw_structure, raw_force, raw_stress, raw_energy):
+            write(h5f, raw_quantity)
+    structure = make_structure(raw_structure)
+    reference = types.SimpleNamespace(
+        structure=structure.ref,
+        forces=raw_force.forces,
+        stress=raw_stress.stress,
+        energies=raw_energy.values,
+    )
+    return Structure.from_path(tmp_path), reference
+
+
+def test_to_ase_trajectory(Sr2TiO4_file, Assert, not_core):
+    structure, reference = Sr2TiO4_file
+    with patch("py4vasp._calculation.structure.ATOMS_PER_CHUNK", 10):
+        frames = structure[1:].to_ase_trajectory()
+        assert not isinstance(frames, list)
+        frames = list(frames)
+    assert len(frames) == 3
+    for step, atoms in enumerate(frames, start=1):
+        assert atoms.get_chemical_symbols() == reference.structure.elements
+        Assert.allclose(atoms.cell[:], reference.structure.lattice_vectors[step])
+        Assert.allclose(
+            atoms.get_scaled_positions(wrap=False), reference.structure.positions[step]
+        )
+        assert atoms.calc is None
+    (atoms,) = structure.to_ase_trajectory()
+    Assert.allclose(atoms.positions, structure.cartesian_positions())
+
+
+def test_to_ase_trajectory_with_results(Sr2TiO4_file, Assert, not_core):
+    structure, reference = Sr2TiO4_file
+    frames = structure[:3].to_ase_trajectory(
+        include_forces=True, include_stress=True, include_energies=True
+    )
+    for step, atoms in enumerate(frames):
+        Assert.allclose(atoms.get_forces(), reference.forces[step])
+        stress = -reference.stress[step] / EV_PER_A3_TO_KB
+        stress = 0.5 * (stress + stress.T)
+        Assert.allclose(atoms.get_stress(voigt=False), stress)
+        free_energy, _, sigma_0 = reference.energies[step]
+        Assert.allclose(atoms.get_potential_energy(), sigma_0)
+        Assert.allclose(atoms.get_potential_energy(force_consistent=True), free_energy)
+
+
+def test_write_ase_trajectory(Sr2TiO4_file, tmp_path, Assert, not_core):
+    import ase.io
+
+    structure, reference = Sr2TiO4_file
+    assert (
+        structure[:].to_ase_trajectory(filename="steps.traj", include_forces=True)
+        is None
+    )
+    frames = ase.io.read(tmp_path / "steps.traj", index=":")
+    assert len(frames) == len(reference.forces)
+    for step, atoms in enumerate(frames):
+        Assert.allclose(
+            atoms.get_scaled_positions(wrap=False), reference.structure.positions[step]
+        )
+        Assert.allclose(atoms.get_forces(), reference.forces[step])
+
+
+def test_ase_trajectory_requires_file(Sr2TiO4, not_core):
+    with pytest.raises(exception.IncorrectUsage):
+        list(Sr2TiO4[:].to_ase_trajectory(include_forces=True))
+
+
 def test_from_ase(Sr2TiO4, Assert, not_core):
     structure = Structure.from_ase(Sr2TiO4.to_ase(**Sr2TiO4.ion_type_arg))
     check_Sr2TiO4_structure(structure.read(), Sr2TiO4.ref, -1, Assert)
@@ -454,6 +537,102 @@ def test_ZnS_to_lammps(ZnS, not_core):
     assert ZnS.to_lammps(standard_form=False) == REF_LAMMPS_ZnS_general
 
 
+def test_Sr2TiO4_to_xdatcar(Sr2TiO4, Assert):
+    xdatcar = Sr2TiO4[1:].to_XDATCAR(**Sr2TiO4.ion_type_arg)
+    lines = xdatcar.splitlines()
+    # the unit cell is constant, so the header is only written once
+    assert "\n".join(lines[:7]) == "\n".join(REF_POSCAR.splitlines()[:7])
+    assert lines[7] == "Direct configuration=     2"
+    assert xdatcar.count("Direct configuration=") == 3
+    assert xdatcar.endswith("\n")
+    positions = np.loadtxt(io.StringIO(xdatcar), skiprows=7, comments="Direct")
+    Assert.allclose(
+        positions.reshape(3, 7, 3), Sr2TiO4.ref.positions[1:], tolerance=1e6
+    )
+
+
+def test_Fe3O4_to_xdatcar(Fe3O4, Assert):
+    xdatcar = Fe3O4[:].to_XDATCAR()
+    # the unit cell changes, so every step has its own header
+    assert xdatcar.count("Fe3O4\n") == len(Fe3O4.ref.positions)
+    headers = xdatcar.split("Fe3O4\n")[1:]
+    for header, lattice_vectors in zip(headers, Fe3O4.ref.lattice_vectors):
+        actual = np.loadtxt(io.StringIO(header), skiprows=1, max_rows=3)
+        Assert.allclose(actual, lattice_vectors)
+    assert Fe3O4.to_XDATCAR().count("Direct configuration=") == 1
+
+
+def test_to_extxyz(Fe3O4, Assert):
+    extxyz = Fe3O4[:].to_extxyz()
+    lines = extxyz.splitlines()
+    number_lines = 7 + 2
+    assert len(lines) == len(Fe3O4.ref.positions) * number_lines
+    for step, lattice_vectors in enumerate(Fe3O4.ref.lattice_vectors):
+        assert lines[step * number_lines] == "7"
+        comment = lines[step * number_lines + 1]
+        lattice = re.search('Lattice="(.*?)"', comment).group(1)
+        Assert.allclose(
+            np.fromstring(lattice, sep=" "), lattice_vectors.flatten(), tolerance=1e6
+        )
+        assert comment.endswith(f"step={step + 1}")
+        ions = lines[step * number_lines + 2 : (step + 1) * number_lines]
+        assert [ion.split()[0] for ion in ions] == Fe3O4.ref.elements
+        positions = np.array([ion.split()[1:] for ion in ions], dtype=float)
+        reference = Fe3O4.ref.positions[step] @ lattice_vectors
+        Assert.allclose(positions, reference, tolerance=1e6)
+
+
+def test_to_lammps_dump(Fe3O4, Assert):
+    dump = Fe3O4[1:3].to_lammps_dump()
+    steps = dump.split("ITEM: TIMESTEP\n")[1:]
+    assert len(steps) == 2
+    for step, text in zip((1, 2), steps):
+        lines = text.splitlines()
+        assert lines[:3] == [str(step + 1), "ITEM: NUMBER OF ATOMS", "7"]
+        assert lines[3] == "ITEM: BOX BOUNDS xy xz yz pp pp pp"
+        bounds = np.loadtxt(lines[4:7])
+        assert lines[7] == "ITEM: ATOMS id type element x y z"
+        atoms = np.array([line.split() for line in lines[8:]])
+        Assert.allclose(atoms[:, 0].astype(int), np.arange(1, 8))
+        Assert.allclose(atoms[:, 1].astype(int), [1, 1, 1, 2, 2, 2, 2])
+        assert list(atoms[:, 2]) == Fe3O4.ref.elements
+        lattice_vectors = Fe3O4.ref.lattice_vectors[step]
+        standard_cell = _trajectory.standard_form(lattice_vectors)
+        Assert.allclose(bounds[:, 2], standard_cell[[1, 2, 2], [0, 0, 1]])
+        reference = Fe3O4.ref.positions[step] @ standard_cell
+        Assert.allclose(atoms[:, 3:].astype(float), reference, tolerance=1e6)
+
+
+def test_to_lammps_dump_with_ion_types(Fe3O4):
+    dump = Fe3O4.to_lammps_dump(ion_types=["Co", "S"])
+    lines = dump.splitlines()[9:]
+    assert [line.split()[1] for line in lines] == 3 * ["1"] + 4 * ["2"]
+    assert [line.split()[2] for line in lines] == 3 * ["Co"] + 4 * ["S"]
+
+
+def test_standard_form(Assert):
+    lattice_vectors = np.array([[[4, 1, 0.5], [-1, 3, 0.2], [0.3, 0.4, 5]]] * 2)
+    lattice_vectors[1] = -lattice_vectors[1]  # left-handed cell
+    standard_cell = _trajectory.standard_form(lattice_vectors)
+    for actual, reference in zip(standard_cell, lattice_vectors):
+        Assert.allclose(np.triu(actual, 1), 0)
+        assert np.all(np.diag(actual) > 0)
+        Assert.allclose(actual @ actual.T, reference @ reference.T)
+
+
+def test_write_trajectory_to_file(Fe3O4, tmp_path):
+    expected = Fe3O4[:].to_extxyz()
+    with patch("py4vasp._calculation.structure.ATOMS_PER_CHUNK", 10):
+        assert Fe3O4[:].to_extxyz(filename=tmp_path / "absolute.xyz") is None
+        Fe3O4._path = tmp_path
+        Fe3O4[:].to_extxyz(filename="relative.xyz")
+        buffer = io.StringIO()
+        Fe3O4[:].to_extxyz(filename=buffer)
+    assert (tmp_path / "absolute.xyz").read_text() == expected
+    assert (tmp_path / "relative.xyz").read_text() == expected
+    assert buffer.getvalue() == expected
+
+
 @pytest.mark.parametrize("steps", (None, 0, slice(1, 3)))
 def test_print_final(Sr2TiO4, steps, format_):
     if steps is None:
@@ -491,3 +670,19 @@ def test_factory_methods(raw_data, check_factory_methods):
     data = raw_data.structure("Sr2TiO4")
     parameters = {"__getitem__": {"steps": slice(None)}}
     check_factory_methods(Structure, data, parameters)
+
+
+def test_iter_steps(Fe3O4, Assert):
+    steps = list(Fe3O4.iter_steps())
+    assert len(steps) == len(Fe3O4.ref.positions)
+    for step, actual in enumerate(steps):
+        check_Fe3O4_structure(actual, Fe3O4.ref, step, Assert)
+    chunks = list(Fe3O4[::-2].iter_steps(chunk_size=3))
+    assert len(chunks) == 1
+    check_Fe3O4_structure(chunks[0], Fe3O4.ref, slice(None, None, -2), Assert)
+
+
+def test_iter_steps_single_structure(Ca3AsBr3, Assert):
+    steps = list(Ca3AsBr3.iter_steps())
+    assert len(steps) == 1
+    Assert.allclose(steps[0]["positions"], Ca3AsBr3.ref.positions)
@@ -109,3 +109,13 @@ def test_print_Sr2TiO4(Sr2TiO4, format_):
 def test_factory_methods(raw_data, check_factory_methods):
     data = raw_data.velocity("Fe3O4")
     check_factory_methods(Velocity, data)
+
+
+def test_iter_steps(velocities, Assert):
+    chunks = list(velocities[1:].iter_steps(chunk_size=2))
+    Assert.allclose(chunks[0]["velocities"], velocities.ref.velocities[1:3])
+    Assert.allclose(chunks[-1]["velocities"], velocities.ref.velocities[3:])
+    steps = list(velocities.iter_steps())
+    assert len(steps) == len(velocities.ref.velocities)
+    for step, actual in enumerate(steps):
+        Assert.allclose(actual["velocities"], velocities.ref.velocities[step])
@@ -2,8 +2,11 @@
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 
+from py4vasp import raw
+from py4vasp._calculation import _average
 from py4vasp._calculation.workfunction import Workfunction
 
 
@@ -44,6 +47,21 @@ def test_plot(workfunction, Assert):
     assert graph.series.label == "potential"
 
 
+def test_to_macroscopic_average(raw_data, Assert):
+    raw_workfunction = raw_data.workfunction("3")
+    number_points = len(raw_workfunction.average_potential)
+    distance = np.arange(number_points) * 0.2
+    raw_workfunction.distance = raw.VaspData(distance)
+    workfunction = Workfunction.from_data(raw_workfunction)
+    graph = workfunction.to_macroscopic_average(window=3.0)
+    assert graph.xlabel == "distance along lattice vector 3 (Å)"
+    assert graph.series.label == "macroscopic average"
+    average_potential = raw_workfunction.average_potential
+    expected = _average.macroscopic_average(average_potential, 3.0 / 0.2)
+    Assert.allclose(graph.series.x, raw_workfunction.distance)
+    Assert.allclose(graph.series.y, expected)
+
+
 @patch.object(Workfunction, "to_graph")
 def test_to_plotly(mock_plot, workfunction):
     fig = workfunction.to_plotly()
@@ -88,4 +106,5 @@ workfunction along {lattice_vector}:
 
 def test_factory_methods(raw_data, check_factory_methods):
     raw_workfunction = raw_data.workfunction("1")
-    check_factory_methods(Workfunction, raw_workfunction)
+    parameters = {"to_macroscopic_average": {"window": 1.0}}
+    check_factory_methods(Workfunction, raw_workfunction, parameters)
@@ -0,0 +1,131 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import os
+from unittest.mock import patch
+
+import h5py
+import numpy as np
+import pytest
+
+from py4vasp import raw
+from py4vasp._raw.cache import DataCache
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._raw.write import write
+
+
+@pytest.fixture
+def cache():
+    cache = DataCache()
+    with patch("py4vasp._raw.access.data_cache", cache):
+        yield cache
+
+
+@pytest.fixture
+def structure_file(tmp_path, raw_data):
+    raw_structure = raw_data.structure("Sr2TiO4")
+    with h5py.File(tmp_path / DEFAULT_FILE, "w") as h5f:
+        write(h5f, raw_structure)
+    return tmp_path, raw_structure
+
+
+def test_inactive_by_default(cache, structure_file):
+    path, _ = structure_file
+    assert not raw.data_cache.is_active
+    with patch("h5py.File", wraps=h5py.File) as mock_file:
+        for _ in range(2):
+            with raw.access("structure", path=path):
+                pass
+        assert mock_file.call_count == 2
+    assert len(cache) == 0
+
+
+def test_access_cached_data(cache, structure_file, Assert):
+    path, raw_structure = structure_file
+    cache.enable()
+    with patch("h5py.File", wraps=h5py.File) as mock_file:
+        for _ in range(3):
+            with raw.access("structure", path=path) as structure:
+                Assert.same_raw_structure(raw_structure, structure)
+        mock_file.assert_called_once()
+    # structure links to cell and stoichiometry
+    assert cache.misses == 3
+    assert cache.hits == 2
+    assert len(cache) == 3
+    assert cache.nbytes > 0
+
+
+def test_cached_data_outlives_file(cache, structure_file, Assert):
+    path, raw_structure = structure_file
+    cache.enable()
+    with raw.access("structure", path=path) as structure:
+        pass
+    Assert.same_raw_structure(raw_structure, structure)
+
+
+def test_invalidate_modified_file(cache, structure_file):
+    path, _ = structure_file
+    cache.enable()
+    with raw.access("structure", path=path) as first:
+        pass
+    filename = path / DEFAULT_FILE
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    with raw.access("structure", path=path) as second:
+        pass
+    assert first is not second
+    assert len(cache) == 3
+
+
+def test_skip_large_datasets(cache, structure_file):
+    path, _ = structure_file
+    cache.enable(max_dataset_bytes=8)
+    with raw.access("structure", path=path):
+        pass
+    assert len(cache) == 0
+    with raw.access("structure", path=path) as structure:
+        assert not isinstance(structure.positions.data, np.ndarray)
+
+
+def test_memory_budget(cache, structure_file):
+    path, _ = structure_file
+    cache.enable()
+    with raw.access("structure", path=path):
+        pass
+    budget = cache.nbytes - 1
+    cache.enable(max_bytes=budget)
+    assert cache.nbytes <= budget
+    assert 0 < len(cache) < 3
+
+
+def test_disable_releases_data(cache, structure_file):
+    path, _ = structure_file
+    cache.enable()
+    with raw.access("structure", path=path):
+        pass
+    cache.disable()
+    assert not cache.is_active
+    assert len(cache) == 0
+    assert cache.hits == cache.misses == 0
+
+
+def test_modify_cached_data(cache, structure_file, Assert):
+    path, raw_structure = structure_file
+    cache.enable()
+    for _ in range(2):
+        with raw.access("structure", path=path) as structure:
+            structure.positions.data[:] = 99
+            structure.cell.lattice_vectors.data[:] = 99
+    with raw.access("structure", path=path) as structure:
+        Assert.same_raw_structure(raw_structure, structure)
+    assert cache.hits == 2
+
+
+def test_count_linked_data(cache, structure_file):
+    path, raw_structure = structure_file
+    cache.enable()
+    with raw.access("structure", path=path):
+        pass
+    with raw.access("cell", path=path) as cell:
+        cell_bytes = np.asarray(cell.lattice_vectors).nbytes
+    key = cache.make_key(path / DEFAULT_FILE, "structure", "default")
+    assert cache._entries[key].nbytes >= raw_structure.positions.nbytes + cell_bytes
@@ -1,7 +1,8 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import h5py
 import hypothesis.extra.numpy as np_strat
 import hypothesis.strategies as strategy
 import numpy as np
@@ -179,3 +180,103 @@ def test_nested_data():
     assert VaspData(data).is_none()
     data = np.zeros(10)
     assert isinstance(VaspData(data).data, np.ndarray)
+
+
+@pytest.fixture
+def hdf5_data(tmp_path):
+    reference = np.arange(5 * 4 * 3).reshape(5, 4, 3)
+    with h5py.File(tmp_path / "example.h5", "w") as h5f:
+        h5f["data"] = reference
+    with h5py.File(tmp_path / "example.h5", "r") as h5f:
+        yield VaspData(h5f["data"]), reference
+
+
+INDICES = (
+    -1,
+    (slice(None), 1),
+    slice(None, None, -1),
+    (slice(None, None, -2), 2),
+    ([3, 0, 3],),
+    (slice(1, 4), [2, 0]),
+    (..., 1),
+    (1, ..., [0, 2]),
+    ([0, 1], slice(None), 2),
+    np.array([True, False, True, False, True]),
+    slice(5, 5),
+    (2, 3, 1),
+    (None, 1),
+    ([0, 1], [1, 2]),
+)
+
+
+@pytest.mark.parametrize("key", INDICES)
+def test_hdf5_slices(hdf5_data, key, Assert):
+    data, reference = hdf5_data
+    assert data[key].shape == reference[key].shape
+    Assert.allclose(data[key], reference[key])
+
+
+@pytest.mark.parametrize("first", INDICES[:10])
+@pytest.mark.parametrize("second", INDICES[:10])
+def test_lazy_composition(hdf5_data, first, second, Assert):
+    data, reference = hdf5_data
+    try:
+        expected = reference[first][second]
+    except IndexError:
+        with pytest.raises(IndexError):
+            np.asarray(data.lazy[first].lazy[second])
+        return
+    actual = data.lazy[first].lazy[second]
+    assert isinstance(actual, VaspData)
+    assert actual.shape == expected.shape
+    Assert.allclose(np.asarray(actual), expected)
+
+
+def test_lazy_reads_only_final_selection(hdf5_data, Assert):
+    data, reference = hdf5_data
+    keys = []
+    read = h5py.Dataset.__getitem__
+
+    def spy(dataset, key):
+        keys.append(key)
+        return read(dataset, key)
+
+    with patch.object(h5py.Dataset, "__getitem__", spy):
+        lazy = data.lazy[1:4].lazy[-1].lazy[:, ::2]
+        assert keys == []
+        Assert.allclose(lazy, reference[3, :, ::2])
+    assert keys == [(3, slice(0, 4, 1), slice(0, 3, 2))]
+
+
+def test_sparse_index_array_reads_only_selected_rows(tmp_path, Assert):
+    reference = np.arange(200 * 3).reshape(200, 3)
+    with h5py.File(tmp_path / "example.h5", "w") as h5f:
+        h5f["data"] = reference
+    keys = []
+    read = h5py.Dataset.__getitem__
+
+    def spy(dataset, key):
+        keys.append(key)
+        return read(dataset, key)
+
+    with h5py.File(tmp_path / "example.h5", "r") as h5f:
+        data = VaspData(h5f["data"])
+        with patch.object(h5py.Dataset, "__getitem__", spy):
+            Assert.allclose(data[[0, -1]], reference[[0, -1]])
+            Assert.allclose(data[[150, 3, 150], 1], reference[[150, 3, 150], 1])
+    assert len(keys) == 2
+    assert np.array_equal(keys[0][0], [0, 199])
+    assert np.array_equal(keys[1][0], [3, 150])
+
+
+def test_lazy_from_array(Assert):
+    reference = np.arange(10).reshape(5, 2)
+    data = VaspData(reference)
+    Assert.allclose(data.lazy[::2].lazy[:, 1], reference[::2, 1])
+
+
+@pytest.mark.parametrize("key", (5, (0, 4), ([7],), (..., ...), (0, 0, 0, 0)))
+def test_hdf5_out_of_bounds(hdf5_data, key):
+    data, _ = hdf5_data
+    with pytest.raises(IndexError):
+        data[key]
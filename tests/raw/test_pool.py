@@ -0,0 +1,195 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import os
+import threading
+from unittest.mock import patch
+
+import h5py
+import pytest
+
+from py4vasp import Calculation, exception, raw
+from py4vasp._raw.definition import DEFAULT_FILE
+from py4vasp._raw.pool import FilePool
+from py4vasp._raw.write import write
+
+
+@pytest.fixture
+def pool():
+    pool = FilePool(max_open_files=2)
+    with patch("py4vasp._raw.access.file_pool", pool):
+        yield pool
+    pool.disable()
+
+
+@pytest.fixture
+def make_file(tmp_path):
+    def _make_file(name="example.h5"):
+        filename = tmp_path / name
+        with h5py.File(filename, "w") as h5f:
+            h5f["data"] = [1, 2, 3]
+        return filename
+
+    return _make_file
+
+
+def test_inactive_by_default(pool):
+    assert not pool.is_active
+    assert not raw.file_pool.is_active
+
+
+def test_reuse_handle(pool, make_file):
+    filename = make_file()
+    pool.enable()
+    first = pool.open(filename)
+    second = pool.open(filename)
+    assert first is second
+    assert first.id.valid
+    pool.disable()
+    assert not first.id.valid
+    assert len(pool) == 0
+
+
+def test_reopen_modified_file(pool, make_file):
+    filename = make_file()
+    pool.enable()
+    first = pool.open(filename)
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = pool.open(filename)
+    assert first is not second
+    assert not first.id.valid
+    assert second.id.valid
+    assert len(pool) == 1
+
+
+def test_evict_least_recently_used(pool, make_file):
+    filenames = [make_file(f"file{i}.h5") for i in range(3)]
+    pool.enable()
+    first = pool.open(filenames[0])
+    second = pool.open(filenames[1])
+    pool.open(filenames[0])
+    pool.open(filenames[2])
+    assert len(pool) == 2
+    assert first.id.valid
+    assert not second.id.valid
+
+
+def test_pinned_handles_are_not_evicted(pool, make_file):
+    filenames = [make_file(f"file{i}.h5") for i in range(3)]
+    pool.enable()
+    with pool.pinned(filenames[0]) as first:
+        second = pool.open(filenames[1])
+        pool.open(filenames[2])
+        assert first.id.valid
+        assert not second.id.valid
+        assert len(pool) == 2
+    assert first.id.valid
+    pool.open(filenames[1])
+    assert not first.id.valid
+
+
+def test_access_keeps_file_open(pool, tmp_path, raw_data, Assert):
+    raw_structure = raw_data.structure("Sr2TiO4")
+    paths = [tmp_path / f"calc_{i}" for i in range(3)]
+    for path in paths:
+        path.mkdir()
+        with h5py.File(path / DEFAULT_FILE, "w") as h5f:
+            write(h5f, raw_structure)
+    pool.enable()
+    with raw.access("structure", path=paths[0]) as structure:
+        for path in paths[1:]:
+            with raw.access("structure", path=path):
+                pass
+        Assert.same_raw_structure(raw_structure, structure)
+    assert len(pool) == 2
+
+
+def test_session_pins_handles(pool, make_file):
+    filenames = [make_file(f"file{i}.h5") for i in range(3)]
+    with pool.session():
+        assert pool.is_active
+        handles = [pool.open(filename) for filename in filenames]
+        assert len(pool) == 3
+        assert all(handle.id.valid for handle in handles)
+    assert not pool.is_active
+    assert len(pool) == 0
+    assert not any(handle.id.valid for handle in handles)
+
+
+def test_nested_session(pool, make_file):
+    filename = make_file()
+    with pool.session():
+        with pool.session():
+            handle = pool.open(filename)
+        assert handle.id.valid
+    assert not handle.id.valid
+
+
+def test_sessions_in_threads(pool, make_file):
+    filenames = [make_file(f"file{i}.h5") for i in range(3)]
+    other_session_entered = threading.Event()
+    finished = threading.Event()
+
+    def other_thread():
+        with pool.session():
+            other_session_entered.set()
+            finished.wait()
+
+    thread = threading.Thread(target=other_thread)
+    try:
+        with pool.session():
+            thread.start()
+            other_session_entered.wait()
+            handle = pool.open(filenames[0])
+        # the session of the other thread keeps the pool active but does not pin
+        # the file opened in this thread
+        assert pool.is_active
+        pool.open(filenames[1])
+        pool.open(filenames[2])
+        assert not handle.id.valid
+    finally:
+        finished.set()
+        thread.join()
+    assert not pool.is_active
+    assert len(pool) == 0
+
+
+def test_session_keeps_enabled_pool(pool, make_file):
+    filename = make_file()
+    pool.enable()
+    with pool.session():
+        handle = pool.open(filename)
+    assert handle.id.valid
+    assert len(pool) == 1
+
+
+def test_missing_file(pool, tmp_path):
+    pool.enable()
+    with pytest.raises(exception.FileAccessError):
+        pool.open(tmp_path / "does_not_exist.h5")
+
+
+def test_access_through_pool(pool, tmp_path, raw_data, Assert):
+    raw_structure = raw_data.structure("Sr2TiO4")
+    with h5py.File(tmp_path / DEFAULT_FILE, "w") as h5f:
+        write(h5f, raw_structure)
+    pool.enable()
+    with patch("h5py.File", wraps=h5py.File) as mock_file:
+        for _ in range(3):
+            with raw.access("structure", path=tmp_path) as structure:
+                Assert.same_raw_structure(raw_structure, structure)
+        mock_file.assert_called_once()
+
+
+def test_calculation_session(pool, tmp_path, raw_data):
+    raw_energy = raw_data.energy("relax")
+    with h5py.File(tmp_path / DEFAULT_FILE, "w") as h5f:
+        write(h5f, raw_energy)
+    calculation = Calculation.from_path(tmp_path)
+    with patch("py4vasp.raw.file_pool", pool):
+        with patch("h5py.File", wraps=h5py.File) as mock_file:
+            with calculation.session():
+                calculation.energy.read()
+                calculation.energy[:].read()
+            mock_file.assert_called_once()
+    assert len(pool) == 0
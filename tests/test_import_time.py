@@ -0,0 +1,28 @@
+# Copyright © VASP Software GmbH,
+# Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import subprocess
+import sys
+
+# generous limit so that the test is robust on slow file systems; optional
+# dependencies alone would take several seconds to import
+IMPORT_TIME_BUDGET = 2.0  # seconds
+SLOW_PACKAGES = {"plotly", "pandas", "ase", "scipy", "mdtraj", "nglview", "IPython"}
+
+
+def test_import_time():
+    timings = measure_import_time()
+    assert not SLOW_PACKAGES & timings.keys()
+    assert timings["py4vasp"] < IMPORT_TIME_BUDGET
+
+
+def measure_import_time():
+    command = (sys.executable, "-X", "importtime", "-c", "import py4vasp")
+    result = subprocess.run(command, capture_output=True, text=True, check=True)
+    lines = result.stderr.splitlines()[1:]  # skip header
+    return dict(parse_line(line) for line in lines if line.startswith("import time:"))
+
+
+def parse_line(line):
+    # format: "import time: self [us] | cumulative | imported package"
+    _, cumulative, package = line.split("|")
+    return package.strip(), int(cumulative) * 1e-6
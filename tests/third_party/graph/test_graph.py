@@ -8,6 +8,8 @@ import pytest
 
 from py4vasp import _config, exception
 from py4vasp._third_party.graph import Contour, Graph, Series
+from py4vasp._third_party.graph.graph import WEBGL_THRESHOLD
+from py4vasp._third_party.graph.series import MAX_POINTS_PER_LINE
 from py4vasp._util import import_, slicing
 
 px = import_.optional("plotly.express")
@@ -245,6 +247,93 @@ def test_two_fatband_with_marker(two_fatbands, Assert, not_core):
         Assert.allclose(converted.marker.size, w)
 
 
+def test_merge_lines(two_lines, Assert, not_core):
+    merged = dataclasses.replace(two_lines, merge_lines=True)
+    fig = Graph(merged).to_plotly()
+    assert len(fig.data) == 1
+    assert fig.data[0].type == "scatter"
+    assert fig.data[0].name == two_lines.label
+    assert fig.data[0].showlegend
+    gap = [np.nan]
+    expected_x = np.concatenate((two_lines.x, gap, two_lines.x))
+    expected_y = np.concatenate((two_lines.y[0], gap, two_lines.y[1]))
+    Assert.allclose(fig.data[0].x, expected_x)
+    Assert.allclose(fig.data[0].y, expected_y)
+
+
+def test_merge_long_lines_without_decimation(not_core):
+    x = np.arange(2 * MAX_POINTS_PER_LINE)
+    merged = Series(x, np.ones((3, len(x))), merge_lines=True)
+    fig = Graph(merged, webgl=False).to_plotly()
+    assert len(fig.data[0].x) == 3 * len(x) + 2
+
+
+def test_webgl_lines(two_lines, Assert, not_core):
+    fig = Graph(two_lines, webgl=True).to_plotly()
+    assert len(fig.data) == 1
+    assert fig.data[0].type == "scattergl"
+    assert fig.data[0].name == two_lines.label
+    assert fig.data[0].showlegend
+    gap = [np.nan]
+    expected_x = np.concatenate((two_lines.x, gap, two_lines.x))
+    expected_y = np.concatenate((two_lines.y[0], gap, two_lines.y[1]))
+    Assert.allclose(fig.data[0].x, expected_x)
+    Assert.allclose(fig.data[0].y, expected_y)
+
+
+def test_webgl_fatbands(two_fatbands, Assert, not_core):
+    reference = Graph(two_fatbands).to_plotly()
+    fig = Graph(two_fatbands, webgl=True).to_plotly()
+    assert len(fig.data) == 1
+    assert fig.data[0].type == "scattergl"
+    assert fig.data[0].fill == "toself"
+    gap = [np.nan]
+    expected_x = np.concatenate((reference.data[0].x, gap, reference.data[1].x))
+    expected_y = np.concatenate((reference.data[0].y, gap, reference.data[1].y))
+    Assert.allclose(fig.data[0].x, expected_x)
+    Assert.allclose(fig.data[0].y, expected_y)
+
+
+def test_webgl_fatbands_with_marker(two_fatbands, Assert, not_core):
+    with_marker = dataclasses.replace(two_fatbands, marker="o", use_webgl=True)
+    fig = Graph(with_marker).to_plotly()
+    assert len(fig.data) == 1
+    assert fig.data[0].type == "scattergl"
+    assert fig.data[0].mode == "markers"
+    Assert.allclose(fig.data[0].x, np.tile(two_fatbands.x, 2))
+    Assert.allclose(fig.data[0].y, two_fatbands.y.flatten())
+    Assert.allclose(fig.data[0].marker.size, two_fatbands.width.flatten())
+
+
+def test_webgl_decimates_long_lines(Assert, not_core):
+    x = np.linspace(0, 1, 100_000)
+    y = np.random.random((2, len(x)))
+    fig = Graph(Series(x, y), webgl=True).to_plotly()
+    gap = np.flatnonzero(np.isnan(fig.data[0].y))
+    assert len(gap) == 1
+    for line in np.split(np.array(fig.data[0].y), gap):
+        line = line[np.isfinite(line)]
+        assert len(line) <= MAX_POINTS_PER_LINE
+    actual_x = np.array(fig.data[0].x)[: gap[0]]
+    actual_y = np.array(fig.data[0].y)[: gap[0]]
+    assert np.all(np.diff(actual_x) >= 0)
+    Assert.allclose(actual_x[[0, -1]], x[[0, -1]])
+    Assert.allclose(actual_y[[0, -1]], y[0, [0, -1]])
+    assert np.max(actual_y) == np.max(y[0])
+    assert np.min(actual_y) == np.min(y[0])
+
+
+def test_webgl_enabled_for_large_graphs(parabola, not_core):
+    fig = Graph(parabola).to_plotly()
+    assert fig.data[0].type == "scatter"
+    x = np.arange(WEBGL_THRESHOLD // 100 + 1)
+    large = Series(x, np.ones((100, len(x))))
+    fig = Graph([parabola, large]).to_plotly()
+    assert [data.type for data in fig.data] == ["scattergl", "scattergl"]
+    fig = Graph([parabola, large], webgl=False).to_plotly()
+    assert len(fig.data) == 101
+
+
 def test_custom_xticks(parabola, not_core):
     graph = Graph(parabola)
     graph.xticks = {0.1: "X", 0.3: "Y", 0.4: "", 0.8: "Z"}
@@ -412,6 +501,40 @@ def test_convert_different_length_series_to_frame(
     Assert.allclose(df["two_lines.y1"], padded_two_lines_y[1])
 
 
+@pytest.mark.parametrize("compression", (None, "gzip"))
+def test_write_hdf(tmp_path, parabola, two_lines, compression, Assert):
+    import h5py
+
+    graph = Graph([two_lines, parabola])
+    graph.to_hdf(tmp_path / "filename.h5", compression=compression)
+    with h5py.File(tmp_path / "filename.h5", "r") as h5f:
+        assert set(h5f) == {
+            "two_lines.x",
+            "two_lines.y0",
+            "two_lines.y1",
+            "parabola.x",
+            "parabola.y",
+        }
+        Assert.allclose(h5f["two_lines.x"][:], two_lines.x)
+        Assert.allclose(h5f["two_lines.y1"][:], two_lines.y[1])
+        Assert.allclose(h5f["parabola.y"][:], parabola.y)
+        assert h5f["parabola.x"].compression == compression
+
+
+@pytest.mark.parametrize("format", ("parquet", "feather"))
+def test_write_arrow_formats(tmp_path, parabola, two_lines, format, Assert, not_core):
+    pytest.importorskip("pyarrow")
+    import pandas as pd
+
+    graph = Graph([two_lines, parabola])
+    filename = tmp_path / f"filename.{format}"
+    getattr(graph, f"to_{format}")(filename)
+    actual = getattr(pd, f"read_{format}")(filename)
+    ref = graph.to_frame()
+    assert list(actual.columns) == list(ref.columns)
+    Assert.allclose(actual.values, ref.values)
+
+
 @patch("plotly.graph_objs.Figure._ipython_display_")
 def test_ipython_display(mock_display, parabola, not_core):
     graph = Graph(parabola)
@@ -530,6 +653,23 @@ def test_contour_interpolate(tilted_contour, Assert, not_core):
     check_annotations(tilted_contour.lattice, fig.layout.annotations, Assert)
 
 
+@pytest.mark.parametrize("vectors", ([[2, 0], [1, 3]], [[2, 3], [2, -3]]))
+def test_contour_interpolation_of_periodic_data(vectors, Assert, not_core):
+    shape = (8, 9)
+    function = lambda a, b: np.cos(2 * np.pi * a) + np.sin(2 * np.pi * (a - 3 * b))
+    fractions = [(np.arange(points) + 0.5) / points for points in shape]
+    data = function(*np.meshgrid(*fractions, indexing="ij"))
+    lattice = slicing.Plane(np.array(vectors, dtype=np.float64), cut="c")
+    contour = Contour(data, lattice, "periodic", supercell=(2, 1))
+    fig = Graph(contour).to_plotly()
+    x, y = np.meshgrid(fig.data[0].x, fig.data[0].y)
+    fractions = np.stack((x, y), axis=-1) @ np.linalg.inv(lattice.vectors)
+    a, b = np.moveaxis(fractions, -1, 0)
+    finite = np.isfinite(fig.data[0].z)
+    assert np.any(finite)
+    Assert.allclose(fig.data[0].z[finite], function(a, b)[finite], tolerance=1000)
+
+
 def test_mix_contour_and_series(two_lines, rectangle_contour, not_core):
     graph = Graph([rectangle_contour, two_lines])
     fig = graph.to_plotly()
@@ -612,6 +752,37 @@ def test_complex_quiver(complex_quiver, Assert, not_core):
     assert len(fig.layout.annotations) == 0
 
 
+@pytest.mark.parametrize("max_number_arrows", (None, 680))
+def test_webgl_quiver(complex_quiver, max_number_arrows, Assert, not_core):
+    complex_quiver.max_number_arrows = max_number_arrows
+    reference = Graph(complex_quiver).to_plotly().data[0]
+    complex_quiver.use_webgl = True
+    fig = Graph(complex_quiver).to_plotly()
+    assert len(fig.data) == 1
+    assert fig.data[0].type == "scattergl"
+    assert fig.data[0].mode == "lines"
+    assert fig.data[0].name == "quiver plot"
+    assert fig.data[0].line.color == _config.VASP_COLORS["dark"]
+    # the reference draws all lines first and then all arrow heads
+    data_size = len(reference.x) // 7
+    for actual, expected in zip(
+        (fig.data[0].x, fig.data[0].y), (reference.x, reference.y)
+    ):
+        expected = np.array(expected, dtype=np.float64)
+        lines = expected[: 3 * data_size].reshape(-1, 3)
+        heads = expected[3 * data_size :].reshape(-1, 4)
+        Assert.allclose(np.reshape(actual, (-1, 7)), np.hstack((lines, heads)))
+
+
+@pytest.mark.parametrize(
+    "number_arrows, expected",
+    ((10, [1, 1]), (11, [2, 1]), (40, [2, 2]), (41, [3, 2]), (61, [3, 3])),
+)
+def test_limit_number_of_arrows(simple_quiver, number_arrows, expected):
+    simple_quiver.max_number_arrows = 10
+    assert simple_quiver._limit_number_of_arrows(2 * number_arrows) == expected
+
+
 def test_width_and_height(parabola, not_core):
     fig = Graph(parabola).to_plotly()
     assert fig.layout.width == 720
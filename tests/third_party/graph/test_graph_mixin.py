@@ -51,6 +51,25 @@ def test_convert_graph_to_csv():
     df.to_csv.assert_called_once_with(full_path, index=False)
 
 
+@pytest.mark.parametrize("format", ("parquet", "feather", "hdf"))
+def test_convert_graph_to_binary_format(format):
+    example = ExampleGraph()
+    getattr(example, f"to_{format}")()
+    extension = "h5" if format == "hdf" else format
+    full_path = example._path / f"example_graph.{extension}"
+    getattr(GRAPH, f"to_{format}").assert_called_once_with(full_path, compression=None)
+
+
+@pytest.mark.parametrize("format", ("parquet", "feather", "hdf"))
+def test_convert_graph_to_binary_format_with_filename(format):
+    example = ExampleGraph()
+    full_path = example._path.absolute() / "example.dat"
+    getattr(example, f"to_{format}")(filename=full_path, compression="zstd")
+    getattr(GRAPH, f"to_{format}").assert_called_once_with(
+        full_path, compression="zstd"
+    )
+
+
 def test_converting_graph_to_image():
     example = ExampleGraph()
     example.to_image()
@@ -11,7 +11,7 @@ import numpy as np
 import pytest
 
 from py4vasp import exception
-from py4vasp._third_party.view import View
+from py4vasp._third_party.view import View, replicate
 from py4vasp._third_party.view.view import GridQuantity, IonArrow, Isosurface
 from py4vasp._util import convert, import_
 
@@ -335,6 +335,28 @@ def test_supercell(is_structure, not_core):
         assert np.allclose(expected_coordinates, output_coordinates)
 
 
+def test_replicate_matches_ase(not_core):
+    positions = np.random.random((7, 3))
+    lattice_vectors = np.eye(3) + 0.1 * np.random.random((3, 3))
+    supercell = np.array((2, 3, 1))
+    atoms = ase.Atoms(cell=lattice_vectors, scaled_positions=positions, pbc=True)
+    expected = atoms.repeat(supercell).get_positions()
+    actual, indices = replicate(positions, supercell)
+    assert np.allclose(actual @ lattice_vectors, expected)
+    assert np.array_equal(indices, np.tile(np.arange(7), 6))
+
+
+def test_replicate_ion_major(Assert):
+    positions = np.random.random((4, 5, 3))
+    supercell = (1, 2, 3)
+    cell_major, cell_indices = replicate(positions, supercell)
+    actual, indices = replicate(positions, supercell, ion_major=True)
+    order = np.argsort(cell_indices, kind="stable")
+    assert actual.shape == (4, 30, 3)
+    Assert.allclose(actual, cell_major[:, order])
+    assert np.array_equal(indices, cell_indices[order])
+
+
 @pytest.mark.parametrize("is_structure", [True, False])
 def test_showcell(is_structure, not_core):
     inputs = base_input_view(is_structure)
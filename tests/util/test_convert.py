@@ -1,9 +1,17 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+from pathlib import Path
+
 import numpy as np
 
 from py4vasp._config import VASP_COLORS
-from py4vasp._util.convert import text_to_string, to_camelcase, to_complex, to_rgb
+from py4vasp._util.convert import (
+    text_to_string,
+    to_camelcase,
+    to_complex,
+    to_rgb,
+    to_writeout_path,
+)
 
 
 def test_text_to_string():
@@ -57,3 +65,10 @@ def test_camelcase():
     assert to_camelcase("_foo") == "Foo"
     assert to_camelcase("_foo_bar") == "FooBar"
     assert to_camelcase("foo_bar", uppercase_first_letter=False) == "fooBar"
+
+
+def test_writeout_path():
+    directory = Path("calculation")
+    assert to_writeout_path(directory, "file.txt") == directory / "file.txt"
+    absolute_path = Path("/absolute/file.txt")
+    assert to_writeout_path(directory, absolute_path) == absolute_path
@@ -1,5 +1,7 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
+import sys
+
 import pytest
 
 from py4vasp import exception
@@ -16,3 +18,35 @@ def test_import_not_available():
 def test_import_for_existing_module():
     module = import_.optional("py4vasp")
     assert import_.is_imported(module)
+
+
+@pytest.fixture
+def lazy_package(tmp_path, monkeypatch):
+    name = "_py4vasp_lazy_example_"
+    (tmp_path / f"{name}.py").write_text("value = 42\n")
+    monkeypatch.syspath_prepend(tmp_path)
+    yield name
+    sys.modules.pop(name, None)
+
+
+def test_import_is_deferred(lazy_package):
+    module = import_.optional(lazy_package)
+    assert lazy_package not in sys.modules
+    assert module.value == 42
+    assert lazy_package in sys.modules
+
+
+def test_hook_runs_once_on_import(lazy_package):
+    calls = []
+    import_.on_import(lazy_package, lambda: calls.append("hook"))
+    module = import_.optional(lazy_package)
+    assert calls == []
+    module.value
+    module.value
+    assert calls == ["hook"]
+
+
+def test_hook_runs_immediately_if_already_imported():
+    calls = []
+    import_.on_import("py4vasp", lambda: calls.append("hook"))
+    assert calls == ["hook"]
@@ -1,6 +1,7 @@
 # Copyright © VASP Software GmbH,
 # Licensed under the Apache License 2.0 (http://www.apache.org/licenses/LICENSE-2.0)
 import itertools
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -415,6 +416,41 @@ def test_error_when_slice_has_step(range_):
         selector[(group,)]
 
 
+def test_reuse_compiled_plan(Assert):
+    values = np.cos(np.arange(60)).reshape(3, 4, 5)
+    map_ = {1: {"A": slice(0, 2), "B": slice(2, 4)}, 2: {"x": 0, "y": slice(1, 5)}}
+    selection, *_ = select.Tree.from_selection("A(y) + B(y) - x").selections()
+    index._plan_cache.clear()
+    first = index.Selector(map_, values)
+    expected = first._reduce_slices(selection)
+    Assert.allclose(first[selection], expected)
+    assert len(index._plan_cache) == 1
+    second = index.Selector({**map_}, values)
+    with patch.object(index.Selector, "_get_all_slices") as get_all_slices:
+        Assert.allclose(second[selection], expected)
+    get_all_slices.assert_not_called()
+    assert len(index._plan_cache) == 1
+
+
+def test_merge_adjacent_ranges(Assert):
+    values = np.sqrt(np.arange(24)).reshape(2, 12)
+    map_ = {1: {"A": slice(0, 3), "B": slice(3, 7), "C": slice(8, 12)}}
+    selector = index.Selector(map_, values)
+    selection, *_ = select.Tree.from_selection("A + B + C").selections()
+    plan = selector._get_plan(selection)
+    assert len(plan.terms) == 2
+    expected = np.sum(values[:, :7], axis=1) + np.sum(values[:, 8:], axis=1)
+    Assert.allclose(selector[selection], expected)
+
+
+def test_no_plan_for_custom_reduction():
+    map_ = {0: {"A": slice(0, 2)}}
+    index._plan_cache.clear()
+    selector = index.Selector(map_, np.arange(5), reduction=np.average)
+    assert selector[("A",)] == 0.5
+    assert len(index._plan_cache) == 0
+
+
 def test_error_when_two_selections_for_the_same_dimension():
     map_ = {0: {"A": 1, "B": 2}}
     with pytest.raises(exception.IncorrectUsage):
@@ -99,6 +99,15 @@ def test_raise_error_for_unknown_choices():
         slicing.plane(np.eye(3), "a", normal="unknown")
 
 
+@pytest.mark.parametrize(
+    "length, fraction, index", ((10, 0.3, 3), (10, -0.4, 6), (12, 1.2, 2), (1, 0.7, 0))
+)
+def test_grid_index(length, fraction, index):
+    actual = slicing.grid_index(length, fraction)
+    assert actual == index
+    assert isinstance(actual, int)
+
+
 @pytest.mark.parametrize("cut", ("a", "b", "c"))
 @pytest.mark.parametrize("fraction", (-0.4, 0, 0.4, 0.8, 1.2))
 def test_slice_grid_scalar(cut, fraction, Assert):
@@ -180,3 +189,90 @@ def test_slice_grid_vector_nontrivial_cell(cut, index, Assert):
         ).T
     actual_data = slicing.grid_vector(grid_vector, plane, fraction)
     Assert.allclose(actual_data, expected_data)
+
+
+def band_limited_function(a, b, c):
+    # all frequencies are below the Nyquist frequency of a 10 x 12 x 14 grid
+    return (
+        1
+        + np.cos(2 * np.pi * (a + 2 * b))
+        + 0.5 * np.sin(2 * np.pi * (3 * c - b))
+        + 0.2 * np.cos(2 * np.pi * (4 * a - 5 * b + 6 * c))
+    )
+
+
+def band_limited_grid():
+    fractions = [np.arange(length) / length for length in (10, 12, 14)]
+    return band_limited_function(*np.meshgrid(*fractions, indexing="ij"))
+
+
+@pytest.mark.parametrize("length", (7, 8))
+def test_fourier_weights_on_grid(length, Assert):
+    fractions = np.arange(-length, 2 * length) / length
+    expected = np.tile(np.eye(length), (3, 1))
+    Assert.allclose(slicing.fourier_weights(length, fractions), expected)
+
+
+@pytest.mark.parametrize("cut", ("a", "b", "c"))
+@pytest.mark.parametrize("fraction", (-0.37, 0.4, 0.55, 1.2))
+def test_fourier_plane(cut, fraction, Assert):
+    plane = slicing.Plane(vectors=None, cut=cut)
+    shape = (9, 16)
+    in_plane = np.meshgrid(*(np.arange(points) / points for points in shape))
+    arguments = [in_plane[0].T, in_plane[1].T]
+    arguments.insert(slicing.INDICES[cut], fraction)
+    expected = band_limited_function(*arguments)
+    actual = slicing.fourier_plane(band_limited_grid(), plane, fraction, shape)
+    Assert.allclose(actual, expected, tolerance=100)
+
+
+@pytest.mark.parametrize("cut", ("a", "b", "c"))
+def test_fourier_plane_on_grid(cut, Assert):
+    grid_vector = np.random.random((3, 10, 12, 14))
+    plane = slicing.Plane(vectors=None, cut=cut)
+    index = slicing.INDICES[cut]
+    fraction = 3 / grid_vector.shape[index + 1]
+    expected = np.take(grid_vector, 3, axis=index + 1)
+    actual = slicing.fourier_plane(grid_vector, plane, fraction)
+    Assert.allclose(actual, expected, tolerance=10)
+
+
+def test_fourier_line(Assert):
+    start = np.array([0.1, -0.3, 0.7])
+    end = np.array([1.3, 0.4, 0.2])
+    positions = np.linspace(start, end, 25)
+    expected = band_limited_function(*positions.T)
+    actual = slicing.fourier_line(band_limited_grid(), start, end, 25)
+    Assert.allclose(actual, expected, tolerance=100)
+
+
+def test_fourier_interpolate_keeps_leading_dimensions(Assert):
+    data = np.random.random((2, 5, 6, 7))
+    positions = np.random.random((4, 3, 3))
+    actual = slicing.fourier_interpolate(data, positions)
+    assert actual.shape == (2, 4, 3)
+    on_grid = np.array([[2 / 5, 1 / 6, 4 / 7]])
+    Assert.allclose(slicing.fourier_interpolate(data, on_grid)[:, 0], data[:, 2, 1, 4])
+
+
+@pytest.mark.parametrize(
+    "steps",
+    (
+        [[0.013, 0.02], [0.03, 0.0]],
+        [[0.0, 0.02], [0.03, 0.01]],
+        [[0.01, 0.0], [0.03, 0.01]],
+        [[0.02, 0.01], [0.0, 0.01]],
+        [[0.02, 0.01], [0.03, 0.015]],
+    ),
+)
+def test_fourier_mesh(steps, Assert):
+    # take a 2d slice with a frequency at the Nyquist limit of the first axis
+    data = band_limited_grid()[:, :, 0] + np.cos(np.pi * np.arange(10))[:, np.newaxis]
+    origin = np.array([0.1, 0.37])
+    shape = (9, 11)
+    rows, columns = np.meshgrid(*(np.arange(points) for points in shape), indexing="ij")
+    positions = origin + np.multiply.outer(rows, steps[0])
+    positions += np.multiply.outer(columns, steps[1])
+    expected = slicing.fourier_interpolate(data, positions)
+    actual = slicing.fourier_mesh(data, origin, steps, shape)
+    Assert.allclose(actual, expected, tolerance=100)